@@ -1,20 +1,21 @@
 import streamlit as st
 import base64
+import hashlib
+import html
+import os
+import re
+import shutil
+import tempfile
+import time
 from pathlib import Path
 
 #Import your encryption functions from the toolkit
 try:
-    from ciphers import (
-        caesar_encrypt, caesar_decrypt,
-        vigenere_encrypt, vigenere_decrypt,
-        reverse_text,
-        ascii_shift, ascii_unshift,
-        base64_encode, base64_decode,
-        generate_sha256 # Added SHA-256
-    )
-    from multilayer import multi_encrypt, multi_decrypt
+    #The registry imports each cipher module the first time it is used
+    import registry
+    from lru import LRUCache
 except ImportError:
-    st.error("Logic files (ciphers.py or multilayer.py) not found! Please ensure they are in the same directory.")
+    st.error("Logic files (registry.py or lru.py) not found! Please ensure they are in the same directory.")
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(
@@ -24,213 +25,341 @@ st.set_page_config(
 )
 
 
-#LOAD AND ENCODE STATIC FILES
-def load_css_with_assets():
-    #Load CSS and embed static assets as base64
-    #Read the font file and encode to base64
+#STATIC ASSETS
+#The font and background are served by Streamlit's static file server
+#(.streamlit/config.toml sets server.enableStaticServing) and referenced by URL
+#instead of being inlined into every page. URLs carry a content hash, so the
+#browser caches them until the file changes. The stylesheet itself is built and
+#minified once per process per asset version; a rerun only stats the files.
+STATIC_DIR = Path(__file__).parent / "static"
+FONT_FILE = "pixel-font.ttf"
+BACKGROUND_FILE = "bg.png"
+
+_CSS_TEMPLATE = """
+@font-face {{
+    font-family: 'PixelFont';
+    src: url({font_url}) format('truetype');
+}}
+
+/* REMOVE STREAMLIT TOP BAR */
+header {{
+    visibility: hidden;
+    height: 0px;
+}}
+
+/* BACKGROUND IMAGE */
+[data-testid="stApp"] {{
+    background: url({bg_url}) no-repeat center center fixed;
+    background-size: cover;
+}}
+
+/* TRANSLUCENT MAIN CARD */
+.block-container {{
+    background: rgba(230, 215, 255, 0.25) !important;
+    backdrop-filter: blur(15px) saturate(180%);
+    -webkit-backdrop-filter: blur(15px) saturate(180%);
+    border-radius: 28px;
+    max-width: 720px;
+    margin: 6vh auto;
+    padding: 3rem 3.2rem;
+    box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
+    border: 1px solid rgba(255, 255, 255, 0.18);
+}}
+
+/* TITLE */
+.novacrypt-title {{
+    font-family: 'PixelFont', monospace !important;
+    font-size: 56px !important;
+    text-align: center;
+    color: #6a1bb1;
+    margin-bottom: 0.3rem;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
+}}
+
+/* SUBTITLE */
+.subtitle {{
+    text-align: center;
+    font-size: 20px !important;
+    font-weight: 600 !important;
+    color: #4a0e78 !important;
+    margin-bottom: 2.5rem;
+    letter-spacing: 0.5px;
+}}
+
+/* LARGER FIELD LABELS */
+.stTextArea label, .stSelectbox label, .stNumberInput label, .stTextInput label, label p {{
+    font-size: 20px !important;
+    font-weight: 700 !important;
+    color: #4a0e78 !important;
+    margin-bottom: 10px !important;
+}}
+
+/* PURPLE RESULT HEADER */
+h3 {{
+    color: #6a1bb1 !important;
+    font-size: 30px !important;
+    font-weight: 800 !important;
+    margin-top: 2rem !important;
+}}
+
+/* BUTTONS */
+.stButton > button {{
+    background: linear-gradient(135deg, #7a2cbf, #9b4dff);
+    color: white;
+    border-radius: 12px;
+    padding: 0.6rem 1.6rem;
+    font-size: 15px;
+    font-weight: 600;
+    border: none;
+    transition: all 0.3s ease;
+}}
+
+.stButton > button:hover {{
+    transform: scale(1.05);
+    box-shadow: 0 8px 20px rgba(122, 44, 191, 0.4);
+    color: white;
+    border: none;
+}}
+
+/* RESULT BOX STYLING - TRANSLUCENT */
+.result-box {{
+    background: rgba(255, 255, 255, 0.3);
+    backdrop-filter: blur(5px);
+    border: 2px solid #9b4dff;
+    border-radius: 12px;
+    padding: 1.2rem;
+    min-height: 150px;
+    font-family: monospace;
+    font-size: 16px;
+    color: #1a1a1a;
+    word-wrap: break-word;
+    white-space: pre-wrap;
+    margin-top: 0.5rem;
+}}
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _content_hash(name: str, mtime_ns: int, size: int) -> str:
+    #SHA-256 prefix of a static file; recomputed only when its mtime or size changes
+    return hashlib.sha256((STATIC_DIR / name).read_bytes()).hexdigest()[:16]
+
+
+def asset_version(name: str):
+    #Content hash of static/<name>, or None if the file is missing
     try:
-        with open("static/pixel-font.ttf", "rb") as font_file:
-            font_data = base64.b64encode(font_file.read()).decode()
+        stat = (STATIC_DIR / name).stat()
     except FileNotFoundError:
-        font_data = ""
-        st.warning("⚠️pixel-font.ttf not found in static/ folder")
+        return None
+    return _content_hash(name, stat.st_mtime_ns, stat.st_size)
 
-    #Read the background image and encode to base64
-    try:
-        with open("static/bg.png", "rb") as bg_file:
-            bg_data = base64.b64encode(bg_file.read()).decode()
-    except FileNotFoundError:
-        bg_data = ""
-        st.warning("⚠️bg.png not found in static/ folder")
-
-    #Inject CSS with embedded assets
-    css = f"""
-    <style>
-    @font-face {{
-        font-family: 'PixelFont';
-        src: url(data:font/truetype;charset=utf-8;base64,{font_data}) format('truetype');
-    }}
-
-    /* REMOVE STREAMLIT TOP BAR */
-    header {{
-        visibility: hidden;
-        height: 0px;
-    }}
-
-    /* BACKGROUND IMAGE */
-    [data-testid="stApp"] {{
-        background: url(data:image/png;base64,{bg_data}) no-repeat center center fixed;
-        background-size: cover;
-    }}
-
-    /* TRANSLUCENT MAIN CARD */
-    .block-container {{
-        background: rgba(230, 215, 255, 0.25) !important;
-        backdrop-filter: blur(15px) saturate(180%);
-        -webkit-backdrop-filter: blur(15px) saturate(180%);
-        border-radius: 28px;
-        max-width: 720px;
-        margin: 6vh auto;
-        padding: 3rem 3.2rem;
-        box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
-        border: 1px solid rgba(255, 255, 255, 0.18);
-    }}
-
-    /* TITLE */
-    .novacrypt-title {{
-        font-family: 'PixelFont', monospace !important;
-        font-size: 56px !important;
-        text-align: center;
-        color: #6a1bb1;
-        margin-bottom: 0.3rem;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-    }}
-
-    /* SUBTITLE */
-    .subtitle {{
-        text-align: center;
-        font-size: 20px !important;
-        font-weight: 600 !important;
-        color: #4a0e78 !important;
-        margin-bottom: 2.5rem;
-        letter-spacing: 0.5px;
-    }}
-
-    /* LARGER FIELD LABELS */
-    .stTextArea label, .stSelectbox label, .stNumberInput label, .stTextInput label, label p {{
-        font-size: 20px !important;
-        font-weight: 700 !important;
-        color: #4a0e78 !important;
-        margin-bottom: 10px !important;
-    }}
-
-    /* PURPLE RESULT HEADER */
-    h3 {{
-        color: #6a1bb1 !important;
-        font-size: 30px !important;
-        font-weight: 800 !important;
-        margin-top: 2rem !important;
-    }}
-
-    /* BUTTONS */
-    .stButton > button {{
-        background: linear-gradient(135deg, #7a2cbf, #9b4dff);
-        color: white;
-        border-radius: 12px;
-        padding: 0.6rem 1.6rem;
-        font-size: 15px;
-        font-weight: 600;
-        border: none;
-        transition: all 0.3s ease;
-    }}
-
-    .stButton > button:hover {{
-        transform: scale(1.05);
-        box-shadow: 0 8px 20px rgba(122, 44, 191, 0.4);
-        color: white;
-        border: none;
-    }}
-
-    /* RESULT BOX STYLING - TRANSLUCENT */
-    .result-box {{
-        background: rgba(255, 255, 255, 0.3);
-        backdrop-filter: blur(5px);
-        border: 2px solid #9b4dff;
-        border-radius: 12px;
-        padding: 1.2rem;
-        min-height: 150px;
-        font-family: monospace;
-        font-size: 16px;
-        color: #1a1a1a;
-        word-wrap: break-word;
-        white-space: pre-wrap;
-        margin-top: 0.5rem;
-    }}
-    </style>
-    """
-    st.markdown(css, unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def _data_uri(name: str, version: str, mime: str) -> str:
+    #Inline fallback when static serving is disabled; encoded once per file version
+    data = base64.b64encode((STATIC_DIR / name).read_bytes()).decode()
+    return f"data:{mime};base64,{data}"
+
+
+def static_root():
+    #Absolute URL path of Streamlit's static file server (under server.baseUrlPath),
+    #or None when static serving is disabled
+    if not st.get_option("server.enableStaticServing"):
+        return None
+    base = (st.get_option("server.baseUrlPath") or "").strip("/")
+    return f"/{base}/app/static" if base else "/app/static"
+
+
+def _asset_url(name: str, version, mime: str, root) -> str:
+    if version is None:
+        return ""
+    if root:
+        return f"{root}/{name}?v={version}"
+    return _data_uri(name, version, mime)
+
+
+@st.cache_resource(show_spinner=False)
+def build_css(font_version, bg_version, root) -> str:
+    #Minified <style> block for the given asset versions; root is static_root()
+    css = _CSS_TEMPLATE.format(
+        font_url=_asset_url(FONT_FILE, font_version, "font/ttf", root),
+        bg_url=_asset_url(BACKGROUND_FILE, bg_version, "image/png", root),
+    )
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)  #Comments
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return f"<style>{css.strip()}</style>"
+
+
+def load_css_with_assets():
+    #Inject the cached stylesheet; static assets are fetched (and cached) by the browser
+    font_version = asset_version(FONT_FILE)
+    if font_version is None:
+        st.warning(f"⚠️{FONT_FILE} not found in static/ folder")
+
+    bg_version = asset_version(BACKGROUND_FILE)
+    if bg_version is None:
+        st.warning(f"⚠️{BACKGROUND_FILE} not found in static/ folder")
+
+    st.markdown(build_css(font_version, bg_version, static_root()), unsafe_allow_html=True)
 
 
 #Load the custom translucent UI
 load_css_with_assets()
 
-#Initialize session state for result
+#Initialize session state for result and the multi-layer step previews
 if 'result' not in st.session_state:
     st.session_state['result'] = ""
+if 'steps' not in st.session_state:
+    st.session_state['steps'] = []
+if 'jobs' not in st.session_state:
+    st.session_state['jobs'] = []
+
+
+#Characters kept per intermediate multi-layer step
+PREVIEW_CHARS = 200
+
+
+def run_multi_layer(steps):
+    #Runs a multi-layer step generator, keeping only a short preview of each intermediate
+    previews = []
+    result = ""
+    for step in steps:
+        result = step.output.text
+        previews.append((step.step, step.label, step.output.preview(PREVIEW_CHARS), len(step.output)))
+    return result, previews
+
+
+#OPERATIONS
+#Every cipher runs through registry.Cipher and returns (result, step previews);
+#only ciphers with the "steps" capability (Multi-Layer) have steps.
+
+def apply_cipher(cipher, direction: str, text: str, params: tuple):
+    if cipher.supports("steps"):
+        return run_multi_layer(cipher.steps(direction)(text, *params))
+    return cipher.function(direction)(text, *params), []
+
+
+#RESULT CACHE
+#Results are memoized per process on (method, direction, parameters, SHA-256 of
+#the input) and evicted least-recently-used once they exceed a total size.
+RESULT_CACHE_ENTRIES = 64
+RESULT_CACHE_CHARS = 64 * 1024 * 1024
+
+#Results longer than this are previewed and offered as a download instead of inlined
+RESULT_PREVIEW_CHARS = 10_000
+
+
+@st.cache_resource(show_spinner=False)
+def result_cache() -> LRUCache:
+    return LRUCache(RESULT_CACHE_ENTRIES, maxweight=RESULT_CACHE_CHARS, weigh=lambda entry: len(entry[0]))
+
+
+def run_operation(cipher, direction: str, text: str, params: tuple):
+    #Returns (result, step previews), computing it only on a cache miss
+    digest = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+    return result_cache().get_or_create(
+        (cipher.name, direction, params, digest), lambda: apply_cipher(cipher, direction, text, params)
+    )
+
+
+#FILE JOBS
+#Uploaded files are processed by jobs.FileJob on a background thread. Jobs live
+#in session state, so they keep running across reruns; while any is running the
+#page polls their progress twice a second. jobs.py (and the streaming engine
+#behind it) is imported on the first upload, not at startup.
+JOB_POLL_SECONDS = 0.5
+
+
+def submit_file_job(upload, cipher, direction: str, params: tuple):
+    #Spools the upload to disk and starts a background job on it
+    from jobs import start_file_job
+
+    handle, source_path = tempfile.mkstemp(prefix="novacrypt-upload-")
+    with os.fdopen(handle, "wb") as spool:
+        upload.seek(0)
+        shutil.copyfileobj(upload, spool, 1 << 20)
+
+    done = f"{direction}ed" if cipher.supports("decrypt") else "hashed"
+    job = start_file_job(cipher.name, direction, source_path, params,
+                         label=f"{upload.name} - {cipher.menu_label('web')} ({direction})")
+    job.download_name = f"{Path(upload.name).stem}_{done}.txt"
+    st.session_state['jobs'].append(job)
+
+
+def remove_file_job(job):
+    #Stops the job and deletes its spooled input and output
+    job.discard()
+    try:
+        os.remove(job.source_path)
+    except OSError:
+        pass
+    st.session_state['jobs'].remove(job)
+
 
 #TITLE
 st.markdown('<div class="novacrypt-title">NovaCrypt</div>', unsafe_allow_html=True)
 st.markdown('<div class="subtitle">Multi-Layer Text Encryption Lab</div>', unsafe_allow_html=True)
 
 #UI INPUTS
-text = st.text_area("📝Enter the Text", height=150, key="input_text")
-
-method = st.selectbox(
-    "🔐Select Encryption Method",
-    [
-        "Caesar Cipher",
-        "Reverse Cipher",
-        "ASCII Shift",
-        "Vigenère Cipher",
-        "Base64 Encoding",
-        "Multi-Layer Encryption",
-        "SHA-256 Hashing"
-    ]
-)
+input_mode = st.radio("📂Input", ["Text", "File"], horizontal=True)
+
+text = ""
+upload = None
+if input_mode == "Text":
+    text = st.text_area("📝Enter the Text", height=150, key="input_text")
+else:
+    upload = st.file_uploader("📄Upload a UTF-8 Text File")
+
+method = st.selectbox("🔐Select Encryption Method", registry.labels("web"))
+cipher = registry.by_label(method, "web")
 
-#Parameter logic for different methods
-shift = ascii_val = None
-key = ""
+#Parameter widgets come from the cipher's registry parameters
+PARAM_ICONS = {"key": "🔑", "caesar_key": "🔑", "shift": "🔢", "ascii_key": "🔢", "keyword": "🔤", "vig_key": "🔤"}
 
-if method == "Caesar Cipher":
-    shift = st.number_input("🔑Shift Key", 1, 50, 3)
 
-elif method == "ASCII Shift":
-    ascii_val = st.number_input("🔢ASCII Shift Value", 1, 50, 5)
+def param_input(param):
+    label = PARAM_ICONS.get(param.name, "") + param.label
+    if param.type is int:
+        return st.number_input(label, 1, 50, param.default)
+    return st.text_input(label, value=param.default)
 
-elif method == "Vigenère Cipher":
-    key = st.text_input("🔤Keyword")
 
-elif method == "Multi-Layer Encryption":
+values = {}
+if len(cipher.params) > 1:
+    #Numbers on the left, keywords on the right
     col_m1, col_m2 = st.columns(2)
-    with col_m1:
-        shift = st.number_input("🔑Caesar Shift", 1, 50, 3)
-        ascii_val = st.number_input("🔢ASCII Shift", 1, 50, 5)
-    with col_m2:
-        key = st.text_input("🔤Vigenère Keyword", value="KEY")
+    for param in cipher.params:
+        with col_m1 if param.type is int else col_m2:
+            values[param.name] = param_input(param)
+else:
+    for param in cipher.params:
+        values[param.name] = param_input(param)
 
 st.write("---")  #Visual separator
 
 #ACTION BUTTONS
 col1, col2 = st.columns(2)
+params = tuple(values[param.name] for param in cipher.params)
+missing_keyword = any(param.type is str and not values[param.name] for param in cipher.params)
 
 with col1:
     if st.button("🔒Encrypt / Hash", use_container_width=True):
-        if not text:
+        st.session_state['steps'] = []
+        if input_mode == "File":
+            if upload is None:
+                st.warning("⚠ Upload a file first.")
+            elif missing_keyword:
+                st.error("Please enter a keyword!")
+            else:
+                submit_file_job(upload, cipher, "encrypt", params)
+        elif not text:
             st.warning("⚠ Enter some text first.")
+        elif missing_keyword:
+            st.error("Please enter a keyword!")
         else:
             try:
-                if method == "Caesar Cipher":
-                    st.session_state['result'] = caesar_encrypt(text, shift)
-                elif method == "Reverse Cipher":
-                    st.session_state['result'] = reverse_text(text)
-                elif method == "ASCII Shift":
-                    st.session_state['result'] = ascii_shift(text, ascii_val)
-                elif method == "Vigenère Cipher":
-                    if not key:
-                        st.error("Please enter a keyword!")
-                    else:
-                        st.session_state['result'] = vigenere_encrypt(text, key)
-                elif method == "Base64 Encoding":
-                    st.session_state['result'] = base64_encode(text)
-                elif method == "Multi-Layer Encryption":
-                    if not key:
-                        st.error("Please enter a keyword!")
-                    else:
-                        st.session_state['result'] = multi_encrypt(text, shift, key, ascii_val, verbose=False)
-                elif method == "SHA-256 Hashing":
-                    st.session_state['result'] = generate_sha256(text)
-
+                st.session_state['result'], st.session_state['steps'] = run_operation(cipher, "encrypt", text, params)
                 if st.session_state['result']:
                     st.success("✅Encryption successful!")
             except Exception as e:
@@ -238,48 +367,96 @@ with col1:
 
 with col2:
     if st.button("🔓Decrypt", use_container_width=True):
-        if not text:
+        st.session_state['steps'] = []
+        if not cipher.supports("decrypt"):
+            st.error(f"{method} is a one-way hash and cannot be decrypted!")
+            st.session_state['result'] = ""
+        elif input_mode == "File":
+            if upload is None:
+                st.warning("⚠ Upload a file to decrypt.")
+            elif missing_keyword:
+                st.error("Please enter a keyword!")
+            else:
+                submit_file_job(upload, cipher, "decrypt", params)
+        elif not text:
             st.warning("⚠ Enter text to decrypt.")
+        elif missing_keyword:
+            st.error("Please enter a keyword!")
         else:
             try:
-                if method == "Caesar Cipher":
-                    st.session_state['result'] = caesar_decrypt(text, shift)
-                elif method == "Reverse Cipher":
-                    st.session_state['result'] = reverse_text(text)
-                elif method == "ASCII Shift":
-                    st.session_state['result'] = ascii_unshift(text, ascii_val)
-                elif method == "Vigenère Cipher":
-                    if not key:
-                        st.error("Please enter a keyword!")
-                    else:
-                        st.session_state['result'] = vigenere_decrypt(text, key)
-                elif method == "Base64 Encoding":
-                    st.session_state['result'] = base64_decode(text)
-                elif method == "Multi-Layer Encryption":
-                    if not key:
-                        st.error("Please enter a keyword!")
-                    else:
-                        st.session_state['result'] = multi_decrypt(text, shift, key, ascii_val, verbose=False)
-                elif method == "SHA-256 Hashing":
-                    st.error("SHA-256 is a one-way hash and cannot be decrypted!")
-                    st.session_state['result'] = ""
-
-                if st.session_state['result'] and method != "SHA-256 Hashing":
+                st.session_state['result'], st.session_state['steps'] = run_operation(cipher, "decrypt", text, params)
+                if st.session_state['result']:
                     st.success("✅Decryption successful!")
             except Exception as e:
                 st.error(f"Decryption error: {str(e)}")
 
-#RESULT DISPLAY
-st.markdown("### ✨Result")
+#FILE JOB PROGRESS
+if st.session_state['jobs']:
+    from jobs import RUNNING, DONE, FAILED, CANCELLED
+
+    st.markdown("### 📂File Jobs")
 
-if st.session_state['result']:
-    st.markdown(
-        f'<div class="result-box">{st.session_state["result"]}</div>',
-        unsafe_allow_html=True
+for job in list(st.session_state['jobs']):
+    progress = job.progress()
+    st.progress(
+        progress.fraction,
+        text=f"{job.label} - {progress.status}: {progress.bytes_read / 1e6:,.1f} MB read, "
+             f"{progress.throughput / 1e6:,.1f} MB/s, {progress.elapsed:,.1f} s"
     )
-    st.info("💡Highlight the text above to copy it.")
-else:
-    st.markdown(
-        '<div class="result-box" style="color: #666;">Waiting for input...</div>',
-        unsafe_allow_html=True
-    )
\ No newline at end of file
+    col_job1, col_job2 = st.columns(2)
+    if progress.status == RUNNING:
+        col_job1.button("✖Cancel", key=f"cancel-{job.id}", on_click=job.cancel, use_container_width=True)
+    else:
+        if progress.status == DONE:
+            with open(job.output_path, "rb") as output:
+                col_job1.download_button(
+                    "⬇️Download", data=output, file_name=job.download_name, mime="text/plain",
+                    key=f"download-{job.id}", use_container_width=True
+                )
+        elif progress.status == FAILED:
+            st.error(f"Error: {progress.error}")
+        elif progress.status == CANCELLED:
+            st.warning("⚠ Job cancelled.")
+        col_job2.button("🗑Remove", key=f"remove-{job.id}", on_click=remove_file_job, args=(job,),
+                        use_container_width=True)
+
+#RESULT DISPLAY
+if input_mode == "Text":
+    st.markdown("### ✨Result")
+
+    if st.session_state['result']:
+        result = st.session_state['result']
+        if len(result) <= RESULT_PREVIEW_CHARS:
+            st.markdown(f'<div class="result-box">{html.escape(result)}</div>', unsafe_allow_html=True)
+            st.info("💡Highlight the text above to copy it.")
+        else:
+            #Only a preview goes into the page; the full result is served as a file
+            st.markdown(
+                f'<div class="result-box">{html.escape(result[:RESULT_PREVIEW_CHARS])}...</div>',
+                unsafe_allow_html=True
+            )
+            st.info(f"💡Showing the first {RESULT_PREVIEW_CHARS:,} of {len(result):,} characters.")
+            st.download_button(
+                "⬇️Download Full Result",
+                data=result.encode("utf-8", "surrogatepass"),
+                file_name="novacrypt_result.txt",
+                mime="text/plain",
+                use_container_width=True
+            )
+
+        #Intermediate layers of the last multi-layer run (previews only)
+        if st.session_state['steps']:
+            with st.expander("🔍Intermediate Steps"):
+                for number, label, preview, length in st.session_state['steps']:
+                    st.markdown(f"**Step {number} - {label}** ({length:,} characters)")
+                    st.code(preview, language=None)
+    else:
+        st.markdown(
+            '<div class="result-box" style="color: #666;">Waiting for input...</div>',
+            unsafe_allow_html=True
+        )
+
+#Keep polling while a file job is running
+if any(job.status == RUNNING for job in st.session_state['jobs']):
+    time.sleep(JOB_POLL_SECONDS)
+    st.rerun()
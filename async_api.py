@@ -0,0 +1,219 @@
+"""
+async_api.py - Asyncio API
+Awaitable versions of the ciphers in ciphers.py and multilayer.py for code
+that runs on an event loop:
+
+    text = await async_api.multi_encrypt(text, 3, "KEY", 5)
+    await async_api.stream_transform("multi", "encrypt", reader, writer, (3, "KEY", 5))
+
+Execution:-
+Inputs up to INLINE_LIMIT characters are computed right on the loop; the
+translate-based ciphers take microseconds there, less than a hop to another
+thread. Larger inputs go to an executor so the loop keeps serving other tasks
+while they run. The default is a shared process pool, created on first use
+(forkserver or spawn, so workers never hold the host's sockets):
+the cipher work is a few long C calls that hold the GIL, so in a thread they
+would still stall the loop for the length of each call. Pass executor=... per
+call or to configure() to use a thread pool (or any other) instead. As with
+any forkserver or spawn pool, a host script must start its loop under
+`if __name__ == "__main__":`.
+
+Streaming:-
+stream_transform pumps an asyncio.StreamReader into a StreamWriter through
+the chunked ciphers in streaming.py (see registry.Cipher.stream). The cipher
+runs on a worker thread that pulls chunks from the reader and pushes results
+to the writer through the loop, waiting for writer.drain() after every chunk:
+a slow consumer pauses the cipher and reading, and memory stays at a few
+chunks. Reverse and Multi-Layer spool the input to a temporary file first,
+like their synchronous streams.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import multiprocessing
+import os
+
+import ciphers
+import multilayer
+
+INLINE_LIMIT = 16 * 1024  #Characters computed on the loop instead of the executor
+STREAM_CHUNK_SIZE = 64 * 1024  #Bytes per stream chunk; bounds each hold of the GIL
+#The pool is created inside the host's running loop: forked workers would inherit
+#its sockets and keep client connections open after the host closes them
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+_executor = None  #Executor for large inputs; None means a shared process pool
+_default_pool = None
+
+
+def configure(executor=None, inline_limit: int = None):
+    #Sets the executor used for large inputs (None restores the shared process pool)
+    #and optionally the inline limit
+    global _executor, INLINE_LIMIT
+    _executor = executor
+    if inline_limit is not None:
+        INLINE_LIMIT = inline_limit
+
+
+def default_executor():
+    #The configured executor, or the shared process pool (created on first use)
+    global _default_pool
+    if _executor is not None:
+        return _executor
+    if _default_pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        _default_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                            mp_context=multiprocessing.get_context(START_METHOD))
+    return _default_pool
+
+
+def shutdown():
+    #Shuts the shared process pool down; it is recreated if needed again
+    global _default_pool
+    if _default_pool is not None:
+        _default_pool.shutdown()
+        _default_pool = None
+
+
+async def run(function, text: str, *params, executor=None):
+    #Awaits function(text, *params): inline when small, otherwise on the executor
+    if len(text) <= INLINE_LIMIT:
+        return function(text, *params)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or default_executor(), functools.partial(function, text, *params))
+
+
+#CIPHERS
+
+async def caesar_encrypt(text: str, key: int, executor=None) -> str:
+    return await run(ciphers.caesar_encrypt, text, key, executor=executor)
+
+
+async def caesar_decrypt(text: str, key: int, executor=None) -> str:
+    return await run(ciphers.caesar_decrypt, text, key, executor=executor)
+
+
+async def vigenere_encrypt(text: str, keyword: str, executor=None) -> str:
+    return await run(ciphers.vigenere_encrypt, text, keyword, executor=executor)
+
+
+async def vigenere_decrypt(text: str, keyword: str, executor=None) -> str:
+    return await run(ciphers.vigenere_decrypt, text, keyword, executor=executor)
+
+
+async def reverse_text(text: str, executor=None) -> str:
+    return await run(ciphers.reverse_text, text, executor=executor)
+
+
+async def ascii_shift(text: str, shift_val: int, executor=None) -> str:
+    return await run(ciphers.ascii_shift, text, shift_val, executor=executor)
+
+
+async def ascii_unshift(text: str, shift_val: int, executor=None) -> str:
+    return await run(ciphers.ascii_unshift, text, shift_val, executor=executor)
+
+
+async def base64_encode(text: str, executor=None) -> str:
+    return await run(ciphers.base64_encode, text, executor=executor)
+
+
+async def base64_decode(text: str, executor=None) -> str:
+    return await run(ciphers.base64_decode, text, executor=executor)
+
+
+async def generate_sha256(text: str, executor=None) -> str:
+    return await run(ciphers.generate_sha256, text, executor=executor)
+
+
+async def multi_encrypt(text: str, caesar_key: int, vig_key: str, ascii_key: int, executor=None) -> str:
+    #Same ciphertext as multilayer.multi_encrypt, via the compiled pipeline and without printing
+    return await run(multilayer.multi_encrypt_compiled, text, caesar_key, vig_key, ascii_key, executor=executor)
+
+
+async def multi_decrypt(text: str, caesar_key: int, vig_key: str, ascii_key: int, executor=None) -> str:
+    #Same plaintext as multilayer.multi_decrypt, via the compiled pipeline and without printing
+    return await run(multilayer.multi_decrypt_compiled, text, caesar_key, vig_key, ascii_key, executor=executor)
+
+
+#STREAMS
+
+class _Stopped(Exception):
+    pass
+
+
+class _LoopBridge:
+    #Blocking file-like view of a StreamReader / StreamWriter pair for a worker thread.
+    #Every call is scheduled on the loop and waited for, so the thread never runs ahead.
+
+    def __init__(self, loop, reader, writer):
+        self._loop = loop
+        self._reader = reader
+        self._writer = writer
+        self._pending = None
+        self._stopped = False
+
+    def _call(self, coroutine):
+        if self._stopped:
+            coroutine.close()
+            raise _Stopped()
+        self._pending = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return self._pending.result()
+        except concurrent.futures.CancelledError:
+            #stop() cancelled the pending call (a concurrent.futures, not asyncio, cancellation)
+            raise _Stopped()
+        finally:
+            self._pending = None
+
+    def read(self, size: int = -1) -> bytes:
+        return self._call(self._reader.read(size))
+
+    def seekable(self) -> bool:
+        return False
+
+    def write(self, data: bytes):
+        self._call(self._write(data))
+
+    async def _write(self, data: bytes):
+        self._writer.write(data)
+        await self._writer.drain()
+
+    def stop(self):
+        #Unblocks the worker thread; its next read or write raises _Stopped
+        self._stopped = True
+        pending = self._pending
+        if pending is not None:
+            pending.cancel()
+
+
+def _pump(factory, bridge: _LoopBridge, params: tuple, chunk_size: int) -> int:
+    #Worker thread: runs the chunk iterator over the reader and writes every chunk
+    written = 0
+    chunks = factory(bridge, *params, chunk_size=chunk_size)
+    try:
+        for chunk in chunks:
+            bridge.write(chunk)
+            written += len(chunk)
+    except _Stopped:
+        pass
+    finally:
+        chunks.close()
+    return written
+
+
+async def stream_transform(operation: str, direction: str, reader, writer, params: tuple = (),
+                           chunk_size: int = STREAM_CHUNK_SIZE, executor=None) -> int:
+    #Streams reader through a registered cipher into writer, with backpressure; returns bytes written.
+    #The writer is drained but not closed. The cipher runs on a thread of executor (default: the
+    #loop's default executor).
+    import registry
+
+    factory = registry.get(operation).stream(direction)
+    loop = asyncio.get_running_loop()
+    bridge = _LoopBridge(loop, reader, writer)
+    try:
+        return await loop.run_in_executor(executor, _pump, factory, bridge, tuple(params), chunk_size)
+    finally:
+        bridge.stop()
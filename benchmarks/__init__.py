@@ -0,0 +1,4 @@
+"""
+NovaCrypt benchmarks.
+Run from the project root with `python -m benchmarks.<name>`.
+"""
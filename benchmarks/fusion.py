@@ -0,0 +1,101 @@
+"""
+Multi-Layer Fusion Benchmark
+Compares the classic five-step multi-layer pipeline with the compiled (fused)
+and buffer (in-place bytearray) pipelines: wall time and peak traced memory.
+
+Usage:-
+    python -m benchmarks.fusion [--size-mb 8] [--repeat 3] [--ascii]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from multilayer import (
+    multi_encrypt, multi_decrypt,
+    multi_encrypt_compiled, multi_decrypt_compiled,
+    multi_encrypt_buffer, multi_decrypt_buffer
+)
+
+CAESAR_KEY = 3
+VIG_KEY = "KEY"
+ASCII_KEY = 5
+
+
+def make_text(size: int, seed: int = 42, ascii_only: bool = False) -> str:
+    #Builds a reproducible mostly-ASCII (or pure ASCII) payload of roughly `size` characters
+    rng = random.Random(seed)
+    words = ["novacrypt", "Layer", "cipher", "Vigenere" if ascii_only else "Vigenère", "shift", "42", "base64!", "text,"]
+    parts = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        parts.append(word)
+        length += len(word) + 1
+    return " ".join(parts)[:size]
+
+
+def measure(func, *args, repeat: int = 3):
+    #Returns (best wall time in seconds, peak traced memory in bytes, result)
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def run(size_mb: float, repeat: int, ascii_only: bool = False):
+    #Benchmarks encryption and decryption on both paths and prints a comparison table
+    text = make_text(int(size_mb * 1024 * 1024), ascii_only=ascii_only)
+    keys = (CAESAR_KEY, VIG_KEY, ASCII_KEY)
+    size = len(text.encode("utf-8"))
+
+    rows = []
+    t, peak, reference = measure(lambda s: multi_encrypt(s, *keys, verbose=False), text, repeat=repeat)
+    rows.append(("encrypt", "five-step", t, peak))
+    t, peak, compiled = measure(lambda s: multi_encrypt_compiled(s, *keys), text, repeat=repeat)
+    rows.append(("encrypt", "compiled", t, peak))
+    if compiled != reference:
+        raise SystemExit("Compiled ciphertext differs from the five-step pipeline!")
+    t, peak, buffered = measure(lambda s: multi_encrypt_buffer(s, *keys), text, repeat=repeat)
+    rows.append(("encrypt", "buffer", t, peak))
+    if buffered != reference:
+        raise SystemExit("Buffer ciphertext differs from the five-step pipeline!")
+
+    t, peak, _ = measure(lambda s: multi_decrypt(s, *keys, verbose=False), reference, repeat=repeat)
+    rows.append(("decrypt", "five-step", t, peak))
+    t, peak, _ = measure(lambda s: multi_decrypt_compiled(s, *keys), reference, repeat=repeat)
+    rows.append(("decrypt", "compiled", t, peak))
+    t, peak, _ = measure(lambda s: multi_decrypt_buffer(s, *keys), reference, repeat=repeat)
+    rows.append(("decrypt", "buffer", t, peak))
+
+    print(f"\nInput: {size / 1024 / 1024:.2f} MB, best of {repeat}")
+    print("-" * 65)
+    print(f"{'op':<9}{'path':<11}{'time (s)':>11}{'MB/s':>9}{'peak MB':>10}{'peak/input':>12}")
+    print("-" * 65)
+    for op, path, t, peak in rows:
+        print(f"{op:<9}{path:<11}{t:>11.3f}{size / t / 1e6:>9.1f}"
+              f"{peak / 1024 / 1024:>10.1f}{peak / size:>12.2f}")
+    print("-" * 65)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Five-step vs compiled vs buffer multi-layer benchmark")
+    parser.add_argument("--size-mb", type=float, default=8.0, help="input size in MB (default 8)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed repetitions per path (default 3)")
+    parser.add_argument("--ascii", action="store_true",
+                        help="pure ASCII input (otherwise the buffer path falls back on encrypt)")
+    args = parser.parse_args()
+    run(args.size_mb, args.repeat, args.ascii)
+
+
+if __name__ == "__main__":
+    main()
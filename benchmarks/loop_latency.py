@@ -0,0 +1,80 @@
+"""
+Event-Loop Latency Benchmark
+Encrypts a multi-MB payload with async_api while a ticker task measures how
+late the event loop wakes it up, comparing a direct (blocking) call, a thread
+pool and the default process pool.
+
+Usage:-
+    python -m benchmarks.loop_latency [--size-mb 8] [--tick-ms 1]
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import async_api
+from benchmarks.fusion import make_text
+from multilayer import multi_encrypt_compiled
+
+KEYS = (3, "KEY", 5)
+
+
+async def _ticker(interval: float, lags: list, stop: asyncio.Event):
+    #Records how much later than requested every sleep returns
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def measure(mode: str, text: str, interval: float) -> tuple:
+    #Returns (wall time, max lag, p99 lag) while encrypting text in the given mode
+    lags = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(interval, lags, stop))
+    await asyncio.sleep(interval * 5)  #Let the ticker settle
+
+    start = time.perf_counter()
+    if mode == "blocking":
+        multi_encrypt_compiled(text, *KEYS)
+    elif mode == "thread":
+        with ThreadPoolExecutor(1) as pool:
+            await async_api.multi_encrypt(text, *KEYS, executor=pool)
+    else:
+        await async_api.multi_encrypt(text, *KEYS)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    lags.sort()
+    return elapsed, lags[-1], lags[int(len(lags) * 0.99) - 1] if len(lags) > 1 else lags[-1]
+
+
+async def run(size_mb: float, tick_ms: float):
+    text = make_text(int(size_mb * 1024 * 1024))
+    interval = tick_ms / 1000
+
+    await async_api.multi_encrypt(text[:async_api.INLINE_LIMIT + 1], *KEYS)  #Start the process pool
+
+    print(f"\nmulti_encrypt of {size_mb:g} MB, ticker every {tick_ms:g} ms")
+    print("-" * 52)
+    print(f"{'mode':<10}{'time (s)':>11}{'max lag (ms)':>15}{'p99 lag (ms)':>15}")
+    print("-" * 52)
+    for mode in ("blocking", "thread", "process"):
+        elapsed, worst, p99 = await measure(mode, text, interval)
+        print(f"{mode:<10}{elapsed:>11.3f}{worst * 1e3:>15.1f}{p99 * 1e3:>15.1f}")
+    print("-" * 52)
+    async_api.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event-loop latency while encrypting through async_api")
+    parser.add_argument("--size-mb", type=float, default=8.0, help="payload size in MB (default 8)")
+    parser.add_argument("--tick-ms", type=float, default=1.0, help="ticker interval in ms (default 1)")
+    args = parser.parse_args()
+    asyncio.run(run(args.size_mb, args.tick_ms))
+
+
+if __name__ == "__main__":
+    main()
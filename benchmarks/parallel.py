@@ -0,0 +1,65 @@
+"""
+Parallel Cipher Benchmark
+Times the sequential ciphers against parallel.py on one large input for a
+range of worker counts, and checks that every output is identical.
+
+Usage:-
+    python -m benchmarks.parallel [--size-mb 32] [--workers 1,2,4,8] [--repeat 2]
+"""
+
+import argparse
+import os
+import time
+
+import parallel
+from benchmarks.fusion import make_text
+from ciphers import caesar_encrypt, vigenere_encrypt, ascii_shift
+
+CASES = {
+    "caesar": (caesar_encrypt, parallel.caesar_encrypt_parallel, 3),
+    "vigenere": (vigenere_encrypt, parallel.vigenere_encrypt_parallel, "KEY"),
+    "ascii": (ascii_shift, parallel.ascii_shift_parallel, 5),
+}
+
+
+def best_of(func, repeat: int):
+    #Returns (best wall time in seconds, result)
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(size_mb: float, workers: list, repeat: int):
+    text = make_text(int(size_mb * 1024 * 1024))
+    size = len(text.encode("utf-8"))
+
+    print(f"\nInput: {size / 1024 / 1024:.2f} MB, best of {repeat}, {os.cpu_count()} CPUs")
+    print("-" * 52)
+    print(f"{'cipher':<10}{'workers':>9}{'time (s)':>11}{'MB/s':>9}{'speedup':>10}")
+    print("-" * 52)
+    for name, (sequential, parallel_function, param) in CASES.items():
+        base, reference = best_of(lambda: sequential(text, param), repeat)
+        print(f"{name:<10}{'seq':>9}{base:>11.3f}{size / base / 1e6:>9.1f}{1.0:>10.2f}")
+        for count in workers:
+            t, result = best_of(lambda: parallel_function(text, param, workers=count), repeat)
+            if result != reference:
+                raise SystemExit(f"Parallel {name} with {count} workers differs from the sequential output!")
+            print(f"{name:<10}{count:>9}{t:>11.3f}{size / t / 1e6:>9.1f}{base / t:>10.2f}")
+    print("-" * 52)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential vs multi-core cipher benchmark")
+    parser.add_argument("--size-mb", type=float, default=32.0, help="input size in MB (default 32)")
+    parser.add_argument("--workers", default="2,4,8", help="comma-separated worker counts (default 2,4,8)")
+    parser.add_argument("--repeat", type=int, default=2, help="timed repetitions per run (default 2)")
+    args = parser.parse_args()
+    run(args.size_mb, [int(count) for count in args.workers.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Startup Benchmark
+Measures cold start: the wall time of fresh interpreter processes that list the
+cipher menu or run one small CLI command, next to a bare interpreter and an
+eager import of every cipher module (what the front ends used to pay before
+registry.py loaded them lazily).
+
+Scenarios:-
+- interpreter : python -c pass
+- menu        : import registry and list the cipher labels
+- cli-caesar  : terminal_app.py caesar --key 3 on a short stdin
+- cli-multi   : terminal_app.py multi ... on a short stdin
+- eager       : import every cipher, pipeline, streaming and job module up front
+
+Usage:-
+    python -m benchmarks.startup [--repeat 20] [--importtime 15]
+
+--importtime prints the slowest imports (cumulative, from python -X importtime)
+of the cli-caesar scenario.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "interpreter": ["-c", "pass"],
+    "menu": ["-c", "import registry; registry.labels('terminal')"],
+    "cli-caesar": ["terminal_app.py", "caesar", "--key", "3"],
+    "cli-multi": ["terminal_app.py", "multi", "--caesar-key", "3", "--vig-key", "KEY", "--ascii-key", "5"],
+    "eager": ["-c", "import ciphers, multilayer, pipeline, streaming, jobs, concurrent.futures.process"],
+}
+
+STDIN = b"Hello, NovaCrypt!\n"
+
+
+def run_once(args: list, importtime: bool = False) -> tuple:
+    #Runs one fresh interpreter; returns (wall time in seconds, stderr)
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + args
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=ROOT, input=STDIN, capture_output=True)
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise SystemExit(f"{' '.join(args)} failed:\n{completed.stderr.decode(errors='replace')}")
+    return elapsed, completed.stderr.decode(errors="replace")
+
+
+def slowest_imports(stderr: str, count: int) -> list:
+    #Parses -X importtime output into [(cumulative microseconds, module)], slowest first
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), module.rstrip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def run(repeat: int, importtime: int):
+    #Times every scenario and prints median / best wall time per process
+    print(f"\nCold start, {repeat} runs each ({sys.executable})")
+    print("-" * 52)
+    print(f"{'scenario':<14}{'median (ms)':>13}{'best (ms)':>12}{'over bare':>13}")
+    print("-" * 52)
+    bare = None
+    for name, args in SCENARIOS.items():
+        run_once(args)  #Warm the OS file cache and __pycache__
+        times = [run_once(args)[0] for _ in range(repeat)]
+        median = statistics.median(times)
+        bare = median if bare is None else bare
+        print(f"{name:<14}{median * 1e3:>13.1f}{min(times) * 1e3:>12.1f}{(median - bare) * 1e3:>+13.1f}")
+    print("-" * 52)
+
+    if importtime:
+        _, stderr = run_once(SCENARIOS["cli-caesar"], importtime=True)
+        print(f"\nSlowest imports for cli-caesar (cumulative)")
+        print("-" * 52)
+        for microseconds, module in slowest_imports(stderr, importtime):
+            print(f"{microseconds / 1e3:>9.1f} ms  {module}")
+        print("-" * 52)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start benchmark for the CLI and cipher registry")
+    parser.add_argument("--repeat", type=int, default=20, help="processes started per scenario (default 20)")
+    parser.add_argument("--importtime", type=int, default=0, metavar="N",
+                        help="also list the N slowest imports of cli-caesar")
+    args = parser.parse_args()
+    run(args.repeat, args.importtime)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Benchmark Suite
+Measures every cipher in ciphers.py plus multi_encrypt / multi_decrypt across
+input sizes and text mixes, and compares runs against a stored baseline.
+
+Per (function, mix, size) it records latency percentiles over several runs,
+throughput (MB/s of UTF-8 input at the median latency) and peak memory traced
+by tracemalloc during one extra run.
+
+Text Mixes:-
+- ascii    : English-like ASCII text
+- unicode  : heavy non-ASCII (accented Latin, Greek, CJK, emoji)
+- nonalpha : mostly digits, punctuation and whitespace
+
+Usage:-
+    python -m benchmarks.suite run [--sizes 1KB,1MB] [--mixes ascii] [--output results.json]
+    python -m benchmarks.suite compare baseline.json results.json [--threshold 0.10]
+
+`compare` exits with status 1 when any measurement regressed by more than the
+threshold, so it can gate CI.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import ciphers
+import multilayer
+
+DEFAULT_SIZES = ("1KB", "10KB", "100KB", "1MB", "10MB", "100MB")
+MIXES = ("ascii", "unicode", "nonalpha")
+
+CAESAR_KEY = 3
+VIG_KEY = "KEY"
+ASCII_KEY = 5
+
+TIME_BUDGET = 1.0  #Seconds of timed runs per measurement (at least MIN_REPEATS runs)
+MIN_REPEATS = 3
+MAX_REPEATS = 200
+
+_UNITS = {"KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "B": 1}
+
+_WORDS = {
+    "ascii": ["the", "quick", "Brown", "fox", "jumps", "over", "lazy", "Dog.", "NovaCrypt,", "cipher"],
+    "unicode": ["naïve", "Ωμέγα", "暗号", "smörgåsbord", "😀🔐", "Straße", "façade", "ключ", "Ünïcödé"],
+    "nonalpha": ["12345", "--", "!!?", "3.14159", "(42)", "#$%&", "0x1F", "...", "2024-01-01", "a1"],
+}
+
+#name -> (function, how to build its input from the plaintext)
+BENCHMARKS = {
+    "caesar_encrypt": (lambda t: ciphers.caesar_encrypt(t, CAESAR_KEY), None),
+    "caesar_decrypt": (lambda t: ciphers.caesar_decrypt(t, CAESAR_KEY), lambda t: ciphers.caesar_encrypt(t, CAESAR_KEY)),
+    "vigenere_encrypt": (lambda t: ciphers.vigenere_encrypt(t, VIG_KEY), None),
+    "vigenere_decrypt": (lambda t: ciphers.vigenere_decrypt(t, VIG_KEY), lambda t: ciphers.vigenere_encrypt(t, VIG_KEY)),
+    "reverse_text": (ciphers.reverse_text, None),
+    "ascii_shift": (lambda t: ciphers.ascii_shift(t, ASCII_KEY), None),
+    "ascii_unshift": (lambda t: ciphers.ascii_unshift(t, ASCII_KEY), lambda t: ciphers.ascii_shift(t, ASCII_KEY)),
+    "base64_encode": (ciphers.base64_encode, None),
+    "base64_decode": (ciphers.base64_decode, ciphers.base64_encode),
+    "generate_sha256": (ciphers.generate_sha256, None),
+    "multi_encrypt": (lambda t: multilayer.multi_encrypt(t, CAESAR_KEY, VIG_KEY, ASCII_KEY, verbose=False), None),
+    "multi_decrypt": (
+        lambda t: multilayer.multi_decrypt(t, CAESAR_KEY, VIG_KEY, ASCII_KEY, verbose=False),
+        lambda t: multilayer.multi_encrypt(t, CAESAR_KEY, VIG_KEY, ASCII_KEY, verbose=False),
+    ),
+}
+
+
+#INPUTS
+
+def parse_size(value: str) -> int:
+    #"10KB" -> 10240
+    value = value.strip().upper()
+    for unit, factor in _UNITS.items():
+        if value.endswith(unit) and value[:-len(unit)].strip():
+            return int(float(value[:-len(unit)]) * factor)
+    return int(value)
+
+
+def make_text(mix: str, size: int, seed: int = 1234) -> str:
+    #Reproducible text of about `size` UTF-8 bytes, built by repeating a 64 KB block
+    rng = random.Random(seed)
+    words = _WORDS[mix]
+    parts = []
+    length = 0
+    while length < min(size, 64 * 1024):
+        word = rng.choice(words)
+        parts.append(word)
+        length += len(word.encode("utf-8")) + 1
+    block = " ".join(parts)
+
+    text = block * (size // max(1, len(block.encode("utf-8"))) + 1)
+    #Trim by characters until the byte size fits
+    ratio = len(text) / len(text.encode("utf-8"))
+    return text[:max(1, int(size * ratio))]
+
+
+#MEASUREMENT
+
+def _percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(function, data) -> dict:
+    #Times repeated runs of function(data) and traces one run for peak memory
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < MAX_REPEATS and (len(samples) < MIN_REPEATS or time.perf_counter() - started < TIME_BUDGET):
+        start = time.perf_counter()
+        function(data)
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "repeats": len(samples),
+        "mean": statistics.fmean(samples),
+        "p50": _percentile(samples, 0.50),
+        "p90": _percentile(samples, 0.90),
+        "p99": _percentile(samples, 0.99),
+        "peak_bytes": peak,
+    }
+
+
+def run(sizes: list, mixes: list, functions: list) -> dict:
+    #Runs the full sweep and returns the JSON-ready report
+    results = []
+    for mix in mixes:
+        for size in sizes:
+            plaintext = make_text(mix, size)
+            input_bytes = len(plaintext.encode("utf-8"))
+            for name in functions:
+                function, prepare = BENCHMARKS[name]
+                data = prepare(plaintext) if prepare else plaintext
+                stats = measure(function, data)
+                stats.update({
+                    "function": name,
+                    "mix": mix,
+                    "size": size,
+                    "input_bytes": input_bytes,
+                    "throughput_mbs": input_bytes / stats["p50"] / 1e6 if stats["p50"] else 0.0,
+                })
+                results.append(stats)
+                print(f"{name:<17}{mix:<10}{size:>11,} B  p50 {stats['p50'] * 1e3:>10.3f} ms  "
+                      f"{stats['throughput_mbs']:>8.1f} MB/s  peak {stats['peak_bytes'] / 1e6:>8.1f} MB",
+                      flush=True)
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+#COMPARISON
+
+def _key(result: dict) -> tuple:
+    return result["function"], result["mix"], result["size"]
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    #Returns regression messages for latency (p50) or peak memory above threshold
+    previous = {_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get(_key(result))
+        if old is None:
+            continue
+        for metric in ("p50", "peak_bytes"):
+            if old[metric] and (result[metric] - old[metric]) / old[metric] > threshold:
+                change = (result[metric] - old[metric]) / old[metric] * 100
+                function, mix, size = _key(result)
+                regressions.append(f"{function} [{mix}, {size:,} B] {metric}: "
+                                   f"{old[metric]:.6g} -> {result[metric]:.6g} (+{change:.1f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NovaCrypt benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark sweep")
+    run_parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help="comma-separated sizes, e.g. 1KB,1MB")
+    run_parser.add_argument("--mixes", default=",".join(MIXES), help="comma-separated text mixes")
+    run_parser.add_argument("--functions", default=",".join(BENCHMARKS), help="comma-separated function names")
+    run_parser.add_argument("--output", default="benchmark_results.json", help="where to write the JSON report")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown (default 0.10)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        mixes = args.mixes.split(",")
+        functions = args.functions.split(",")
+        for name in mixes:
+            if name not in MIXES:
+                run_parser.error(f"unknown mix '{name}' (choose from {', '.join(MIXES)})")
+        for name in functions:
+            if name not in BENCHMARKS:
+                run_parser.error(f"unknown function '{name}' (choose from {', '.join(BENCHMARKS)})")
+        report = run([parse_size(size) for size in args.sizes.split(",")], mixes, functions)
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"\nResults written to {args.output}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
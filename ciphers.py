@@ -15,6 +15,60 @@ and should NOT be used for real-world secure encryption.
 
 import base64
 import hashlib
+from collections import deque, namedtuple
+from functools import lru_cache
+from itertools import compress
+
+from lru import LRUCache
+
+
+#TRANSLATION TABLES
+#Every cipher below is a character-for-character substitution, so the key is
+#turned into a lookup table once and the text is rewritten by str.translate
+#(which runs in C) instead of a Python loop that rebuilds the result string.
+
+def _shift_letter(code: int, shift: int) -> int:
+    #Shifts one alphabetic code point exactly like the classic per-character loop
+    base = ord('A') if chr(code).isupper() else ord('a')
+    return (code - base + shift) % 26 + base
+
+
+class _LetterTable(dict):
+    #str.translate table that shifts alphabetic characters by a fixed amount.
+    #Latin-1 is filled in up front; other letters are added the first time they
+    #are seen. Other non-letters map to themselves without being stored, so text
+    #full of symbols cannot grow the shared tables without bound.
+
+    def __init__(self, shift: int):
+        super().__init__()
+        self.shift = shift
+        for code in range(256):
+            self[code] = _shift_letter(code, shift) if chr(code).isalpha() else code
+
+    def __missing__(self, code: int) -> int:
+        if not chr(code).isalpha():
+            return code
+        value = self[code] = _shift_letter(code, self.shift)
+        return value
+
+
+@lru_cache(maxsize=None)
+def _caesar_table(shift: int) -> _LetterTable:
+    #One table per normalized shift (0-25)
+    return _LetterTable(shift)
+
+
+@lru_cache(maxsize=None)
+def _caesar_bytes(shift: int) -> bytes:
+    #bytes.translate form of _caesar_table(shift) for ASCII text
+    table = _caesar_table(shift)
+    return bytes(table[code] if code < 128 else code for code in range(256))
+
+
+@lru_cache(maxsize=None)
+def _ascii_table(shift: int) -> dict:
+    #One table per normalized shift (0-94); unmapped characters are left as-is
+    return {code: 32 + (code - 32 + shift) % 95 for code in range(32, 127)}
 
 
 #CAESAR CIPHER
@@ -23,15 +77,7 @@ def caesar_encrypt(text: str, key: int) -> str:
 
     key = key % 26  #Normalize key
 
-    result = ""
-    for char in text:
-        if char.isalpha():
-            base = ord('A') if char.isupper() else ord('a')
-            result += chr((ord(char) - base + key) % 26 + base)
-        else:
-            result += char
-
-    return result
+    return text.translate(_caesar_table(key))
 
 
 def caesar_decrypt(text: str, key: int) -> str:
@@ -47,56 +93,130 @@ def clean_keyword(keyword: str) -> str:
     return ''.join(filter(str.isalpha, keyword))
 
 
-def vigenere_encrypt(text: str, keyword: str) -> str:
-    #Encrypts plaintext using Vigenère Cipher
+#Precomputed state for one Vigenère keyword: shift per keyword position plus
+#the per-phase encrypt and decrypt tables
+KeySchedule = namedtuple("KeySchedule", ["shifts", "encrypt_tables", "decrypt_tables"])
+
+KEY_SCHEDULE_CACHE_SIZE = 512
+_key_schedules = LRUCache(KEY_SCHEDULE_CACHE_SIZE)
+
+
+def _build_key_schedule(keyword: str) -> KeySchedule:
+    #Normalizes the keyword into its per-position shifts and tables
 
     keyword = clean_keyword(keyword)
 
     if not keyword:
         raise ValueError("Keyword must contain at least one alphabet character.")
 
-    result = ""
-    keyword_index = 0
+    shifts = tuple((ord(key_char.upper()) - ord('A')) % 26 for key_char in keyword)
+    return KeySchedule(
+        shifts,
+        tuple(_caesar_table(shift) for shift in shifts),
+        tuple(_caesar_table(-shift % 26) for shift in shifts),
+    )
 
-    for char in text:
-        if char.isalpha():
-            key_char = keyword[keyword_index % len(keyword)]
-            shift = ord(key_char.upper()) - ord('A')
 
-            base = ord('A') if char.isupper() else ord('a')
-            result += chr((ord(char) - base + shift) % 26 + base)
+def key_schedule(keyword: str) -> KeySchedule:
+    #Returns the cached key schedule for a keyword, building it on first use
+    return _key_schedules.get_or_create(keyword, lambda: _build_key_schedule(keyword))
 
-            keyword_index += 1
-        else:
-            result += char
 
-    return result
+def key_schedule_cache_info():
+    #Size, hit, miss and eviction counters of the key-schedule cache
+    return _key_schedules.info()
 
 
-def vigenere_decrypt(text: str, keyword: str) -> str:
-    #Decrypts Vigenère Cipher text
+def clear_key_schedule_cache():
+    #Empties the key-schedule cache and resets its counters
+    _key_schedules.clear()
 
-    keyword = clean_keyword(keyword)
 
-    if not keyword:
-        raise ValueError("Keyword must contain at least one alphabet character.")
+_VIGENERE_BLOCK = 1 << 16  #Characters per block, bounds the scratch lists below
+_WIDE_PERIOD_LIMIT = 16  #Longest keyword for the ASCII fast path (its scratch grows with the period)
+_ASCII_LETTERS = bytes(range(ord('A'), ord('Z') + 1)) + bytes(range(ord('a'), ord('z') + 1))
+_FILLER = b"\x81"  #Slot markers; never in ASCII input and left alone by the tables
+_DROPPED = b"\x80"
+_SLOT_MARKS = bytes(_FILLER[0] if code in _ASCII_LETTERS else _DROPPED[0] for code in range(256))
 
-    result = ""
-    keyword_index = 0
 
-    for char in text:
-        if char.isalpha():
-            key_char = keyword[keyword_index % len(keyword)]
-            shift = ord(key_char.upper()) - ord('A')
+def _vigenere_block(text: str, tables: tuple, phase: int = 0) -> tuple:
+    #Applies per-phase tables starting at keyword position `phase`.
+    #Only alphabetic characters advance the keyword index; returns (result, next phase).
 
-            base = ord('A') if char.isupper() else ord('a')
-            result += chr((ord(char) - base - shift) % 26 + base)
+    period = len(tables)
+    if period == 1:
+        return text.translate(tables[0]), 0
+    if not text.isascii():
+        #Every letter shifts into A-Z / a-z, so folding letters with the zero shift first
+        #changes no result and often leaves an ASCII block for the fast path
+        text = text.translate(_caesar_table(0))
+    if period <= _WIDE_PERIOD_LIMIT and text.isascii():
+        return _vigenere_ascii(text.encode("ascii"), tables, phase)
 
-            keyword_index += 1
-        else:
-            result += char
+    #Project out the alphabetic characters, then every phase is a plain strided translate
+    chars = list(text)
+    positions = list(compress(range(len(chars)), map(str.isalpha, text)))
+    letters = ''.join(map(chars.__getitem__, positions))
 
-    return result
+    shifted = list(letters)
+    for offset in range(period):
+        table = tables[(phase + offset) % period]
+        shifted[offset::period] = letters[offset::period].translate(table)
+
+    next_phase = (phase + len(letters)) % period
+    if len(letters) == len(chars):
+        return ''.join(shifted), next_phase
+
+    #Scatter the shifted letters back between the untouched characters
+    deque(map(chars.__setitem__, positions, shifted), maxlen=0)
+    return ''.join(chars), next_phase
+
+
+def _vigenere_ascii(data: bytes, tables: tuple, phase: int) -> tuple:
+    #_vigenere_block for ASCII text with bytes.translate and no per-character Python work.
+    #Every byte gets period + 1 slots (its own byte, then fillers); non-letters drop one
+    #filler, so a letter's slot index modulo the period is its keyword position and
+    #each phase becomes one strided translate. Fillers are deleted at the end.
+
+    period = len(tables)
+    slots = period + 1
+    wide = bytearray(_FILLER) * (len(data) * slots)
+    wide[0::slots] = data
+    wide[period::slots] = data.translate(_SLOT_MARKS)
+    wide = wide.translate(None, _DROPPED)
+
+    for offset in range(period):
+        table = _caesar_bytes(tables[(phase + offset) % period].shift)
+        wide[offset::period] = wide[offset::period].translate(table)
+
+    letters = len(data) - len(data.translate(None, _ASCII_LETTERS))
+    return wide.translate(None, _FILLER).decode("ascii"), (phase + letters) % period
+
+
+def _vigenere_apply(text: str, tables: tuple, phase: int = 0) -> tuple:
+    #Applies per-phase tables to the whole text, block by block; returns (result, next phase)
+
+    if len(text) <= _VIGENERE_BLOCK:
+        return _vigenere_block(text, tables, phase)
+
+    pieces = []
+    for start in range(0, len(text), _VIGENERE_BLOCK):
+        piece, phase = _vigenere_block(text[start:start + _VIGENERE_BLOCK], tables, phase)
+        pieces.append(piece)
+    return ''.join(pieces), phase
+
+
+def vigenere_encrypt(text: str, keyword: str) -> str:
+    #Encrypts plaintext using Vigenère Cipher
+
+    return _vigenere_apply(text, key_schedule(keyword).encrypt_tables)[0]
+
+
+def vigenere_decrypt(text: str, keyword: str) -> str:
+    #Decrypts Vigenère Cipher text
+
+    return _vigenere_apply(text, key_schedule(keyword).decrypt_tables)[0]
 
 #REVERSE TEXT
 
@@ -110,18 +230,8 @@ def reverse_text(text: str) -> str:
 def ascii_shift(text: str, shift_val: int) -> str:
     #Shifts printable ASCII characters safely
 
-    result = ""
-
-    for char in text:
-        ascii_code = ord(char)
-
-        if 32 <= ascii_code <= 126:
-            new_code = 32 + ((ascii_code - 32 + shift_val) % 95)
-            result += chr(new_code)
-        else:
-            result += char  #Leave Unicode chars unchanged
-
-    return result
+    #Only the printable range 32-126 is in the table, Unicode chars stay unchanged
+    return text.translate(_ascii_table(shift_val % 95))
 
 
 def ascii_unshift(text: str, shift_val: int) -> str:
@@ -0,0 +1,319 @@
+"""
+cryptanalysis.py - Breaking the Classical Ciphers
+Tools for auditing ciphertext produced by this toolkit:
+1. Caesar key recovery by frequency scoring
+2. Vigenère keyword recovery (index of coincidence + Kasiski, then per-column Caesar)
+3. Known-plaintext key recovery for the multi-layer scheme
+
+The text is read once to build a 26-bin letter histogram. Every candidate
+shift is then scored against English letter frequencies by rotating that
+histogram, so no candidate plaintext is ever built: O(n + 26²) instead of
+26 full decryptions.
+
+For Vigenère, the ciphertext is first projected onto its alphabetic characters
+(only those advance the keyword index in vigenere_encrypt). Each candidate key
+length L is evaluated from the columns projection[i::L], one striding pass
+each, and candidate lengths are spread over a process pool.
+
+For the multi-layer scheme the layers collapse: Caesar followed by Vigenère is
+one periodic letter shift, and the ASCII key only matters modulo 95. With a
+known plaintext, Base64 is inverted, the 95 ASCII candidates are checked
+against the plaintext, and the periodic shift is read off directly, instead of
+brute-forcing the full key product.
+
+⚠️Note:
+Like the ciphers themselves, this module is meant for education and testing.
+"""
+
+import math
+import os
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import compress, repeat
+
+from ciphers import ascii_unshift, base64_decode
+
+#Relative frequency of A-Z in English text
+ENGLISH_FREQUENCIES = (
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015,
+    0.06094, 0.06966, 0.00153, 0.00772, 0.04025, 0.02406, 0.06749,
+    0.07507, 0.01929, 0.00095, 0.05987, 0.06327, 0.09056, 0.02758,
+    0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+)
+_LOG_FREQUENCIES = tuple(math.log(frequency) for frequency in ENGLISH_FREQUENCIES)
+
+SCORING_METHODS = ("chi2", "loglik")
+
+#A candidate key and its score (lower is better for chi2, higher for loglik)
+KeyScore = namedtuple("KeyScore", ["key", "score"])
+
+
+_shared = {}  #Large inputs handed to pool workers once, via the initializer
+
+
+def _init_worker(shared: dict):
+    _shared.update(shared)
+
+
+#LETTER STATISTICS
+
+def letter_histogram(text: str) -> list:
+    #Counts A-Z case-insensitively in a single pass over the text
+    counts = Counter(text)
+    return [counts[chr(ord('A') + i)] + counts[chr(ord('a') + i)] for i in range(26)]
+
+
+def score_shifts(histogram: list, method: str = "chi2") -> list:
+    #Scores all 26 shifts of a ciphertext histogram; index = key
+    if method not in SCORING_METHODS:
+        raise ValueError(f"Unknown scoring method '{method}'. Choose from: {', '.join(SCORING_METHODS)}.")
+
+    total = sum(histogram)
+    scores = []
+    for key in range(26):
+        #Plaintext letter p appears in the ciphertext as (p + key) mod 26
+        observed = [histogram[(p + key) % 26] for p in range(26)]
+        if method == "chi2":
+            score = sum(
+                (count - total * expected) ** 2 / (total * expected)
+                for count, expected in zip(observed, ENGLISH_FREQUENCIES)
+            ) if total else 0.0
+        else:
+            score = sum(count * log_p for count, log_p in zip(observed, _LOG_FREQUENCIES))
+        scores.append(score)
+    return scores
+
+
+def _rank(scores: list, method: str) -> list:
+    ranked = [KeyScore(key, score) for key, score in enumerate(scores)]
+    ranked.sort(key=lambda item: item.score, reverse=(method == "loglik"))
+    return ranked
+
+
+#CAESAR CIPHER
+
+def rank_caesar_keys(ciphertext: str, method: str = "chi2") -> list:
+    #Returns all 26 Caesar keys ranked from most to least likely
+    return _rank(score_shifts(letter_histogram(ciphertext), method), method)
+
+
+def break_caesar(ciphertext: str, method: str = "chi2") -> int:
+    #Most likely Caesar key; caesar_decrypt(ciphertext, key) gives the plaintext
+    return rank_caesar_keys(ciphertext, method)[0].key
+
+
+def rank_caesar_keys_batch(ciphertexts, method: str = "chi2", workers: int = None) -> list:
+    #Ranks Caesar keys for many ciphertexts in parallel; results keep input order
+    ciphertexts = list(ciphertexts)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(ciphertexts) < 2:
+        return [rank_caesar_keys(text, method) for text in ciphertexts]
+
+    chunksize = max(1, len(ciphertexts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(rank_caesar_keys, ciphertexts, repeat(method), chunksize=chunksize))
+
+
+#VIGENÈRE CIPHER
+
+#A candidate keyword: its length, the mean index of coincidence of its columns,
+#its Kasiski support (excess share of repeat distances it divides), and the
+#mean chi2 of the solved columns
+VigenereCandidate = namedtuple("VigenereCandidate", ["keyword", "key_length", "ioc", "kasiski", "score"])
+
+KASISKI_SAMPLE = 20000  #Letters scanned for repeated trigrams
+_LENGTH_TOLERANCE = 0.9  #Lengths scoring within this fraction of the best count as plausible
+
+
+
+def alphabetic_projection(text: str) -> bytes:
+    #Uppercase A-Z bytes of every character that advances the Vigenère keyword.
+    #Non-ASCII letters (never produced by vigenere_encrypt) become '?' and are not counted.
+    return ''.join(filter(str.isalpha, text)).encode("ascii", "replace").upper()
+
+
+def _column_histogram(column: bytes) -> list:
+    counts = Counter(column)
+    return [counts[ord('A') + i] for i in range(26)]
+
+
+def _index_of_coincidence(histogram: list) -> float:
+    total = sum(histogram)
+    if total < 2:
+        return 0.0
+    return sum(count * (count - 1) for count in histogram) / (total * (total - 1))
+
+
+def _kasiski_distances(projection: bytes) -> list:
+    #Distances between repeated trigrams in a prefix of the projection
+    sample = projection[:KASISKI_SAMPLE]
+    last_seen = {}
+    distances = []
+    for index in range(len(sample) - 2):
+        trigram = sample[index:index + 3]
+        if trigram in last_seen:
+            distances.append(index - last_seen[trigram])
+        last_seen[trigram] = index
+    return distances
+
+
+def _evaluate_key_length(key_length: int, projection: bytes = None) -> tuple:
+    #Returns (mean IoC, mean chi2, keyword) for one key length
+    projection = _shared["projection"] if projection is None else projection
+
+    iocs = []
+    chi2s = []
+    keyword = []
+    for offset in range(key_length):
+        histogram = _column_histogram(projection[offset::key_length])
+        iocs.append(_index_of_coincidence(histogram))
+        scores = score_shifts(histogram, "chi2")
+        key = min(range(26), key=scores.__getitem__)
+        chi2s.append(scores[key])
+        keyword.append(chr(ord('A') + key))
+    return sum(iocs) / key_length, sum(chi2s) / key_length, "".join(keyword)
+
+
+def rank_vigenere_keys(ciphertext: str, max_key_length: int = 20, workers: int = None) -> list:
+    #Returns candidate keywords, most likely first
+    projection = alphabetic_projection(ciphertext)
+    lengths = [length for length in range(1, max_key_length + 1) if len(projection) >= 2 * length]
+    if not lengths:
+        raise ValueError("Ciphertext is too short to analyze.")
+
+    workers = min(workers or os.cpu_count() or 1, len(lengths))
+    if workers == 1:
+        results = [_evaluate_key_length(length, projection) for length in lengths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=({"projection": projection},)) as pool:
+            results = list(pool.map(_evaluate_key_length, lengths))
+
+    distances = _kasiski_distances(projection)
+    candidates = []
+    for length, (ioc, chi2, keyword) in zip(lengths, results):
+        #Share of repeat distances divisible by the length, above the 1/L expected by chance
+        divisible = sum(1 for distance in distances if distance % length == 0)
+        support = max(0.0, divisible / len(distances) - 1 / length) if distances else 0.0
+        candidates.append(VigenereCandidate(keyword, length, ioc, support, chi2))
+
+    def strength(candidate):
+        return candidate.ioc * (1 + candidate.kasiski)
+
+    #Multiples of the true length look just as good, so the shortest plausible length wins
+    threshold = _LENGTH_TOLERANCE * max(map(strength, candidates))
+    plausible = sorted((c for c in candidates if strength(c) >= threshold), key=lambda c: c.key_length)
+    others = sorted((c for c in candidates if strength(c) < threshold), key=strength, reverse=True)
+    return plausible + others
+
+
+def break_vigenere(ciphertext: str, max_key_length: int = 20, workers: int = None) -> str:
+    #Most likely keyword; vigenere_decrypt(ciphertext, keyword) gives the plaintext
+    return rank_vigenere_keys(ciphertext, max_key_length, workers)[0].keyword
+
+
+#MULTI-LAYER KNOWN PLAINTEXT
+
+#One key triple for multi_encrypt / multi_decrypt
+KeyTriple = namedtuple("KeyTriple", ["caesar_key", "vig_key", "ascii_key"])
+
+
+def _minimal_period(shifts: tuple) -> int:
+    #Shortest keyword length that explains the observed shift sequence
+    for period in range(1, len(shifts)):
+        if shifts[period:] == shifts[:-period]:
+            return period
+    return max(1, len(shifts))
+
+
+def _plaintext_profile(shifted: str, plaintext: str) -> dict:
+    #Everything the ASCII-key check needs that does not depend on the candidate key
+    mask = list(map(str.isalpha, plaintext))
+    others = [not flag for flag in mask]
+    return {
+        "shifted": shifted,
+        "mask": mask,
+        "others": others,
+        "skeleton": ''.join(compress(plaintext, others)),
+        "letters": ''.join(compress(plaintext, mask)),
+    }
+
+
+def _match_ascii_key(ascii_key: int, profile: dict = None):
+    #Returns the combined Caesar+Vigenère shift sequence if ascii_key fits, else None
+    profile = _shared if profile is None else profile
+
+    candidate = ascii_unshift(profile["shifted"], ascii_key)[::-1]
+
+    #Non-letters pass through Caesar and Vigenère untouched
+    if ''.join(compress(candidate, profile["others"])) != profile["skeleton"]:
+        return None
+
+    #Letters must land on an ASCII letter of the case the ciphers produce
+    shifts = []
+    for plain, cipher in zip(profile["letters"], compress(candidate, profile["mask"])):
+        upper = plain.isupper()
+        if not ('A' <= cipher <= 'Z' if upper else 'a' <= cipher <= 'z'):
+            return None
+        shifts.append((ord(cipher) - ord(plain)) % 26)
+    return tuple(shifts)
+
+
+def _match_ascii_keys(ascii_keys: list) -> list:
+    #Worker side: every (ascii_key, shifts) pair in the chunk that fits
+    matches = []
+    for ascii_key in ascii_keys:
+        shifts = _match_ascii_key(ascii_key)
+        if shifts is not None:
+            matches.append((ascii_key, shifts))
+    return matches
+
+
+def _expand_triples(ascii_key: int, shifts: tuple) -> list:
+    #All (caesar_key, keyword) splits of a combined periodic shift
+    period = _minimal_period(shifts)
+    combined = shifts[:period] or (0,)
+    return [
+        KeyTriple(caesar_key, "".join(chr(ord('A') + (shift - caesar_key) % 26) for shift in combined), ascii_key)
+        for caesar_key in range(26)
+    ]
+
+
+def solve_multi_layer_keys(ciphertext: str, plaintext: str, workers: int = None) -> list:
+    #Recovers every key triple that maps plaintext to ciphertext under multi_encrypt.
+    #Keys are canonical: caesar_key in 0-25, ascii_key in 0-94 (any key ≡ mod 95 is
+    #equivalent), and the shortest keyword (repeating it is equivalent too).
+    shifted = base64_decode(ciphertext)
+    if len(shifted) != len(plaintext):
+        return []
+
+    #A printable non-letter in the plaintext pins the ASCII key, so the first match is the only one
+    unique = any(32 <= ord(char) <= 126 and not char.isalpha() for char in plaintext)
+
+    profile = _plaintext_profile(shifted, plaintext)
+    workers = workers or os.cpu_count() or 1
+    matches = []
+    if workers == 1:
+        for ascii_key in range(95):
+            shifts = _match_ascii_key(ascii_key, profile)
+            if shifts is not None:
+                matches.append((ascii_key, shifts))
+                if unique:
+                    break
+    else:
+        chunks = [list(range(start, 95, workers * 2)) for start in range(workers * 2)]
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(profile,))
+        try:
+            futures = [pool.submit(_match_ascii_keys, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                matches.extend(future.result())
+                if matches and unique:
+                    break
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    triples = []
+    for ascii_key, shifts in sorted(matches):
+        triples.extend(_expand_triples(ascii_key, shifts))
+    return triples
@@ -0,0 +1,169 @@
+"""
+jobs.py - Background File Jobs
+Runs a streaming cipher (see streaming.py) over a file on a worker thread, so
+a front end can keep responding while large documents are processed.
+
+A FileJob reads its source in chunks and writes the result to an output file.
+Between chunks it updates its progress counters and checks for cancellation:
+
+    job = start_file_job("multi", "encrypt", "big.txt", (3, "KEY", 5))
+    while job.status == RUNNING:
+        print(job.progress())
+        time.sleep(0.5)
+    job.cancel()   #Stops after the current chunk and deletes the partial output
+
+Progress is work done (bytes read from the source plus bytes written) over the
+work expected for the operation; the registry's stream_cost gives how many
+passes it makes over the source and roughly how large its output is.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from itertools import count
+
+import registry
+from streaming import CHUNK_SIZE
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+#Snapshot of a job: fraction is 0.0-1.0, throughput is bytes read per second
+JobProgress = namedtuple("JobProgress", [
+    "status", "fraction", "bytes_read", "bytes_written", "elapsed", "throughput", "error",
+])
+
+
+class _CountingReader:
+    #Binary file wrapper that counts bytes read and stops the job once cancelled
+
+    def __init__(self, file, job: "FileJob"):
+        self._file = file
+        self._job = job
+
+    def read(self, size: int = -1) -> bytes:
+        if self._job._cancel.is_set():
+            raise _Cancelled()
+        data = self._file.read(size)
+        self._job.bytes_read += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def seekable(self) -> bool:
+        return True
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class FileJob:
+    #One operation over one file, run on a daemon thread
+
+    _ids = count(1)
+
+    def __init__(self, operation: str, direction: str, source_path, params: tuple,
+                 output_path=None, chunk_size: int = CHUNK_SIZE, label: str = None):
+        #Raises ValueError for an unknown cipher or one that cannot stream in this direction
+        self._factory = registry.get(operation).stream(direction)
+
+        self.id = next(self._ids)
+        self.operation = operation
+        self.direction = direction
+        self.label = label or f"{operation} {direction}"
+        self.source_path = os.fspath(source_path)
+        self.params = tuple(params)
+        self.chunk_size = chunk_size
+
+        if output_path is None:
+            handle, output_path = tempfile.mkstemp(prefix="novacrypt-", suffix=".out")
+            os.close(handle)
+        self.output_path = os.fspath(output_path)
+
+        self.source_size = os.path.getsize(self.source_path)
+        passes, output_ratio = registry.get(operation).stream_cost(direction)
+        self.expected_work = max(1, passes * self.source_size + int(output_ratio * self.source_size))
+
+        self.status = RUNNING
+        self.error = None
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.started = self.finished = None
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"file-job-{self.id}", daemon=True)
+
+    def start(self) -> "FileJob":
+        self.started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            with open(self.source_path, "rb") as source, open(self.output_path, "wb") as sink:
+                chunks = self._factory(_CountingReader(source, self), *self.params, chunk_size=self.chunk_size)
+                try:
+                    for chunk in chunks:
+                        if self._cancel.is_set():
+                            raise _Cancelled()
+                        sink.write(chunk)
+                        self.bytes_written += len(chunk)
+                finally:
+                    chunks.close()
+            self.status = DONE
+        except _Cancelled:
+            self.status = CANCELLED
+            self._discard_output()
+        except Exception as e:
+            self.error = str(e)
+            self.status = FAILED
+            self._discard_output()
+        finally:
+            self.finished = time.perf_counter()
+
+    def _discard_output(self):
+        try:
+            os.remove(self.output_path)
+        except OSError:
+            pass
+
+    def cancel(self):
+        #Asks the worker to stop after the current chunk
+        self._cancel.set()
+
+    def discard(self):
+        #Cancels the job if needed and deletes its output file
+        self.cancel()
+        self.wait()
+        self._discard_output()
+
+    def wait(self, timeout: float = None) -> bool:
+        #Blocks until the job ends; returns False on timeout
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def progress(self) -> JobProgress:
+        end = self.finished or time.perf_counter()
+        elapsed = end - self.started if self.started else 0.0
+        if self.status == DONE:
+            fraction = 1.0
+        else:
+            fraction = min(0.99, (self.bytes_read + self.bytes_written) / self.expected_work)
+        throughput = self.bytes_read / elapsed if elapsed else 0.0
+        return JobProgress(self.status, fraction, self.bytes_read, self.bytes_written, elapsed, throughput, self.error)
+
+    def __repr__(self) -> str:
+        return f"FileJob({self.id}, {self.label!r}, {self.status})"
+
+
+def start_file_job(operation: str, direction: str, source_path, params: tuple = (), **options) -> FileJob:
+    #Creates and starts a FileJob; options are passed to FileJob
+    return FileJob(operation, direction, source_path, params, **options).start()
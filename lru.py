@@ -0,0 +1,80 @@
+"""
+lru.py - Bounded LRU Cache
+A small thread-safe least-recently-used cache with hit, miss and eviction
+counters. Used to keep compiled objects (pipeline plans, key schedules) around
+for the keys a service keeps reusing, without letting memory grow unbounded.
+
+Besides the entry count, a cache can be bounded by total weight: pass
+maxweight and a weigh(value) function (e.g. len for cached strings), and the
+least recently used entries are evicted until the total fits. A value heavier
+than maxweight on its own is returned but not kept.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "size", "maxsize"])
+
+
+class LRUCache:
+    #Maps hashable keys to values, evicting the least recently used entry when full
+
+    def __init__(self, maxsize: int = 128, maxweight: int = None, weigh=None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        if maxweight is not None and weigh is None:
+            raise ValueError("maxweight needs a weigh function.")
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self._weigh = weigh
+        self._data = OrderedDict()
+        self._weights = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+        self.weight = 0
+
+    def get_or_create(self, key, factory):
+        #Returns the cached value for key, building it with factory() on a miss
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        #Build outside the lock; if two threads race, the first stored value wins
+        value = factory()
+
+        weight = self._weigh(value) if self.maxweight is not None else 0
+        with self._lock:
+            if key in self._data:
+                return self._data[key]
+            if self.maxweight is not None and weight > self.maxweight:
+                return value
+            self._data[key] = value
+            self._weights[key] = weight
+            self.weight += weight
+            while len(self._data) > self.maxsize or (self.maxweight is not None and self.weight > self.maxweight):
+                oldest, _ = self._data.popitem(last=False)
+                self.weight -= self._weights.pop(oldest)
+                self.evictions += 1
+        return value
+
+    def info(self) -> CacheInfo:
+        #Snapshot of the cache counters
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+    def clear(self):
+        #Drops all entries and resets the counters
+        with self._lock:
+            self._data.clear()
+            self._weights.clear()
+            self.hits = self.misses = self.evictions = 0
+            self.weight = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
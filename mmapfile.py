@@ -0,0 +1,214 @@
+"""
+mmapfile.py - In-Place File Encryption with mmap
+Caesar, Vigenère, ASCII Shift and Reverse keep ASCII text the same length, so
+a file can be rewritten where it lies instead of being read into Python
+strings and written out as a second copy:
+
+    mmapfile.vigenere_file("dataset.txt", "KEY")                      #In place
+    mmapfile.caesar_file("dataset.txt", 3, decrypt=True, output_path="plain.txt")
+
+The file is mapped one window (WINDOW_SIZE bytes) at a time and each window is
+rewritten block by block through a memoryview, so resident memory stays around
+one window no matter how large the file is, and in-place runs need no extra
+disk space. Output files are preallocated to the input size and mapped the
+same way.
+
+Substitutions use bytes.translate tables (the Vigenère keyword phase is
+carried across blocks and windows); Reverse swaps blocks from both ends of the
+file towards the middle (two pointers), so it is in place too.
+
+Only ASCII files are accepted: a multi-byte UTF-8 character would change
+length or be split by these byte-level rewrites. In-place runs scan the file
+first and raise ValueError before anything is modified; runs into an output
+file check as they go and delete the partial output on failure. Use
+streaming.py for non-ASCII text.
+"""
+
+import mmap
+import os
+from contextlib import contextmanager
+
+from ciphers import key_schedule
+from multilayer import _ascii_bytes, _letter_bytes, _shift_block
+
+WINDOW_SIZE = 16 << 20  #Bytes mapped at a time (a multiple of mmap.ALLOCATIONGRANULARITY)
+BLOCK_SIZE = 1 << 20  #Bytes rewritten per step, bounds the scratch copies
+
+OPERATIONS = ("caesar", "vigenere", "ascii", "reverse")
+
+
+#MAPPING
+
+@contextmanager
+def _mapped(file, start: int, stop: int, writable: bool):
+    #Maps bytes [start, stop) of an open file and yields a memoryview of exactly that range
+    base = start - start % mmap.ALLOCATIONGRANULARITY
+    access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+    mapping = mmap.mmap(file.fileno(), stop - base, offset=base, access=access)
+    view = memoryview(mapping)
+    part = view[start - base:]
+    try:
+        yield part
+    finally:
+        part.release()
+        view.release()
+        mapping.close()
+
+
+def _windows(size: int):
+    for start in range(0, size, WINDOW_SIZE):
+        yield start, min(start + WINDOW_SIZE, size)
+
+
+def _blocks(size: int):
+    for start in range(0, size, BLOCK_SIZE):
+        yield start, min(start + BLOCK_SIZE, size)
+
+
+def _non_ascii(path, offset: int, block: bytes) -> ValueError:
+    #The error for the first non-ASCII byte of a block starting at `offset`
+    offset += next(index for index, byte in enumerate(block) if byte > 127)
+    return ValueError(f"{os.fspath(path)} has a non-ASCII byte at offset {offset}; "
+                      f"memory-mapped mode only handles ASCII files.")
+
+
+def _check_ascii(file, path):
+    #Scans the whole file before an in-place run modifies anything
+    file.seek(0)
+    offset = 0
+    for block in iter(lambda: file.read(BLOCK_SIZE), b""):
+        if not block.isascii():
+            raise _non_ascii(path, offset, block)
+        offset += len(block)
+
+
+#TRANSFORMS (in place on one mapped window)
+
+def _translator(table: bytes):
+    def transform(view: memoryview, phase: int) -> int:
+        for start, stop in _blocks(len(view)):
+            view[start:stop] = view[start:stop].tobytes().translate(table)
+        return phase
+    return transform
+
+
+def _vigenere(tables: tuple):
+    def transform(view: memoryview, phase: int) -> int:
+        for start, stop in _blocks(len(view)):
+            phase = _shift_block(view, start, stop, tables, phase)
+        return phase
+    return transform
+
+
+def _substitution(operation: str, param, decrypt: bool):
+    #The window transform for a substitution cipher; bad keys fail here, before any I/O
+    sign = -1 if decrypt else 1
+    if operation == "caesar":
+        return _translator(_letter_bytes(sign * param % 26))
+    if operation == "ascii":
+        return _translator(_ascii_bytes(sign * param % 95))
+    if operation == "vigenere":
+        return _vigenere(tuple(_letter_bytes(sign * shift % 26) for shift in key_schedule(param).shifts))
+    raise ValueError(f"Unsupported memory-mapped operation: {operation}. Choose from: {', '.join(OPERATIONS)}.")
+
+
+def _swap_reversed(left: memoryview, right: memoryview):
+    #Two pointers over equal-length views: left becomes reversed(right) and vice versa
+    length = len(left)
+    for start, stop in _blocks(length):
+        head = left[start:stop].tobytes()
+        tail = right[length - stop:length - start].tobytes()
+        left[start:stop] = tail[::-1]
+        right[length - stop:length - start] = head[::-1]
+
+
+#FILE OPERATIONS
+
+def _reverse_in_place(file, size: int):
+    #Swaps windows from both ends towards the middle; an odd middle byte stays put
+    half = size // 2
+    for start in range(0, half, WINDOW_SIZE):
+        stop = min(start + WINDOW_SIZE, half)
+        with _mapped(file, start, stop, True) as left, _mapped(file, size - stop, size - start, True) as right:
+            _swap_reversed(left, right)
+
+
+def _reverse_into(source, sink, size: int, path):
+    #Window [start, stop) of the source becomes [size - stop, size - start) of the output
+    for start, stop in _windows(size):
+        with _mapped(source, start, stop, False) as src, _mapped(sink, size - stop, size - start, True) as dst:
+            length = stop - start
+            for block_start, block_stop in _blocks(length):
+                block = src[block_start:block_stop].tobytes()
+                if not block.isascii():
+                    raise _non_ascii(path, start + block_start, block)
+                dst[length - block_stop:length - block_start] = block[::-1]
+
+
+def _copy_checked(src: memoryview, dst: memoryview, offset: int, path):
+    for start, stop in _blocks(len(src)):
+        block = src[start:stop].tobytes()
+        if not block.isascii():
+            raise _non_ascii(path, offset + start, block)
+        dst[start:stop] = block
+
+
+def mmap_transform(operation: str, path, param=None, decrypt: bool = False, output_path=None) -> int:
+    #Rewrites an ASCII file in place (or into output_path) through mmap; returns its size in bytes
+
+    transform = None if operation == "reverse" else _substitution(operation, param, decrypt)
+    path = os.fspath(path)
+    size = os.path.getsize(path)
+    if output_path is not None and os.path.exists(output_path) and os.path.samefile(path, output_path):
+        output_path = None
+
+    if output_path is None:
+        with open(path, "r+b") as file:
+            _check_ascii(file, path)
+            if transform is None:
+                _reverse_in_place(file, size)
+                return size
+            phase = 0
+            for start, stop in _windows(size):
+                with _mapped(file, start, stop, True) as view:
+                    phase = transform(view, phase)
+        return size
+
+    try:
+        with open(path, "rb") as source, open(output_path, "w+b") as sink:
+            sink.truncate(size)
+            if transform is None:
+                _reverse_into(source, sink, size, path)
+                return size
+            phase = 0
+            for start, stop in _windows(size):
+                with _mapped(source, start, stop, False) as src, _mapped(sink, start, stop, True) as dst:
+                    _copy_checked(src, dst, start, path)
+                    phase = transform(dst, phase)
+        return size
+    except BaseException:
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+        raise
+
+
+def caesar_file(path, key: int, decrypt: bool = False, output_path=None) -> int:
+    #caesar_encrypt (or caesar_decrypt) of an ASCII file, in place unless output_path is given
+    return mmap_transform("caesar", path, key, decrypt, output_path)
+
+
+def vigenere_file(path, keyword: str, decrypt: bool = False, output_path=None) -> int:
+    #vigenere_encrypt (or vigenere_decrypt) of an ASCII file, in place unless output_path is given
+    return mmap_transform("vigenere", path, keyword, decrypt, output_path)
+
+
+def ascii_shift_file(path, shift_val: int, unshift: bool = False, output_path=None) -> int:
+    #ascii_shift (or ascii_unshift) of an ASCII file, in place unless output_path is given
+    return mmap_transform("ascii", path, shift_val, unshift, output_path)
+
+
+def reverse_file(path, output_path=None) -> int:
+    #reverse_text of an ASCII file, in place unless output_path is given
+    return mmap_transform("reverse", path, output_path=output_path)
@@ -16,65 +16,210 @@ Decryption Order (reverse):-
 3. Reverse Text
 4. Vigenère Decrypt
 5. Caesar Decrypt
+
+Compiled Mode:-
+multi_encrypt_compiled / multi_decrypt_compiled produce exactly the same output
+block by block instead of layer by layer:
+- Caesar followed by Vigenère is a single periodic shift over alphabetic characters
+- ASCII Shift runs on each block's UTF-8 bytes with bytes.translate
+- Reverse is folded into the block order: encryption Base64-encodes the blocks
+  last to first, decryption reads the decoded bytes from the end
+so no full-size intermediate is built between layers; only the output is
+(python -m benchmarks.fusion measures time and peak memory).
+
+Buffer Mode:-
+multi_encrypt_buffer / multi_decrypt_buffer also match multi_encrypt exactly,
+but work on one bytearray for ASCII text: it is encoded into it block by
+block, the letter shifts, ASCII shift and reversal are applied in place through
+a memoryview, and it is Base64-encoded block by block into a second, exact-size
+buffer. Encryption peaks at that output twice (the buffer and the returned
+str, about 2.7x the input), decryption at about 2x. Text with non-ASCII
+characters falls back to the compiled pipeline.
+
+Batch Mode:-
+multi_encrypt_batch / multi_decrypt_batch spread many records over a process
+pool in adaptively sized chunks, keep input order and report failures per
+record. Large batches reach the workers through one shared memory block
+instead of being pickled record by record.
+
+Step-by-Step:-
+multi_encrypt_steps / multi_decrypt_steps are generators yielding one Step per
+layer (number, name, label, parameters, output handle). A layer only runs when
+its step is requested, and StepOutput.preview(n) copies just the first n
+characters, so front ends can show truncated intermediates and stop early
+without paying for the rest.
+
+Tracing:-
+Pass tracer=... (see tracing.py) to multi_encrypt / multi_decrypt to receive
+per-layer timings and sizes without printing any payload.
+
+Result Cache:-
+Pass cache=True (the default store) or a resultcache.ResultCache to
+multi_encrypt / multi_decrypt to reuse results across runs and processes.
+Entries are keyed by the input's SHA-256 and hashed keys; on a hit no layer
+runs, so verbose mode shows only the final result.
 """
 
+import binascii
+import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+
 from ciphers import (
     caesar_encrypt, caesar_decrypt,
     vigenere_encrypt, vigenere_decrypt,
     reverse_text,
     ascii_shift, ascii_unshift,
-    base64_encode, base64_decode
+    base64_encode, base64_decode,
+    key_schedule, _caesar_table, _ascii_table, _vigenere_apply
 )
+from tracing import run_layer
 
 
-def multi_encrypt(text: str, caesar_key: int, vig_key: str, ascii_key: int, verbose: bool = True) -> str:
-    #Encrypts text using multiple layers of classical ciphers
+#STEP-BY-STEP
 
-    if verbose:
-        print("\n" + "=" * 60)
-        print("MULTI-LAYER ENCRYPTION PROCESS")
-        print("=" * 60)
-        print(f"Original Text: {text}")
-        print("-" * 60)
+PREVIEW_CHARS = 200  #Default number of characters shown per intermediate step
+
+#One layer of a step-by-step run: step number (1-5), layer name, display label,
+#parameters and a StepOutput handle to the layer's result
+Step = namedtuple("Step", ["step", "layer", "label", "params", "output"])
+
+
+class StepOutput:
+    #Handle to one intermediate result; preview() copies only what is shown
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def preview(self, limit: int = PREVIEW_CHARS) -> str:
+        #The first `limit` characters, with "..." when the result is longer
+        if len(self.text) <= limit:
+            return self.text
+        return self.text[:limit] + "..."
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"StepOutput({self.preview(40)!r}, length={len(self.text)})"
+
+
+def multi_encrypt_steps(text: str, caesar_key: int, vig_key: str, ascii_key: int, tracer=None):
+    #Yields one Step per encryption layer; each layer runs only when its step is requested
 
     #Step 1: Caesar Cipher
-    step1 = caesar_encrypt(text, caesar_key)
-    if verbose:
-        print(f"Step 1 - Caesar Cipher (key={caesar_key}):")
-        print(f"  Result: {step1}")
+    text = run_layer(tracer, "encrypt", 1, "caesar", {"key": caesar_key}, caesar_encrypt, text, caesar_key)
+    yield Step(1, "caesar", f"Caesar Cipher (key={caesar_key})", {"key": caesar_key}, StepOutput(text))
 
     #Step 2: Vigenère Cipher
-    step2 = vigenere_encrypt(step1, vig_key)
-    if verbose:
-        print(f"Step 2 - Vigenère Cipher (keyword='{vig_key}'):")
-        print(f"  Result: {step2}")
+    text = run_layer(tracer, "encrypt", 2, "vigenere", {"keyword": vig_key}, vigenere_encrypt, text, vig_key)
+    yield Step(2, "vigenere", f"Vigenère Cipher (keyword='{vig_key}')", {"keyword": vig_key}, StepOutput(text))
 
     #Step 3: Reverse Text
-    step3 = reverse_text(step2)
-    if verbose:
-        print(f"Step 3 - Reverse Text:")
-        print(f"  Result: {step3}")
+    text = run_layer(tracer, "encrypt", 3, "reverse", {}, reverse_text, text)
+    yield Step(3, "reverse", "Reverse Text", {}, StepOutput(text))
 
     #Step 4: ASCII Shift
-    step4 = ascii_shift(step3, ascii_key)
-    if verbose:
-        print(f"Step 4 - ASCII Shift (shift={ascii_key}):")
-        print(f"  Result: {step4}")
+    text = run_layer(tracer, "encrypt", 4, "ascii", {"shift": ascii_key}, ascii_shift, text, ascii_key)
+    yield Step(4, "ascii", f"ASCII Shift (shift={ascii_key})", {"shift": ascii_key}, StepOutput(text))
 
     #Step 5: Base64 Encode
-    step5 = base64_encode(step4)
+    text = run_layer(tracer, "encrypt", 5, "base64", {}, base64_encode, text)
+    yield Step(5, "base64", "Base64 Encode", {}, StepOutput(text))
+
+
+def multi_decrypt_steps(text: str, caesar_key: int, vig_key: str, ascii_key: int, tracer=None):
+    #Yields one Step per decryption layer; each layer runs only when its step is requested
+
+    #Step 1: Base64 Decode
+    text = run_layer(tracer, "decrypt", 1, "base64", {}, base64_decode, text)
+    yield Step(1, "base64", "Base64 Decode", {}, StepOutput(text))
+
+    #Step 2: ASCII Unshift
+    text = run_layer(tracer, "decrypt", 2, "ascii", {"shift": ascii_key}, ascii_unshift, text, ascii_key)
+    yield Step(2, "ascii", f"ASCII Unshift (shift={ascii_key})", {"shift": ascii_key}, StepOutput(text))
+
+    #Step 3: Reverse Text
+    text = run_layer(tracer, "decrypt", 3, "reverse", {}, reverse_text, text)
+    yield Step(3, "reverse", "Reverse Text", {}, StepOutput(text))
+
+    #Step 4: Vigenère Decrypt
+    text = run_layer(tracer, "decrypt", 4, "vigenere", {"keyword": vig_key}, vigenere_decrypt, text, vig_key)
+    yield Step(4, "vigenere", f"Vigenère Decrypt (keyword='{vig_key}')", {"keyword": vig_key}, StepOutput(text))
+
+    #Step 5: Caesar Decrypt
+    text = run_layer(tracer, "decrypt", 5, "caesar", {"key": caesar_key}, caesar_decrypt, text, caesar_key)
+    yield Step(5, "caesar", f"Caesar Decrypt (key={caesar_key})", {"key": caesar_key}, StepOutput(text))
+
+
+def _run_steps(steps, text: str, verbose: bool) -> str:
+    #Drains a step generator, printing every intermediate result in full when verbose
+    for step in steps:
+        text = step.output.text
+        if verbose:
+            print(f"Step {step.step} - {step.label}:")
+            print(f"  Result: {text}")
+    return text
+
+
+def _cached(cache, direction: str, text: str, keys: tuple, compute, verbose: bool) -> str:
+    #Runs compute() through the persistent result cache (see resultcache.py)
+    import resultcache
+
+    if cache is True:
+        cache = resultcache.open_cache()
+    computed = []
+
+    def compute_once():
+        computed.append(True)
+        return compute()
+
+    result = cache.get_or_compute("multi", direction, text, keys, compute_once)
+    if verbose and not computed:
+        print("(result served from the cache, layers skipped)")
+    return result
+
+
+def multi_encrypt(text: str, caesar_key: int, vig_key: str, ascii_key: int, verbose: bool = True,
+                  tracer=None, cache=None) -> str:
+    #Encrypts text using multiple layers of classical ciphers
+    #tracer: optional callable receiving a tracing.LayerEvent per layer
+    #cache: True or a resultcache.ResultCache to reuse earlier results
+
+    if verbose:
+        print("\n" + "=" * 60)
+        print("MULTI-LAYER ENCRYPTION PROCESS")
+        print("=" * 60)
+        print(f"Original Text: {text}")
+        print("-" * 60)
+
+    def compute():
+        return _run_steps(multi_encrypt_steps(text, caesar_key, vig_key, ascii_key, tracer), text, verbose)
+
+    if cache:
+        result = _cached(cache, "encrypt", text, (caesar_key, vig_key, ascii_key), compute, verbose)
+    else:
+        result = compute()
+
     if verbose:
-        print(f"Step 5 - Base64 Encode:")
-        print(f"  Result: {step5}")
         print("=" * 60)
-        print(f"FINAL ENCRYPTED TEXT: {step5}")
+        print(f"FINAL ENCRYPTED TEXT: {result}")
         print("=" * 60 + "\n")
 
-    return step5
+    return result
 
 
-def multi_decrypt(text: str, caesar_key: int, vig_key: str, ascii_key: int, verbose: bool = True) -> str:
+def multi_decrypt(text: str, caesar_key: int, vig_key: str, ascii_key: int, verbose: bool = True,
+                  tracer=None, cache=None) -> str:
     #Decrypts multi-layer encrypted text by reversing all transformations
+    #tracer: optional callable receiving a tracing.LayerEvent per layer
+    #cache: True or a resultcache.ResultCache to reuse earlier results
 
     if verbose:
         print("\n" + "=" * 60)
@@ -83,40 +228,357 @@ def multi_decrypt(text: str, caesar_key: int, vig_key: str, ascii_key: int, verb
         print(f"Encrypted Text: {text}")
         print("-" * 60)
 
-    #Step 1: Base64 Decode
-    step1 = base64_decode(text)
-    if verbose:
-        print(f"Step 1 - Base64 Decode:")
-        print(f"  Result: {step1}")
+    def compute():
+        return _run_steps(multi_decrypt_steps(text, caesar_key, vig_key, ascii_key, tracer), text, verbose)
 
-    #Step 2: ASCII Unshift
-    step2 = ascii_unshift(step1, ascii_key)
-    if verbose:
-        print(f"Step 2 - ASCII Unshift (shift={ascii_key}):")
-        print(f"  Result: {step2}")
-
-    #Step 3: Reverse Text
-    step3 = reverse_text(step2)
-    if verbose:
-        print(f"Step 3 - Reverse Text:")
-        print(f"  Result: {step3}")
-
-    #Step 4: Vigenère Decrypt
-    step4 = vigenere_decrypt(step3, vig_key)
-    if verbose:
-        print(f"Step 4 - Vigenère Decrypt (keyword='{vig_key}'):")
-        print(f"  Result: {step4}")
+    if cache:
+        result = _cached(cache, "decrypt", text, (caesar_key, vig_key, ascii_key), compute, verbose)
+    else:
+        result = compute()
 
-    #Step 5: Caesar Decrypt
-    step5 = caesar_decrypt(step4, caesar_key)
     if verbose:
-        print(f"Step 5 - Caesar Decrypt (key={caesar_key}):")
-        print(f"  Result: {step5}")
         print("=" * 60)
-        print(f"FINAL DECRYPTED TEXT: {step5}")
+        print(f"FINAL DECRYPTED TEXT: {result}")
         print("=" * 60 + "\n")
 
-    return step5
+    return result
+
+
+#COMPILED (FUSED) PIPELINE
+
+_COMPILED_BLOCK = 1 << 16  #Characters (bytes when decrypting) per block
+_INVALID_BASE64 = "Invalid Base64 input. Please check your ciphertext."
+
+def _combined_tables(caesar_key: int, vig_key: str, direction: int) -> tuple:
+    #Caesar + Vigenère collapsed into one table per keyword phase
+
+    return tuple(
+        _caesar_table(direction * (caesar_key % 26 + shift) % 26)
+        for shift in key_schedule(vig_key).shifts
+    )
+
+
+def multi_encrypt_compiled(text: str, caesar_key: int, vig_key: str, ascii_key: int) -> str:
+    #Same ciphertext as multi_encrypt without a full-size intermediate per layer.
+    #Each block gets Caesar + Vigenère as one periodic shift, is reversed and encoded,
+    #then ASCII Shift runs on its UTF-8 bytes (it only touches bytes 32-126). Blocks
+    #are then taken last to first, which is reversed order, into Base64 and freed.
+
+    tables = _combined_tables(caesar_key, vig_key, 1)
+    ascii_table = _ascii_bytes(ascii_key % 95)
+
+    blocks = []
+    phase = 0
+    for start in range(0, len(text), _COMPILED_BLOCK):
+        block, phase = _vigenere_apply(text[start:start + _COMPILED_BLOCK], tables, phase)
+        blocks.append(block[::-1].encode("utf-8").translate(ascii_table))
+
+    pieces = []
+    carry = b""  #Bytes left over from the last 3-byte Base64 group
+    while blocks:
+        data = carry + blocks.pop()
+        cut = len(data) - len(data) % 3
+        carry = data[cut:]
+        pieces.append(binascii.b2a_base64(data[:cut], newline=False).decode("ascii"))
+    pieces.append(binascii.b2a_base64(carry, newline=False).decode("ascii"))
+    return "".join(pieces)
+
+
+def multi_decrypt_compiled(text: str, caesar_key: int, vig_key: str, ascii_key: int) -> str:
+    #Same plaintext as multi_decrypt without a full-size intermediate per layer.
+    #The decoded bytes are read from the end in blocks split on UTF-8 boundaries,
+    #so each block is already in reversed order: ASCII Unshift on the bytes, then
+    #Vigenère + Caesar (one periodic shift) with the keyword phase carried forward.
+
+    try:
+        data = binascii.a2b_base64(text.encode("utf-8"))
+    except (binascii.Error, UnicodeEncodeError):
+        raise ValueError(_INVALID_BASE64)
+    tables = _combined_tables(caesar_key, vig_key, -1)
+    ascii_table = _ascii_bytes(-ascii_key % 95)
+
+    pieces = []
+    phase = 0
+    end = len(data)
+    while end:
+        start = max(0, end - _COMPILED_BLOCK)
+        while start and 0x80 <= data[start] < 0xC0 and end - start <= _COMPILED_BLOCK + 3:
+            start -= 1  #Back to the first byte of the character (up to 3 continuation bytes)
+        try:
+            block = data[start:end].translate(ascii_table).decode("utf-8")
+        except UnicodeDecodeError:
+            raise ValueError(_INVALID_BASE64)
+        block, phase = _vigenere_apply(block[::-1], tables, phase)
+        pieces.append(block)
+        end = start
+    del data
+    return "".join(pieces)
+
+
+#BUFFER (IN-PLACE) PIPELINE
+#ASCII-only: every layer maps a byte to a byte, so a single bytearray carries
+#the text from encoding to Base64 and only block-sized scratch copies are made.
+
+_BUFFER_BLOCK = 1 << 16  #Bytes rewritten per step, bounds the scratch copies
+_BASE64_BLOCK = 3 << 14  #Bytes Base64-encoded per step; a multiple of 3, so only the last block pads
+_LETTERS = frozenset(range(ord('A'), ord('Z') + 1)) | frozenset(range(ord('a'), ord('z') + 1))
+_NON_LETTERS = bytes(code for code in range(256) if code not in _LETTERS)
+_LETTER_RUN = re.compile(rb"[A-Za-z]+")
+
+
+@lru_cache(maxsize=None)
+def _ascii_bytes(shift: int) -> bytes:
+    #_ascii_table as a bytes.translate table (shift normalized to 0-94)
+    table = _ascii_table(shift)
+    return bytes(table.get(code, code) for code in range(256))
+
+
+@lru_cache(maxsize=None)
+def _letter_bytes(shift: int, ascii_shift: int = 0) -> bytes:
+    #Letter shift (0-25) followed by an optional ASCII shift, as a bytes.translate table
+    letters = _caesar_table(shift)
+    ascii_table = _ascii_bytes(ascii_shift)
+    return bytes(ascii_table[letters.get(code, code)] for code in range(256))
+
+
+def _shift_block(view: memoryview, start: int, end: int, letter_tables: tuple, phase: int,
+                 before: bytes = None, after: bytes = None) -> int:
+    #Rewrites view[start:end] in place: the `before` table, then the per-phase letter
+    #tables (already composed with `after`), then `after` on everything else.
+    #Only letters advance the keyword phase; returns the next phase.
+
+    block = view[start:end].tobytes()
+    if before:
+        block = block.translate(before)
+    period = len(letter_tables)
+
+    letters = block.translate(None, _NON_LETTERS)
+    if not letters:
+        view[start:end] = block.translate(after) if after else block
+        return phase
+
+    shifted = bytearray(letters)
+    for offset in range(period):
+        shifted[offset::period] = letters[offset::period].translate(letter_tables[(phase + offset) % period])
+    next_phase = (phase + len(letters)) % period
+
+    if len(letters) == len(block):
+        view[start:end] = shifted
+        return next_phase
+
+    #Non-letters first, then the shifted letters back into their runs
+    view[start:end] = block.translate(after) if after else block
+    taken = 0
+    for run in _LETTER_RUN.finditer(block):
+        run_start, run_end = run.span()
+        view[start + run_start:start + run_end] = shifted[taken:taken + run_end - run_start]
+        taken += run_end - run_start
+    return next_phase
+
+
+def _shift_buffer(buffer: bytearray, letter_tables: tuple, before: bytes = None, after: bytes = None):
+    #Applies _shift_block over the whole buffer, carrying the keyword phase
+
+    with memoryview(buffer) as view:
+        if len(letter_tables) == 1:
+            #One phase: letters and non-letters fold into a single table
+            table = bytes(letter_tables[0][code] if code in _LETTERS else (after[code] if after else code)
+                          for code in range(256))
+            if before:
+                table = bytes(table[before[code]] for code in range(256))
+            for start in range(0, len(buffer), _BUFFER_BLOCK):
+                end = min(start + _BUFFER_BLOCK, len(buffer))
+                view[start:end] = view[start:end].tobytes().translate(table)
+            return
+
+        phase = 0
+        for start in range(0, len(buffer), _BUFFER_BLOCK):
+            phase = _shift_block(view, start, min(start + _BUFFER_BLOCK, len(buffer)),
+                                 letter_tables, phase, before, after)
+
+
+def _combined_shifts(caesar_key: int, vig_key: str, direction: int) -> tuple:
+    #Caesar + Vigenère as one letter shift (0-25) per keyword phase
+    return tuple(direction * (caesar_key % 26 + shift) % 26 for shift in key_schedule(vig_key).shifts)
+
+
+def multi_encrypt_buffer(text: str, caesar_key: int, vig_key: str, ascii_key: int) -> str:
+    #Same ciphertext as multi_encrypt, built in one bytearray for ASCII text
+
+    shifts = _combined_shifts(caesar_key, vig_key, 1)
+    if not text.isascii():
+        return multi_encrypt_compiled(text, caesar_key, vig_key, ascii_key)
+
+    ascii_key %= 95
+    #Encoded block by block: bytearray(text, "ascii") would hold a full bytes copy as well
+    buffer = bytearray(len(text))
+    with memoryview(buffer) as view:
+        for start in range(0, len(text), _BUFFER_BLOCK):
+            view[start:start + _BUFFER_BLOCK] = text[start:start + _BUFFER_BLOCK].encode("ascii")
+
+    #Caesar + Vigenère + ASCII Shift in one in-place pass, then Reverse in place
+    _shift_buffer(buffer, tuple(_letter_bytes(shift, ascii_key) for shift in shifts), after=_ascii_bytes(ascii_key))
+    buffer.reverse()
+
+    #Base64 block by block into the output buffer; one b2a_base64 call over-allocates
+    #its result to twice the input
+    encoded = bytearray((len(buffer) + 2) // 3 * 4)
+    with memoryview(buffer) as view, memoryview(encoded) as output:
+        for start in range(0, len(buffer), _BASE64_BLOCK):
+            piece = binascii.b2a_base64(view[start:start + _BASE64_BLOCK], newline=False)
+            output[start // 3 * 4:start // 3 * 4 + len(piece)] = piece
+    del buffer
+    return encoded.decode("ascii")
+
+
+def multi_decrypt_buffer(text: str, caesar_key: int, vig_key: str, ascii_key: int) -> str:
+    #Same plaintext as multi_decrypt, recovered in one bytearray for ASCII payloads
+
+    shifts = _combined_shifts(caesar_key, vig_key, -1)
+    if not text.isascii():
+        return multi_decrypt_compiled(text, caesar_key, vig_key, ascii_key)
+
+    try:
+        buffer = bytearray(binascii.a2b_base64(text))
+    except binascii.Error:
+        raise ValueError("Invalid Base64 input. Please check your ciphertext.")
+    if not buffer.isascii():
+        #Non-ASCII plaintext: let the str pipeline handle the UTF-8
+        del buffer
+        return multi_decrypt_compiled(text, caesar_key, vig_key, ascii_key)
+
+    #Reverse in place, then ASCII Unshift + Vigenère + Caesar Decrypt in one pass
+    buffer.reverse()
+    _shift_buffer(buffer, tuple(_letter_bytes(shift) for shift in shifts), before=_ascii_bytes(-ascii_key % 95))
+    return buffer.decode("ascii")
+
+
+#BATCH PROCESSING
+
+#One result per record, in input order; error is None on success
+BatchResult = namedtuple("BatchResult", ["value", "error"])
+
+SHARED_MEMORY_THRESHOLD = 1 << 20  #Batches at least this large travel via shared memory
+_RECORD_OVERHEAD = 256  #Approximate fixed cost of a record, in bytes of text
+_CHUNKS_PER_WORKER = 4
+
+_BATCH_OPERATIONS = {
+    "encrypt": multi_encrypt_compiled,
+    "decrypt": multi_decrypt_compiled,
+}
+
+
+def _run_records(operation: str, records: list, keys: tuple) -> list:
+    #Runs one operation over records, capturing failures per record
+    func = _BATCH_OPERATIONS[operation]
+    results = []
+    for record in records:
+        try:
+            results.append(BatchResult(func(record, *keys), None))
+        except Exception as e:
+            results.append(BatchResult(None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def _run_shared_chunk(operation: str, shm_name: str, spans: list, keys: tuple) -> list:
+    #Worker side: decodes its records straight out of the shared block
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        records = [bytes(shm.buf[start:end]).decode("utf-8", "surrogatepass") for start, end in spans]
+    finally:
+        shm.close()
+    return _run_records(operation, records, keys)
+
+
+def _plan_chunks(sizes: list, workers: int) -> list:
+    #Splits record indices into (start, stop) ranges of roughly equal work
+    target = max(1, (sum(sizes) + _RECORD_OVERHEAD * len(sizes)) // (workers * _CHUNKS_PER_WORKER))
+    chunks = []
+    start = 0
+    work = 0
+    for index, size in enumerate(sizes):
+        work += size + _RECORD_OVERHEAD
+        if work >= target:
+            chunks.append((start, index + 1))
+            start = index + 1
+            work = 0
+    if start < len(sizes):
+        chunks.append((start, len(sizes)))
+    return chunks
+
+
+def _run_batch(operation: str, records, keys: tuple, workers) -> list:
+    #The pool machinery is imported here so plain encrypt/decrypt callers never load it
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    records = list(records)
+    _combined_tables(keys[0], keys[1], 1)  #Invalid keys fail the batch up front
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(records) < 2:
+        return _run_records(operation, records, keys)
+
+    #Encode once; records that are not str are reported without being sent
+    #(an unpicklable one would otherwise fail its whole chunk)
+    payloads = []
+    failed = {}
+    for index, record in enumerate(records):
+        if isinstance(record, str):
+            payloads.append(record.encode("utf-8", "surrogatepass"))
+        else:
+            failed[index] = _run_records(operation, [record], keys)[0]
+            records[index] = ""
+            payloads.append(b"")
+
+    sizes = [len(payload) for payload in payloads]
+    chunks = _plan_chunks(sizes, workers)
+    results = []
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        if sum(sizes) < SHARED_MEMORY_THRESHOLD:
+            futures = [
+                pool.submit(_run_records, operation, records[start:stop], keys)
+                for start, stop in chunks
+            ]
+            for future in futures:
+                results.extend(future.result())
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=max(1, sum(sizes)))
+            try:
+                spans = []
+                offset = 0
+                for payload in payloads:
+                    shm.buf[offset:offset + len(payload)] = payload
+                    spans.append((offset, offset + len(payload)))
+                    offset += len(payload)
+                del payloads
+
+                futures = [
+                    pool.submit(_run_shared_chunk, operation, shm.name, spans[start:stop], keys)
+                    for start, stop in chunks
+                ]
+                for future in futures:
+                    results.extend(future.result())
+            finally:
+                shm.close()
+                shm.unlink()
+
+    for index, result in failed.items():
+        results[index] = result
+    return results
+
+
+def multi_encrypt_batch(records, caesar_key: int, vig_key: str, ascii_key: int, workers: int = None) -> list:
+    #Encrypts many records in parallel; returns one BatchResult per record, in order
+    return _run_batch("encrypt", records, (caesar_key, vig_key, ascii_key), workers)
+
+
+def multi_decrypt_batch(records, caesar_key: int, vig_key: str, ascii_key: int, workers: int = None) -> list:
+    #Decrypts many records in parallel; returns one BatchResult per record, in order
+    return _run_batch("decrypt", records, (caesar_key, vig_key, ascii_key), workers)
 
 
 def test_multi_layer():
@@ -0,0 +1,202 @@
+"""
+parallel.py - Multi-Core Ciphers for One Large Input
+Splits a single large string or file into chunks and runs Caesar, Vigenère or
+ASCII Shift on them in a process pool. Output is identical to the sequential
+functions in ciphers.py.
+
+Caesar and ASCII Shift are position-independent: every chunk is transformed on
+its own and the results are concatenated.
+
+Vigenère is not: the keyword index only advances on alphabetic characters, so
+the phase a chunk starts at depends on every letter before it. It runs in two
+rounds over the same chunks:
+1. Each worker counts the letters in its chunk
+2. A prefix sum of the counts (mod the keyword length) gives every chunk its
+   starting phase, and the chunks are encrypted independently from there
+
+    parallel.vigenere_encrypt_parallel(text, "KEY", workers=8)
+    parallel.run_parallel_file("caesar", "decrypt", "big.txt.enc", "big.txt", 3)
+
+The input reaches the workers once, through the pool initializer (inherited
+for free where processes are forked); tasks are only (start, stop) spans.
+Files are split on UTF-8 character boundaries and every worker reads its own
+byte range. Chunks are at most MAX_CHUNK and only two per worker are in
+flight, so for files the parent holds a bounded window of results however
+large the input is. Inputs below PARALLEL_THRESHOLD, or workers=1, run
+sequentially.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import registry
+from ciphers import key_schedule, _vigenere_apply
+from streaming import _count_letters, _write_all
+
+PARALLEL_THRESHOLD = 4 << 20  #Characters (or bytes for files) below which the pool is skipped
+MIN_CHUNK = 1 << 20  #Smallest chunk handed to a worker
+MAX_CHUNK = 16 << 20  #Largest chunk; huge inputs get more chunks, not bigger ones
+_CHUNKS_PER_WORKER = 4
+
+#Operations whose chunks need a starting phase from the letter prefix count
+PHASED = {"vigenere"}
+
+
+_shared = {}  #The text or file path, handed to pool workers once via the initializer
+
+
+def _init_worker(shared: dict):
+    _shared.update(shared)
+
+
+#WORKERS
+
+def _chunk_text(start: int, stop: int) -> str:
+    if "text" in _shared:
+        return _shared["text"][start:stop]
+    with open(_shared["path"], "rb") as file:
+        file.seek(start)
+        return file.read(stop - start).decode("utf-8")
+
+
+def _count_chunk(start: int, stop: int) -> int:
+    #Round 1: letters in the chunk, i.e. how far it advances the keyword
+    return _count_letters(_chunk_text(start, stop))
+
+
+def _apply(operation: str, direction: str, text: str, param, phase: int = 0) -> str:
+    if operation in PHASED:
+        schedule = key_schedule(param)
+        tables = schedule.encrypt_tables if direction == "encrypt" else schedule.decrypt_tables
+        return _vigenere_apply(text, tables, phase)[0]
+    return registry.get(operation).function(direction)(text, param)
+
+
+def _transform_chunk(operation: str, direction: str, param, start: int, stop: int, phase: int):
+    #Round 2: the chunk's result (UTF-8 bytes when working on a file)
+    result = _apply(operation, direction, _chunk_text(start, stop), param, phase)
+    return result if "text" in _shared else result.encode("utf-8")
+
+
+#SCHEDULING
+
+def _spans(boundaries: list) -> list:
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def _text_boundaries(length: int, workers: int) -> list:
+    #At least _CHUNKS_PER_WORKER chunks per worker when they stay above MIN_CHUNK,
+    #and as many as it takes to keep every chunk within MAX_CHUNK
+    count = max(1, min(workers * _CHUNKS_PER_WORKER, length // MIN_CHUNK), -(-length // MAX_CHUNK))
+    return [length * index // count for index in range(count + 1)]
+
+
+def _file_boundaries(path, size: int, workers: int) -> list:
+    #Even byte offsets, each moved forward past UTF-8 continuation bytes
+    boundaries = [0]
+    with open(path, "rb") as file:
+        for offset in _text_boundaries(size, workers)[1:-1]:
+            file.seek(offset)
+            head = file.read(4)
+            skip = 0
+            while skip < len(head) and 0x80 <= head[skip] < 0xC0:
+                skip += 1
+            if offset + skip > boundaries[-1]:
+                boundaries.append(offset + skip)
+    if size > boundaries[-1]:
+        boundaries.append(size)
+    return boundaries
+
+
+def _phases(pool, operation: str, param, spans: list) -> list:
+    #Starting keyword phase of every chunk (all zero for position-independent operations)
+    if operation not in PHASED:
+        return [0] * len(spans)
+    period = len(key_schedule(param).shifts)
+    counts = pool.map(_count_chunk, *zip(*spans))
+    phases = [0]
+    for count in counts:
+        phases.append((phases[-1] + count) % period)
+    return phases[:-1]
+
+
+def _run_chunks(pool, workers: int, operation: str, direction: str, param, spans: list):
+    #Yields chunk results in order, keeping at most two chunks in flight per worker
+    phases = _phases(pool, operation, param, spans)
+    window = workers * 2
+    pending = []
+    for (start, stop), phase in zip(spans, phases):
+        pending.append(pool.submit(_transform_chunk, operation, direction, param, start, stop, phase))
+        if len(pending) >= window:
+            yield pending.pop(0).result()
+    for future in pending:
+        yield future.result()
+
+
+def _check(operation: str, direction: str, param):
+    #Unknown operations and bad keys fail before any worker starts
+    if not registry.get(operation).supports("parallel"):
+        raise ValueError(f"Unsupported parallel operation: {operation} ({direction}).")
+    if operation in PHASED:
+        key_schedule(param)
+
+
+#PUBLIC API
+
+def run_parallel(operation: str, direction: str, text: str, param, workers: int = None) -> str:
+    #Same result as the sequential cipher function, computed on a process pool
+    _check(operation, direction, param)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(text) < PARALLEL_THRESHOLD:
+        return registry.get(operation).function(direction)(text, param)
+
+    spans = _spans(_text_boundaries(len(text), workers))
+    workers = min(workers, len(spans))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=({"text": text},)) as pool:
+        return "".join(_run_chunks(pool, workers, operation, direction, param, spans))
+
+
+def run_parallel_file(operation: str, direction: str, source_path, output_path, param,
+                      workers: int = None) -> int:
+    #Transforms a UTF-8 file into output_path on a process pool; returns bytes written
+    _check(operation, direction, param)
+    source_path = os.fspath(source_path)
+    size = os.path.getsize(source_path)
+    workers = workers or os.cpu_count() or 1
+    spans = [] if workers == 1 or size < PARALLEL_THRESHOLD else _spans(_file_boundaries(source_path, size, workers))
+    if len(spans) < 2:
+        return _write_all(registry.get(operation).stream(direction)(source_path, param), output_path)
+
+    written = 0
+    with open(output_path, "wb") as sink:
+        workers = min(workers, len(spans))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=({"path": source_path},)) as pool:
+            for chunk in _run_chunks(pool, workers, operation, direction, param, spans):
+                written += sink.write(chunk)
+    return written
+
+
+def caesar_encrypt_parallel(text: str, key: int, workers: int = None) -> str:
+    return run_parallel("caesar", "encrypt", text, key, workers)
+
+
+def caesar_decrypt_parallel(text: str, key: int, workers: int = None) -> str:
+    return run_parallel("caesar", "decrypt", text, key, workers)
+
+
+def vigenere_encrypt_parallel(text: str, keyword: str, workers: int = None) -> str:
+    return run_parallel("vigenere", "encrypt", text, keyword, workers)
+
+
+def vigenere_decrypt_parallel(text: str, keyword: str, workers: int = None) -> str:
+    return run_parallel("vigenere", "decrypt", text, keyword, workers)
+
+
+def ascii_shift_parallel(text: str, shift_val: int, workers: int = None) -> str:
+    return run_parallel("ascii", "encrypt", text, shift_val, workers)
+
+
+def ascii_unshift_parallel(text: str, shift_val: int, workers: int = None) -> str:
+    return run_parallel("ascii", "decrypt", text, shift_val, workers)
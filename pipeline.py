@@ -0,0 +1,208 @@
+"""
+pipeline.py - Configurable Layer Pipelines
+A Pipeline chains any ordered list of layers from ciphers.py with their keys:
+
+    Pipeline([("caesar", 3), ("vigenere", "KEY"), "reverse", ("ascii", 2), "base64"])
+
+Layers can also be given as the cipher functions themselves, e.g.
+(caesar_encrypt, 3) or reverse_text. The inverse pipeline (for decryption)
+is derived automatically: layers run in reverse order, each one inverted.
+
+Compilation:-
+Before running, a pipeline is compiled into a Plan that holds the normalized
+keys and the translation tables. Adjacent layers are collapsed where the
+algebra allows it (Caesar/Vigenère shifts merge into one periodic shift, ASCII
+shifts add up, two Reverse layers cancel). Plans live in a bounded LRU cache
+keyed by the normalized layer spec, so services that reuse a few key profiles
+pay the setup cost once.
+"""
+
+from collections import namedtuple
+from math import gcd
+
+from ciphers import (
+    caesar_encrypt, caesar_decrypt,
+    vigenere_encrypt, vigenere_decrypt,
+    reverse_text,
+    ascii_shift, ascii_unshift,
+    base64_encode, base64_decode,
+    key_schedule, _caesar_table, _ascii_table, _vigenere_apply
+)
+from lru import LRUCache
+
+#A layer: cipher name, its key (None for keyless layers) and whether it runs inverted
+Layer = namedtuple("Layer", ["name", "key", "inverse"])
+
+LAYER_NAMES = ("caesar", "vigenere", "reverse", "ascii", "base64")
+
+_FUNCTION_LAYERS = {
+    caesar_encrypt: ("caesar", False),
+    caesar_decrypt: ("caesar", True),
+    vigenere_encrypt: ("vigenere", False),
+    vigenere_decrypt: ("vigenere", True),
+    reverse_text: ("reverse", False),
+    ascii_shift: ("ascii", False),
+    ascii_unshift: ("ascii", True),
+    base64_encode: ("base64", False),
+    base64_decode: ("base64", True),
+}
+
+PLAN_CACHE_SIZE = 256
+_plan_cache = LRUCache(PLAN_CACHE_SIZE)
+
+
+#LAYER SPECS
+
+def _parse_layer(entry) -> Layer:
+    #Accepts "name", (name, key), (function, key), function, or a Layer
+    if isinstance(entry, Layer):
+        layer = entry
+    else:
+        name, key = (entry, None) if not isinstance(entry, tuple) else entry
+        inverse = False
+        if callable(name):
+            if name not in _FUNCTION_LAYERS:
+                raise ValueError(f"{getattr(name, '__name__', name)} is not a pipeline layer.")
+            name, inverse = _FUNCTION_LAYERS[name]
+        layer = Layer(name, key, inverse)
+
+    if layer.name not in LAYER_NAMES:
+        raise ValueError(f"Unknown layer '{layer.name}'. Choose from: {', '.join(LAYER_NAMES)}.")
+    if layer.name in ("caesar", "vigenere", "ascii") and layer.key is None:
+        raise ValueError(f"Layer '{layer.name}' needs a key.")
+    return layer
+
+
+def _normalize(layer: Layer) -> tuple:
+    #Reduces a layer to an (operation, argument) step with a canonical key
+    sign = -1 if layer.inverse else 1
+
+    if layer.name == "caesar":
+        return "shift", (sign * layer.key % 26,)
+    if layer.name == "vigenere":
+        return "shift", tuple(sign * shift % 26 for shift in key_schedule(layer.key).shifts)
+    if layer.name == "ascii":
+        return "ascii", sign * layer.key % 95
+    if layer.name == "reverse":
+        return "reverse", None
+    return ("b64decode" if layer.inverse else "b64encode"), None
+
+
+def _merge_shifts(first: tuple, second: tuple) -> tuple:
+    #Two periodic shifts over the same letters are one shift with the lcm period
+    period = len(first) * len(second) // gcd(len(first), len(second))
+    merged = tuple((first[i % len(first)] + second[i % len(second)]) % 26 for i in range(period))
+
+    #Keep the shortest repeating period
+    for size in range(1, period + 1):
+        if period % size == 0 and merged == merged[:size] * (period // size):
+            return merged[:size]
+    return merged
+
+
+def _fuse(steps: list) -> tuple:
+    #Collapses adjacent steps that compose into one and drops zero ASCII shifts
+    fused = []
+    for operation, argument in steps:
+        if fused and fused[-1][0] == operation:
+            previous = fused.pop()[1]
+            if operation == "shift":
+                argument = _merge_shifts(previous, argument)
+            elif operation == "ascii":
+                argument = (previous + argument) % 95
+            elif operation == "reverse":
+                continue
+            else:
+                fused.append((operation, previous))
+
+        #Zero ASCII shifts are identities; zero letter shifts are not (they fold Unicode letters into A-Z/a-z)
+        if operation == "ascii" and argument == 0:
+            continue
+        fused.append((operation, argument))
+    return tuple(fused)
+
+
+#COMPILED PLANS
+
+class Plan:
+    #A compiled pipeline: fused steps with their tables, ready to run
+
+    def __init__(self, steps: tuple):
+        self.steps = steps
+        self._functions = [self._compile_step(operation, argument) for operation, argument in steps]
+
+    @staticmethod
+    def _compile_step(operation: str, argument):
+        if operation == "shift":
+            tables = tuple(_caesar_table(shift) for shift in argument)
+            return lambda text: _vigenere_apply(text, tables)[0]
+        if operation == "ascii":
+            table = _ascii_table(argument)
+            return lambda text: text.translate(table)
+        if operation == "reverse":
+            return reverse_text
+        if operation == "b64encode":
+            return base64_encode
+        return base64_decode
+
+    def __call__(self, text: str) -> str:
+        for function in self._functions:
+            text = function(text)
+        return text
+
+    def __repr__(self) -> str:
+        return f"Plan({list(self.steps)})"
+
+
+def compile_plan(layers) -> Plan:
+    #Returns the cached Plan for a layer list, compiling it on first use
+    spec = tuple(_parse_layer(entry) for entry in layers)
+    return _plan_cache.get_or_create(spec, lambda: Plan(_fuse([_normalize(layer) for layer in spec])))
+
+
+def plan_cache_info():
+    #Hit/miss/eviction counters of the plan cache
+    return _plan_cache.info()
+
+
+def clear_plan_cache():
+    #Empties the plan cache and resets its counters
+    _plan_cache.clear()
+
+
+#PIPELINE
+
+class Pipeline:
+    #An ordered list of cipher layers with automatic inverse
+
+    def __init__(self, layers):
+        self.layers = tuple(_parse_layer(entry) for entry in layers)
+
+    def inverse(self) -> "Pipeline":
+        #The pipeline that undoes this one
+        return Pipeline(Layer(layer.name, layer.key, not layer.inverse) for layer in reversed(self.layers))
+
+    def compile(self) -> Plan:
+        return compile_plan(self.layers)
+
+    def encrypt(self, text: str) -> str:
+        #Runs the layers in order
+        return self.compile()(text)
+
+    def decrypt(self, text: str) -> str:
+        #Runs the inverse pipeline
+        return self.inverse().compile()(text)
+
+    def __repr__(self) -> str:
+        return f"Pipeline({[tuple(layer) for layer in self.layers]})"
+
+
+def multi_layer_pipeline(caesar_key: int, vig_key: str, ascii_key: int) -> Pipeline:
+    #The pipeline used by multi_encrypt / multi_decrypt
+    return Pipeline([
+        ("caesar", caesar_key),
+        ("vigenere", vig_key),
+        "reverse",
+        ("ascii", ascii_key),
+        "base64",
+    ])
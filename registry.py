@@ -0,0 +1,237 @@
+"""
+registry.py - Cipher Registry
+One declaration per cipher: its name, menu label, parameters, capabilities
+and where its encrypt / decrypt / stream callables live. The callables are
+given as "module:attribute" references and imported on first use, so a front
+end that lists the menu (or runs one Caesar shift) does not pay for the
+multi-layer, streaming, NumPy or cryptanalysis modules.
+
+    cipher = registry.get("vigenere")
+    cipher.params              #(Param("keyword", "Keyword", str, ""),)
+    cipher.encrypt(text, "KEY")
+    cipher.stream("decrypt")   #Chunk iterator factory from streaming.py
+
+Capabilities:-
+- decrypt  : has an inverse (SHA-256 does not)
+- stream   : has chunked stream callables (streaming.py)
+- steps    : yields intermediate layers (multilayer.py step generators)
+- vectorized / parallel / mmap / analysis : optional NumPy, multi-core
+  (parallel.py), in-place file (mmapfile.py) and cryptanalysis backends
+
+Menus:-
+MENUS lists each front end's interactive menu in its own order; a cipher's
+menu_labels override its label in a given menu.
+"""
+
+import importlib
+from collections import namedtuple
+from functools import partial
+
+#One cipher parameter: keyword-style name, UI label, type and default value
+Param = namedtuple("Param", ["name", "label", "type", "default"])
+
+
+class _Ref:
+    #Lazy "module:attribute" reference; keyword arguments are bound with partial
+
+    def __init__(self, target: str, **kwargs):
+        self.module, _, self.attribute = target.partition(":")
+        self.kwargs = kwargs
+        self._value = None
+
+    def resolve(self):
+        if self._value is None:
+            value = getattr(importlib.import_module(self.module), self.attribute)
+            self._value = partial(value, **self.kwargs) if self.kwargs else value
+        return self._value
+
+
+class Cipher:
+    #A registered cipher; callables are imported when first used
+
+    def __init__(self, name: str, label: str, params: tuple = (), encrypt: str = None, decrypt: str = None,
+                 stream_encrypt: _Ref = None, stream_decrypt: _Ref = None, steps: tuple = None,
+                 backends: dict = None, menu_labels: dict = None, stream_cost: dict = None):
+        self.name = name
+        self.label = label
+        self.params = params
+        self.menu_labels = menu_labels or {}
+        #direction -> (passes over the source, output size / input size); default (1, 1)
+        self._stream_cost = stream_cost or {}
+        self._encrypt = _Ref(encrypt)
+        self._decrypt = _Ref(decrypt) if decrypt else None
+        self._streams = {"encrypt": stream_encrypt, "decrypt": stream_decrypt}
+        self._steps = {"encrypt": _Ref(steps[0]), "decrypt": _Ref(steps[1])} if steps else None
+        self._backends = {
+            kind: {direction: _Ref(target) if isinstance(target, str) else target
+                   for direction, target in targets.items()}
+            for kind, targets in (backends or {}).items()
+        }
+
+        capabilities = set(self._backends)
+        if decrypt:
+            capabilities.add("decrypt")
+        if stream_encrypt:
+            capabilities.add("stream")
+        if steps:
+            capabilities.add("steps")
+        self.capabilities = frozenset(capabilities)
+
+    def supports(self, capability: str) -> bool:
+        return capability in self.capabilities
+
+    @property
+    def encrypt(self):
+        return self._encrypt.resolve()
+
+    @property
+    def decrypt(self):
+        if self._decrypt is None:
+            raise ValueError(f"{self.label} cannot be decrypted.")
+        return self._decrypt.resolve()
+
+    def function(self, direction: str):
+        #encrypt or decrypt by name
+        return self.encrypt if direction == "encrypt" else self.decrypt
+
+    def stream(self, direction: str):
+        #Chunk iterator factory: factory(source, *params, chunk_size=...) yields bytes
+        reference = self._streams.get(direction)
+        if reference is None:
+            raise ValueError(f"{self.label} cannot {direction} as a stream.")
+        return reference.resolve()
+
+    def stream_cost(self, direction: str) -> tuple:
+        #(passes the stream makes over its source, output size / input size), for progress estimates
+        return self._stream_cost.get(direction, (1, 1))
+
+    def menu_label(self, menu: str) -> str:
+        return self.menu_labels.get(menu, self.label)
+
+    def steps(self, direction: str):
+        #Step generator (see multilayer.multi_encrypt_steps)
+        if self._steps is None:
+            raise ValueError(f"{self.label} has no intermediate steps.")
+        return self._steps[direction].resolve()
+
+    def backend(self, kind: str, direction: str = "encrypt"):
+        #Optional backend callable, e.g. backend("vectorized") or backend("analysis")
+        if kind not in self._backends or direction not in self._backends[kind]:
+            raise ValueError(f"{self.label} has no {kind} backend for {direction}.")
+        return self._backends[kind][direction].resolve()
+
+    def __repr__(self) -> str:
+        return f"Cipher({self.name!r}, capabilities={sorted(self.capabilities)})"
+
+
+CIPHERS = {cipher.name: cipher for cipher in (
+    Cipher(
+        "caesar", "Caesar Cipher",
+        (Param("key", "Shift Key", int, 3),),
+        "ciphers:caesar_encrypt", "ciphers:caesar_decrypt",
+        _Ref("streaming:iter_caesar"), _Ref("streaming:iter_caesar", decrypt=True),
+        backends={
+            "vectorized": {"encrypt": "vectorized:caesar_encrypt", "decrypt": "vectorized:caesar_decrypt"},
+            "parallel": {"encrypt": "parallel:caesar_encrypt_parallel", "decrypt": "parallel:caesar_decrypt_parallel"},
+            "mmap": {"encrypt": _Ref("mmapfile:caesar_file"), "decrypt": _Ref("mmapfile:caesar_file", decrypt=True)},
+            "analysis": {"decrypt": "cryptanalysis:break_caesar"},
+        },
+    ),
+    Cipher(
+        "vigenere", "Vigenère Cipher",
+        (Param("keyword", "Keyword", str, ""),),
+        "ciphers:vigenere_encrypt", "ciphers:vigenere_decrypt",
+        _Ref("streaming:iter_vigenere"), _Ref("streaming:iter_vigenere", decrypt=True),
+        backends={
+            "vectorized": {"encrypt": "vectorized:vigenere_encrypt", "decrypt": "vectorized:vigenere_decrypt"},
+            "parallel": {"encrypt": "parallel:vigenere_encrypt_parallel", "decrypt": "parallel:vigenere_decrypt_parallel"},
+            "mmap": {"encrypt": _Ref("mmapfile:vigenere_file"), "decrypt": _Ref("mmapfile:vigenere_file", decrypt=True)},
+            "analysis": {"decrypt": "cryptanalysis:break_vigenere"},
+        },
+    ),
+    Cipher(
+        "reverse", "Reverse Text", (),
+        "ciphers:reverse_text", "ciphers:reverse_text",
+        _Ref("streaming:iter_reverse"), _Ref("streaming:iter_reverse"),
+        backends={
+            "mmap": {"encrypt": "mmapfile:reverse_file", "decrypt": "mmapfile:reverse_file"},
+        },
+        menu_labels={"web": "Reverse Cipher"},
+    ),
+    Cipher(
+        "ascii", "ASCII Shift",
+        (Param("shift", "ASCII Shift Value", int, 5),),
+        "ciphers:ascii_shift", "ciphers:ascii_unshift",
+        _Ref("streaming:iter_ascii_shift"), _Ref("streaming:iter_ascii_shift", unshift=True),
+        backends={
+            "vectorized": {"encrypt": "vectorized:ascii_shift", "decrypt": "vectorized:ascii_unshift"},
+            "parallel": {"encrypt": "parallel:ascii_shift_parallel", "decrypt": "parallel:ascii_unshift_parallel"},
+            "mmap": {"encrypt": _Ref("mmapfile:ascii_shift_file"), "decrypt": _Ref("mmapfile:ascii_shift_file", unshift=True)},
+        },
+    ),
+    Cipher(
+        "base64", "Base64 Encoding", (),
+        "ciphers:base64_encode", "ciphers:base64_decode",
+        _Ref("streaming:iter_base64_encode"), _Ref("streaming:iter_base64_decode"),
+        stream_cost={"encrypt": (1, 4 / 3), "decrypt": (1, 3 / 4)},
+    ),
+    Cipher(
+        "multi", "Multi-Layer Encryption",
+        (
+            Param("caesar_key", "Caesar Shift", int, 3),
+            Param("vig_key", "Vigenère Keyword", str, "KEY"),
+            Param("ascii_key", "ASCII Shift", int, 5),
+        ),
+        "multilayer:multi_encrypt_compiled", "multilayer:multi_decrypt_compiled",
+        _Ref("streaming:iter_multi_encrypt"), _Ref("streaming:iter_multi_decrypt"),
+        steps=("multilayer:multi_encrypt_steps", "multilayer:multi_decrypt_steps"),
+        backends={
+            "analysis": {"decrypt": "cryptanalysis:solve_multi_layer_keys"},
+        },
+        menu_labels={"terminal": "Multi-Layer Encryption (All Combined)"},
+        stream_cost={"encrypt": (2, 4 / 3), "decrypt": (1, 3 / 4)},
+    ),
+    Cipher(
+        "sha256", "SHA-256 Hashing", (),
+        "ciphers:generate_sha256", None,
+        _Ref("streaming:iter_sha256"), None,
+        stream_cost={"encrypt": (1, 0)},
+    ),
+)}
+
+#Interactive menus: cipher names in each front end's order
+MENUS = {
+    "terminal": ("caesar", "vigenere", "reverse", "ascii", "base64", "multi"),
+    "web": ("caesar", "reverse", "ascii", "vigenere", "base64", "multi", "sha256"),
+}
+
+
+def get(name: str) -> Cipher:
+    #Looks a cipher up by name
+    if name not in CIPHERS:
+        raise ValueError(f"Unknown cipher '{name}'. Choose from: {', '.join(CIPHERS)}.")
+    return CIPHERS[name]
+
+
+def menu(name: str) -> list:
+    #The ciphers of a front end's menu (see MENUS), in menu order
+    return [CIPHERS[cipher] for cipher in MENUS[name]]
+
+
+def by_label(label: str, menu_name: str = None) -> Cipher:
+    #Looks a cipher up by its label (or its label in the given menu)
+    for cipher in (menu(menu_name) if menu_name else CIPHERS.values()):
+        if (cipher.menu_label(menu_name) if menu_name else cipher.label) == label:
+            return cipher
+    raise ValueError(f"Unknown cipher '{label}'.")
+
+
+def names() -> list:
+    return list(CIPHERS)
+
+
+def labels(menu_name: str = None) -> list:
+    #Labels in registry order, or a front end's menu labels in menu order
+    if menu_name:
+        return [cipher.menu_label(menu_name) for cipher in menu(menu_name)]
+    return [cipher.label for cipher in CIPHERS.values()]
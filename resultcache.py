@@ -0,0 +1,287 @@
+"""
+resultcache.py - Persistent Result Cache
+A content-addressed store of cipher results on disk (SQLite, standard
+library), shared by every process and thread that opens the same file:
+
+    cache = resultcache.open_cache()                 #~/.cache/novacrypt/results.sqlite3
+    multilayer.multi_encrypt(text, 3, "KEY", 5, verbose=False, cache=cache)
+    python terminal_app.py multi --caesar-key 3 --vig-key KEY --ascii-key 5 --cache *.txt
+    cache.stats()                                    #Hits, misses, hit rate, bytes saved
+
+Keys:-
+An entry's key is one SHA-256 over a random per-store salt, the method, the
+direction, the parameters and the SHA-256 of the input (generate_sha256 of
+the text, which equals the SHA-256 of a UTF-8 file with the same content).
+Neither the parameters nor the input are stored; only the result is.
+
+Storage:-
+Every write runs in one SQLite transaction (WAL journal), so concurrent
+readers never see a partial entry and concurrent writers queue up instead of
+corrupting the store. Entries remember when they were last read; once the
+results together exceed max_bytes, the least recently used are evicted. A
+result larger than max_bytes on its own is returned but not stored.
+
+Hits, misses and bytes saved (result bytes served instead of recomputed) are
+kept in the store too, so stats() covers every process that used it.
+
+Lookups:-
+get() is a plain read and never waits for the write lock. The hit or miss and
+the entry's last-used time are then written only if the lock is free at once;
+otherwise they stay pending in this thread and go out with its next write
+(a put, a later lookup, stats(), flush() or close()).
+
+⚠️Note:
+Decryption results are plaintext. Keep the cache file somewhere only you can
+read, or leave caching off for sensitive material.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "novacrypt", "results.sqlite3")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+BUSY_TIMEOUT = 30.0  #Seconds a writer waits for another process's transaction
+
+#Snapshot of the shared counters; hit_rate is 0.0 before any lookup
+CacheStats = namedtuple("CacheStats", [
+    "hits", "misses", "hit_rate", "bytes_saved", "entries", "bytes", "max_bytes",
+])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value
+);
+"""
+
+_COUNTERS = ("hits", "misses", "bytes_saved", "bytes")
+
+
+def input_digest(text: str) -> str:
+    #SHA-256 of the text as UTF-8, the same as ciphers.generate_sha256
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class ResultCache:
+    #SQLite-backed LRU store of results, safe to share between threads and processes
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1.")
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+        #The store holds plaintext results: create it readable by the owner only
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+
+        with self._transaction() as connection:
+            for name in _COUNTERS:
+                connection.execute("INSERT OR IGNORE INTO meta (name, value) VALUES (?, 0)", (name,))
+            connection.execute("INSERT OR IGNORE INTO meta (name, value) VALUES ('salt', ?)",
+                               (os.urandom(16).hex(),))
+            self._salt = connection.execute("SELECT value FROM meta WHERE name = 'salt'").fetchone()[0]
+
+    #Connections: one per thread, reopened after a fork
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+            #Lookup bookkeeping not yet written (a forked child starts empty)
+            self._local.counts = {}
+            self._local.touched = {}
+        return connection
+
+    def _transaction(self, wait: bool = True):
+        return _Transaction(self._connection(), wait)
+
+    #Keys
+
+    def key(self, method: str, direction: str, params: tuple, digest: str) -> str:
+        #Entry key for a result; digest is the SHA-256 hex of the input (see input_digest)
+        material = "\0".join((self._salt, method, direction, repr(tuple(params)), digest))
+        return hashlib.sha256(material.encode("utf-8", "surrogatepass")).hexdigest()
+
+    #Entries
+
+    def get(self, key: str):
+        #The stored result bytes, or None; a hit marks the entry as recently used.
+        #Reads without taking the write lock; the bookkeeping is written if it is free.
+        connection = self._connection()
+        row = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        counts = self._local.counts
+        if row is None:
+            counts["misses"] = counts.get("misses", 0) + 1
+        else:
+            self._local.touched[key] = time.time()
+            counts["hits"] = counts.get("hits", 0) + 1
+            counts["bytes_saved"] = counts.get("bytes_saved", 0) + len(row[0])
+        self.flush(wait=False)
+        return None if row is None else row[0]
+
+    def flush(self, wait: bool = True) -> bool:
+        #Writes this thread's pending lookup bookkeeping. With wait=False it gives up at once
+        #if another connection holds the write lock; returns whether nothing is left pending.
+        self._connection()
+        if not self._local.counts and not self._local.touched:
+            return True
+        try:
+            with self._transaction(wait) as connection:
+                self._write_pending(connection)
+        except sqlite3.OperationalError:
+            if wait:
+                raise
+            return False
+        return True
+
+    def _write_pending(self, connection):
+        #Inside a write transaction: applies and clears the pending lookup bookkeeping
+        touched = self._local.touched
+        if touched:
+            connection.executemany("UPDATE results SET last_used = MAX(last_used, ?) WHERE key = ?",
+                                   [(used, key) for key, used in touched.items()])
+        if self._local.counts:
+            _bump(connection, **self._local.counts)
+        self._local.counts = {}
+        self._local.touched = {}
+
+    def put(self, key: str, value: bytes) -> bool:
+        #Stores a result, evicting least recently used entries to stay within max_bytes.
+        #Returns False when the value alone is larger than max_bytes (it is not stored).
+        if len(value) > self.max_bytes:
+            return False
+        with self._transaction() as connection:
+            self._write_pending(connection)  #So eviction sees this thread's latest reads
+            old = connection.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+            total = _bump(connection, bytes=len(value) - (old[0] if old else 0))
+            if total > self.max_bytes:
+                self._evict(connection, total - self.max_bytes)
+        return True
+
+    def _evict(self, connection, excess: int):
+        #Deletes the least recently used entries until `excess` bytes are freed
+        freed = 0
+        victims = []
+        for key, size in connection.execute("SELECT key, size FROM results ORDER BY last_used"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        connection.executemany("DELETE FROM results WHERE key = ?", victims)
+        _bump(connection, bytes=-freed)
+
+    def get_or_compute(self, method: str, direction: str, text: str, params: tuple, compute) -> str:
+        #Returns the cached result for (method, direction, params, text), running compute() on a miss
+        key = self.key(method, direction, params, input_digest(text))
+        value = self.get(key)
+        if value is not None:
+            return value.decode("utf-8", "surrogatepass")
+        result = compute()
+        self.put(key, result.encode("utf-8", "surrogatepass"))
+        return result
+
+    #Housekeeping
+
+    def stats(self) -> CacheStats:
+        #Counters shared by every user of the store (this thread's pending lookups included)
+        self.flush()
+        connection = self._connection()
+        counters = dict(connection.execute("SELECT name, value FROM meta WHERE name != 'salt'"))
+        entries = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        lookups = counters["hits"] + counters["misses"]
+        return CacheStats(
+            counters["hits"], counters["misses"], counters["hits"] / lookups if lookups else 0.0,
+            counters["bytes_saved"], entries, counters["bytes"], self.max_bytes,
+        )
+
+    def clear(self):
+        #Drops all entries and resets the counters (the salt is kept)
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM results")
+            connection.execute("UPDATE meta SET value = 0 WHERE name != 'salt'")
+            self._local.counts = {}
+            self._local.touched = {}
+
+    def close(self):
+        #Writes this thread's pending lookups and closes its connection
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            if self._local.pid == os.getpid():
+                self.flush()
+            connection.close()
+            self._local.connection = None
+
+    def __repr__(self) -> str:
+        return f"ResultCache({self.path!r}, max_bytes={self.max_bytes})"
+
+
+class _Transaction:
+    #BEGIN IMMEDIATE ... COMMIT, rolled back on error; takes the write lock up front
+    #so two processes never both read a counter and then write it. With wait=False,
+    #BEGIN fails with OperationalError instead of waiting for another writer.
+
+    def __init__(self, connection: sqlite3.Connection, wait: bool = True):
+        self.connection = connection
+        self.wait = wait
+
+    def __enter__(self) -> sqlite3.Connection:
+        if self.wait:
+            self.connection.execute("BEGIN IMMEDIATE")
+            return self.connection
+        self.connection.execute("PRAGMA busy_timeout = 0")
+        try:
+            self.connection.execute("BEGIN IMMEDIATE")
+        finally:
+            self.connection.execute(f"PRAGMA busy_timeout = {int(BUSY_TIMEOUT * 1000)}")
+        return self.connection
+
+    def __exit__(self, kind, value, traceback):
+        self.connection.execute("COMMIT" if kind is None else "ROLLBACK")
+        return False
+
+
+def _bump(connection, **deltas) -> int:
+    #Adds to the named counters; returns the new value of the last one
+    value = 0
+    for name, delta in deltas.items():
+        connection.execute("UPDATE meta SET value = value + ? WHERE name = ?", (delta, name))
+        value = connection.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()[0]
+    return value
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def open_cache(path=None, max_bytes: int = None) -> ResultCache:
+    #Shared ResultCache per path; path defaults to $NOVACRYPT_CACHE or DEFAULT_PATH
+    path = os.path.abspath(path or os.environ.get("NOVACRYPT_CACHE") or DEFAULT_PATH)
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None or (max_bytes is not None and cache.max_bytes != max_bytes):
+            cache = _caches[path] = ResultCache(path, max_bytes or DEFAULT_MAX_BYTES)
+        return cache
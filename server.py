@@ -0,0 +1,513 @@
+"""
+server.py - Local HTTP Encryption Service
+A headless HTTP/1.1 service over the ciphers in registry.py, built on asyncio
+with no outside dependencies:
+
+    python server.py --port 8080 --workers 4
+
+Endpoints:-
+POST /encrypt, /decrypt
+    {"method": "multi", "params": {"caesar_key": 3, "vig_key": "KEY", "ascii_key": 5}, "text": "..."}
+    -> {"result": "..."}
+POST /batch/encrypt, /batch/decrypt
+    {"method": "caesar", "params": {"key": 3}, "records": ["...", "..."]}
+    -> {"results": [{"value": "...", "error": null}, ...]}   (one per record, in order)
+POST /stream/encrypt, /stream/decrypt ?method=multi&caesar_key=3&vig_key=KEY&ascii_key=5
+    Raw UTF-8 request body (Content-Length or chunked), chunked response body
+GET /metrics
+    Request counts and latency histograms per route, in-flight requests and
+    worker queue depth, as JSON
+
+Methods and their params: caesar (key), vigenere (keyword), reverse, ascii
+(shift), base64, sha256 (encrypt only), multi (caesar_key, vig_key, ascii_key).
+
+Execution:-
+Small payloads are computed right on the event loop; the translate-based
+ciphers take microseconds there, far less than a round trip to another
+process. Larger payloads, batches and streams go to a bounded process pool.
+When more than `max_queue` tasks are waiting for it, new requests are turned
+away with 503 and Retry-After instead of piling up in memory.
+JSON bodies are parsed on the event loop, which holds it for about 5 ms per
+MB, so they are capped at MAX_BODY; larger inputs belong on /stream.
+Stream bodies are piped through the chunked ciphers in streaming.py as they
+arrive (see async_api.stream_transform), on up to `max_queue` threads: the
+response starts with the first output chunk and a slow client pauses the
+cipher and the reading of the body, so memory stays at a few chunks. Reverse
+and Multi-Layer need the whole input before their first output byte and spool
+it to a temporary file, like their synchronous streams.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qsl
+
+import registry
+from async_api import STREAM_CHUNK_SIZE, stream_transform
+from multilayer import _plan_chunks
+from streaming import CHUNK_SIZE
+from tracing import Histogram
+
+INLINE_LIMIT = 16 * 1024  #Characters of work done on the event loop instead of the pool
+#Forked workers would inherit the listening socket and open client connections,
+#keeping them open after the service closes them
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+MAX_BODY = 4 * 1024 * 1024  #Largest JSON request body, in bytes (parsed on the event loop)
+MAX_HEADER = 64 * 1024
+KEEP_ALIVE_TIMEOUT = 30.0
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+Request = namedtuple("Request", ["method", "path", "query", "headers", "reader", "writer"])
+
+
+class HTTPError(Exception):
+    #An error response; `close` drops the connection afterwards (body not consumed)
+
+    def __init__(self, status: int, message: str, close: bool = False, headers: tuple = ()):
+        super().__init__(message)
+        self.status = status
+        self.close = close
+        self.headers = headers
+
+
+#WORKER FUNCTIONS (run in the process pool)
+
+def _resolve(method: str, direction: str):
+    return registry.get(method).function(direction)
+
+
+def _apply(method: str, direction: str, text: str, params: tuple) -> str:
+    return _resolve(method, direction)(text, *params)
+
+
+def _apply_records(method: str, direction: str, records: list, params: tuple) -> list:
+    #One [value, error] pair per record, failures captured like multilayer's batch mode
+    function = _resolve(method, direction)
+    results = []
+    for record in records:
+        try:
+            results.append([function(record, *params), None])
+        except Exception as e:
+            results.append([None, f"{type(e).__name__}: {e}"])
+    return results
+
+
+#HTTP PROTOCOL
+
+async def _read_request(reader, writer) -> Request:
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head[:-4].decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "Malformed request line.", close=True)
+
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    url = urlsplit(target)
+    return Request(method.upper(), url.path, dict(parse_qsl(url.query)), headers, reader, writer)
+
+
+async def _iter_body(request: Request, chunk_size: int = CHUNK_SIZE):
+    #Yields the request body as it arrives (Content-Length or chunked encoding)
+    reader = request.reader
+    if "chunked" in request.headers.get("transfer-encoding", "").lower():
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            try:
+                size = int(line.split(b";")[0].strip(), 16)
+            except ValueError:
+                raise HTTPError(400, "Malformed chunk size.", close=True)
+            if size == 0:
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass  #Trailers
+                return
+            while size:
+                data = await reader.read(min(size, chunk_size))
+                if not data:
+                    raise asyncio.IncompleteReadError(b"", size)
+                size -= len(data)
+                yield data
+            await reader.readexactly(2)
+    else:
+        try:
+            remaining = int(request.headers.get("content-length", 0))
+        except ValueError:
+            raise HTTPError(400, "Malformed Content-Length.", close=True)
+        while remaining > 0:
+            data = await reader.read(min(remaining, chunk_size))
+            if not data:
+                raise asyncio.IncompleteReadError(b"", remaining)
+            remaining -= len(data)
+            yield data
+
+
+async def _read_json(request: Request):
+    length = request.headers.get("content-length")
+    if length and length.isdigit() and int(length) > MAX_BODY:
+        raise HTTPError(413, f"Request body is limited to {MAX_BODY} bytes; use /stream for larger input.",
+                        close=True)
+
+    parts = []
+    size = 0
+    async for data in _iter_body(request):
+        size += len(data)
+        if size > MAX_BODY:
+            raise HTTPError(413, f"Request body is limited to {MAX_BODY} bytes; use /stream for larger input.",
+                            close=True)
+        parts.append(data)
+
+    try:
+        body = json.loads(b"".join(parts))
+    except ValueError:
+        raise HTTPError(400, "Request body must be valid JSON.")
+    if not isinstance(body, dict):
+        raise HTTPError(400, "Request body must be a JSON object.")
+    return body
+
+
+class _BodyReader:
+    #StreamReader-style read() over the request body, for async_api.stream_transform
+
+    def __init__(self, request: Request, chunk_size: int):
+        self._chunks = _iter_body(request, chunk_size)
+        self._buffer = b""
+        self._offset = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        #Up to size bytes (the rest of the buffered chunk when size < 0); b"" at the end of the body
+        if self._offset >= len(self._buffer):
+            try:
+                self._buffer, self._offset = await self._chunks.__anext__(), 0
+            except StopAsyncIteration:
+                return b""
+        end = len(self._buffer) if size < 0 else self._offset + size
+        data = self._buffer[self._offset:end]
+        self._offset += len(data)
+        return data
+
+    async def discard(self):
+        #Reads what the cipher left unread (e.g. after Base64 padding) so the connection can be reused
+        async for _ in self._chunks:
+            pass
+
+
+class _ChunkedResponse:
+    #StreamWriter-style write() / drain() that sends a 200 head before the first chunk,
+    #so errors raised before any output can still become an error response
+
+    def __init__(self, request: Request):
+        self._writer = request.writer
+        self._keep_alive = _keep_alive(request)
+        self.started = False
+
+    def _start(self):
+        if not self.started:
+            self.started = True
+            self._writer.write(_head(200, [("Content-Type", "text/plain; charset=utf-8"),
+                                           ("Transfer-Encoding", "chunked")], self._keep_alive))
+
+    def write(self, data: bytes):
+        if data:
+            self._start()
+            self._writer.writelines((b"%X\r\n" % len(data), data, b"\r\n"))
+
+    async def drain(self):
+        await self._writer.drain()
+
+    async def finish(self):
+        self._start()
+        self._writer.write(b"0\r\n\r\n")
+        await self._writer.drain()
+
+
+def _keep_alive(request: Request) -> bool:
+    return request.headers.get("connection", "").lower() != "close"
+
+
+def _head(status: int, headers: list, keep_alive: bool) -> bytes:
+    lines = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}"]
+    lines += [f"{name}: {value}" for name, value in headers]
+    lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def _json_response(status: int, payload, keep_alive: bool, extra_headers: tuple = ()) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    headers = [("Content-Type", "application/json; charset=utf-8"), ("Content-Length", len(body)), *extra_headers]
+    return _head(status, headers, keep_alive) + body
+
+
+#PARAMETERS
+
+def _parse_method(name, direction: str) -> str:
+    if name not in registry.CIPHERS:
+        raise HTTPError(400, f"Unknown method '{name}'. Choose from: {', '.join(registry.CIPHERS)}.")
+    if direction == "decrypt" and not registry.get(name).supports("decrypt"):
+        raise HTTPError(400, f"'{name}' cannot decrypt.")
+    return name
+
+
+def _parse_params(method: str, params: dict) -> tuple:
+    #Orders and type-checks params; query-string values arrive as str and are converted
+    if not isinstance(params, dict):
+        raise HTTPError(400, "'params' must be an object.")
+    values = []
+    for name, _, kind, _ in registry.get(method).params:
+        if name not in params:
+            raise HTTPError(400, f"Missing parameter '{name}' for method '{method}'.")
+        value = params[name]
+        if kind is int and isinstance(value, str):
+            try:
+                value = int(value)
+            except ValueError:
+                pass
+        if not isinstance(value, kind) or isinstance(value, bool):
+            raise HTTPError(400, f"Parameter '{name}' must be {'an integer' if kind is int else 'a string'}.")
+        values.append(value)
+    return tuple(values)
+
+
+#SERVICE
+
+class EncryptionService:
+
+    def __init__(self, workers: int = None, max_queue: int = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue or self.workers * 8
+        self.pool = ProcessPoolExecutor(max_workers=self.workers,
+                                        mp_context=multiprocessing.get_context(START_METHOD))
+        #Stream threads mostly wait on the network; each holds the GIL for one chunk at a time
+        self.stream_threads = ThreadPoolExecutor(max_workers=self.max_queue, thread_name_prefix="stream")
+        self.streams = 0
+
+        self.started = time.time()
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.rejected = 0
+        self.statuses = Counter()
+        self.latency = defaultdict(Histogram)
+
+        self.routes = {
+            ("POST", "/encrypt"): lambda request: self.single(request, "encrypt"),
+            ("POST", "/decrypt"): lambda request: self.single(request, "decrypt"),
+            ("POST", "/batch/encrypt"): lambda request: self.batch(request, "encrypt"),
+            ("POST", "/batch/decrypt"): lambda request: self.batch(request, "decrypt"),
+            ("POST", "/stream/encrypt"): lambda request: self.stream(request, "encrypt"),
+            ("POST", "/stream/decrypt"): lambda request: self.stream(request, "decrypt"),
+            ("GET", "/metrics"): self.metrics,
+        }
+
+    #Pool access with backpressure
+
+    def _reserve(self, tasks: int = 1):
+        #An idle pool always takes the request, even a batch split into more tasks than max_queue
+        if self.queue_depth and self.queue_depth + tasks > self.max_queue:
+            self.rejected += 1
+            raise HTTPError(503, "Server is busy, retry shortly.", headers=(("Retry-After", 1),))
+        self.queue_depth += tasks
+
+    async def _run(self, function, *args):
+        #Runs function in the pool; the caller has reserved a queue slot
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, function, *args)
+        finally:
+            self.queue_depth -= 1
+
+    #Handlers return (status, JSON payload) or write the response themselves and return (status, None)
+
+    async def single(self, request: Request, direction: str):
+        body = await _read_json(request)
+        method = _parse_method(body.get("method"), direction)
+        params = _parse_params(method, body.get("params", {}))
+        text = body.get("text")
+        if not isinstance(text, str):
+            raise HTTPError(400, "'text' must be a string.")
+
+        try:
+            if len(text) <= INLINE_LIMIT:
+                result = _apply(method, direction, text, params)
+            else:
+                self._reserve()
+                result = await self._run(_apply, method, direction, text, params)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        return 200, {"result": result}
+
+    async def batch(self, request: Request, direction: str):
+        body = await _read_json(request)
+        method = _parse_method(body.get("method"), direction)
+        params = _parse_params(method, body.get("params", {}))
+        records = body.get("records")
+        if not isinstance(records, list):
+            raise HTTPError(400, "'records' must be a list.")
+
+        sizes = [len(record) if isinstance(record, str) else 0 for record in records]
+        try:
+            if sum(sizes) <= INLINE_LIMIT:
+                _resolve(method, direction)("", *params)  #Invalid keys fail the whole batch
+                results = _apply_records(method, direction, records, params)
+            else:
+                chunks = _plan_chunks(sizes, self.workers)
+                self._reserve(len(chunks))
+                parts = await asyncio.gather(*(
+                    self._run(_apply_records, method, direction, records[start:stop], params)
+                    for start, stop in chunks
+                ))
+                results = [result for part in parts for result in part]
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        return 200, {"results": [{"value": value, "error": error} for value, error in results]}
+
+    async def stream(self, request: Request, direction: str):
+        try:
+            method = _parse_method(request.query.get("method", "multi"), direction)
+            params = _parse_params(method, request.query)
+            try:
+                _resolve(method, direction)("", *params)  #Invalid keys fail before the body is read
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+            if self.streams >= self.max_queue:
+                self.rejected += 1
+                raise HTTPError(503, "Server is busy, retry shortly.", headers=(("Retry-After", 1),))
+        except HTTPError as e:
+            e.close = True  #The body has not been read
+            raise
+
+        body = _BodyReader(request, STREAM_CHUNK_SIZE)
+        response = _ChunkedResponse(request)
+        self.streams += 1
+        try:
+            await stream_transform(method, direction, body, response, params,
+                                   executor=self.stream_threads)
+            await body.discard()
+            await response.finish()
+        except Exception as e:
+            if response.started:
+                #Part of the result is already out: end the connection without the final chunk
+                raise ConnectionAbortedError(str(e)) from e
+            if isinstance(e, ValueError):
+                raise HTTPError(400, str(e), close=True)
+            raise
+        finally:
+            self.streams -= 1
+        return 200, None
+
+    async def metrics(self, request: Request):
+        return 200, {
+            "uptime": time.time() - self.started,
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue": self.max_queue,
+            "streams": self.streams,
+            "rejected": self.rejected,
+            "responses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "latency": {route: histogram.summary() for route, histogram in sorted(self.latency.items())},
+        }
+
+    #Connections
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader, writer), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_json_response(431, {"error": "Request headers too large."}, False))
+                    break
+                except HTTPError as e:
+                    writer.write(_json_response(e.status, {"error": str(e)}, False))
+                    break
+
+                if not await self.handle_request(request):
+                    break
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, request: Request) -> bool:
+        #Serves one request; returns whether the connection stays open
+        writer = request.writer
+        keep_alive = _keep_alive(request)
+        started = time.perf_counter()
+        self.in_flight += 1
+
+        route = (request.method, request.path)
+        handler = self.routes.get(route)
+        try:
+            if handler is None:
+                if any(path == request.path for _, path in self.routes):
+                    raise HTTPError(405, f"{request.method} is not allowed on {request.path}.", close=True)
+                raise HTTPError(404, f"No route for {request.path}.", close=True)
+            status, payload = await handler(request)
+            if payload is not None:
+                writer.write(_json_response(status, payload, keep_alive))
+        except HTTPError as e:
+            status = e.status
+            keep_alive = keep_alive and not e.close
+            writer.write(_json_response(status, {"error": str(e)}, keep_alive, e.headers))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            status, keep_alive = 400, False
+        except Exception as e:
+            status, keep_alive = 500, False
+            writer.write(_json_response(500, {"error": f"{type(e).__name__}: {e}"}, False))
+        finally:
+            self.in_flight -= 1
+
+        self.statuses[status] += 1
+        self.latency[f"{request.method} {request.path if handler else 'unmatched'}"].record(
+            time.perf_counter() - started)
+        return keep_alive
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+        self.stream_threads.shutdown(wait=False, cancel_futures=True)
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8080, workers: int = None, max_queue: int = None):
+    service = EncryptionService(workers, max_queue)
+    server = await asyncio.start_server(service.handle_connection, host, port, limit=MAX_HEADER)
+    print(f"NovaCrypt service listening on http://{host}:{port} "
+          f"({service.workers} workers, queue limit {service.max_queue})", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NovaCrypt HTTP encryption service")
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on (default 8080)")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--max-queue", type=int, default=None,
+                        help="pool tasks allowed to wait before returning 503 (default: 8 per worker)")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_queue))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
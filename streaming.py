@@ -0,0 +1,413 @@
+"""
+Streaming Multi-Layer Encryption Module
+This module runs the multi-layer pipeline over files and iterators whose size
+is not limited by available memory. Output is byte-for-byte the same as
+multi_encrypt / multi_decrypt on the full text.
+
+Encryption:-
+1. A forward pass counts alphabetic characters (the Vigenère keyword phase of
+   the last character depends on every character before it)
+2. The source is then read backwards block by block, which takes care of the
+   Reverse layer without ever holding the whole text
+3. Each block gets the fused Caesar + Vigenère shift (starting at the phase
+   implied by the count), the ASCII Shift, and is reversed
+4. Base64 is emitted in aligned 3-byte groups, so chunks can be concatenated
+
+Decryption:-
+1. Base64 is decoded forward in aligned 4-character groups into a spool file
+2. The spool is read backwards block by block (Reverse layer), unshifted, and
+   decrypted with the keyword phase carried from block to block
+
+Non-seekable sources (pipes, iterators) are spooled to a temporary file first.
+Memory use is a few times `chunk_size` regardless of the input size.
+
+Single layers stream too: iter_caesar, iter_vigenere and iter_ascii_shift
+rewrite decoded text chunk by chunk (Vigenère carries its keyword phase across
+chunks), and iter_reverse reads the source backwards.
+
+The same chunked readers also provide incremental SHA-256 and Base64:
+sha256_stream hashes a source chunk by chunk, sha256_files hashes many files
+concurrently on a thread pool (hashlib releases the GIL on large buffers), and
+iter_base64_encode / iter_base64_decode work on aligned 3-byte / 4-char groups.
+"""
+
+import binascii
+import codecs
+import hashlib
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+
+from ciphers import caesar_encrypt, ascii_shift, key_schedule, _ascii_table, _vigenere_apply
+from multilayer import _combined_tables
+
+CHUNK_SIZE = 1 << 20  #Bytes read per block
+
+_B64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+_B64_IGNORED = bytes(code for code in range(256) if code not in _B64_ALPHABET)
+_INVALID_BASE64 = "Invalid Base64 input. Please check your ciphertext."
+_NON_LETTERS = bytes(code for code in range(256) if not chr(code).isalpha() or code > 127)
+
+
+#SOURCES AND SINKS
+
+def _as_bytes(chunk) -> bytes:
+    #Chunks from text files or str iterators are UTF-8 encoded
+    return chunk.encode("utf-8") if isinstance(chunk, str) else bytes(chunk)
+
+
+def iter_chunks(source, chunk_size: int = CHUNK_SIZE):
+    #Yields the source as bytes chunks.
+    #source: a path, a file object (binary or text), bytes, or an iterable of str/bytes
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from iter_chunks(file, chunk_size)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield _as_bytes(chunk)
+    else:
+        for chunk in source:
+            if chunk:
+                yield _as_bytes(chunk)
+
+
+@contextmanager
+def _seekable(source, chunk_size: int):
+    #Yields (binary file, start offset, end offset), spooling to disk when needed
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield file, 0, file.seek(0, io.SEEK_END)
+        return
+
+    if hasattr(source, "read") and hasattr(source, "seek") and source.seekable() \
+            and isinstance(source.read(0), bytes):
+        start = source.tell()
+        yield source, start, source.seek(0, io.SEEK_END)
+        return
+
+    with tempfile.TemporaryFile() as spool:
+        for chunk in iter_chunks(source, chunk_size):
+            spool.write(chunk)
+        yield spool, 0, spool.tell()
+
+
+def _iter_blocks_backwards(file, start: int, end: int, chunk_size: int):
+    #Yields decoded text blocks from the end of the file towards `start`.
+    #A block never splits a UTF-8 sequence: leading continuation bytes are
+    #handed to the block before it.
+
+    pending = b""
+    position = end
+    while position > start:
+        low = max(start, position - chunk_size)
+        file.seek(low)
+        data = file.read(position - low) + pending
+        position = low
+
+        cut = 0
+        if position > start:
+            while cut < len(data) and data[cut] & 0xC0 == 0x80:
+                cut += 1
+            if cut > 3:
+                raise UnicodeDecodeError("utf-8", data, 0, cut, "invalid continuation bytes")
+        pending = data[:cut]
+        yield data[cut:].decode("utf-8")
+
+
+def _write_all(chunks, sink) -> int:
+    #Writes bytes chunks to a path or file object (str is written to text files)
+
+    if isinstance(sink, (str, os.PathLike)):
+        with open(sink, "wb") as file:
+            return _write_all(chunks, file)
+
+    decoder = codecs.getincrementaldecoder("utf-8")() if isinstance(sink, io.TextIOBase) else None
+    written = 0
+    for chunk in chunks:
+        sink.write(decoder.decode(chunk) if decoder else chunk)
+        written += len(chunk)
+    if decoder:
+        sink.write(decoder.decode(b"", final=True))
+    return written
+
+
+def _count_letters(text: str) -> int:
+    #Counts characters that advance the Vigenère keyword (fast path for ASCII blocks)
+    if text.isascii():
+        return len(text.encode("ascii").translate(None, _NON_LETTERS))
+    return sum(map(str.isalpha, text))
+
+
+#BASE64 IN ALIGNED GROUPS
+
+class Base64StreamEncoder:
+    #Encodes a byte stream to Base64 in 3-byte groups; concatenated output
+    #equals base64 of the whole stream
+
+    def __init__(self):
+        self._rest = b""
+
+    def feed(self, data: bytes) -> bytes:
+        data = self._rest + data
+        cut = len(data) - len(data) % 3
+        self._rest = data[cut:]
+        return binascii.b2a_base64(data[:cut], newline=False) if cut else b""
+
+    def finish(self) -> bytes:
+        rest, self._rest = self._rest, b""
+        return binascii.b2a_base64(rest, newline=False) if rest else b""
+
+
+class Base64StreamDecoder:
+    #Decodes a Base64 stream in 4-character groups, ignoring characters outside
+    #the alphabet like base64_decode does. As there, the first complete padding
+    #sequence ends the data and anything after it is ignored.
+
+    def __init__(self):
+        self._rest = b""
+        self._pads = 0  #'=' counted since the last data character
+        self._done = False
+
+    def feed(self, data: bytes) -> bytes:
+        if self._done:
+            return b""
+        output = []
+        for index, part in enumerate(data.translate(None, _B64_IGNORED).split(b"=")):
+            #Every part after the first follows one '=', which only counts once a group
+            #has two or more characters (the rule binascii.a2b_base64 applies)
+            if index and len(self._rest) >= 2:
+                self._pads += 1
+                if len(self._rest) + self._pads >= 4:
+                    self._done = True
+                    output.append(self._decode(self._rest + b"=" * (4 - len(self._rest))))
+                    self._rest = b""
+                    break
+            if part:
+                self._pads = 0
+                data = self._rest + part
+                cut = len(data) - len(data) % 4
+                self._rest = data[cut:]
+                output.append(self._decode(data[:cut]))
+        return b"".join(output)
+
+    def finish(self) -> bytes:
+        rest, self._rest = self._rest, b""
+        return self._decode(rest)
+
+    @staticmethod
+    def _decode(data: bytes) -> bytes:
+        if not data:
+            return b""
+        try:
+            return binascii.a2b_base64(data)
+        except binascii.Error:
+            raise ValueError(_INVALID_BASE64)
+
+
+#MULTI-LAYER STREAMS
+
+def iter_multi_encrypt(source, caesar_key: int, vig_key: str, ascii_key: int,
+                       chunk_size: int = CHUNK_SIZE):
+    #Yields the multi_encrypt ciphertext of `source` as ASCII bytes chunks
+
+    tables = _combined_tables(caesar_key, vig_key, 1)
+    ascii_table = _ascii_table(ascii_key % 95)
+    period = len(tables)
+
+    with _seekable(source, chunk_size) as (file, start, end):
+        #Pass 1: count alphabetic characters to know where the keyword phase ends
+        file.seek(start)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        letters_total = 0
+        for _ in range(start, end, chunk_size):
+            letters_total += _count_letters(decoder.decode(file.read(chunk_size)))
+        decoder.decode(b"", final=True)
+
+        #Pass 2: read backwards, shift, reverse and encode
+        encoder = Base64StreamEncoder()
+        letters_after = 0
+        for block in _iter_blocks_backwards(file, start, end, chunk_size):
+            letters_after += _count_letters(block)
+            phase = (letters_total - letters_after) % period
+            shifted, _ = _vigenere_apply(block, tables, phase)
+            encoded = encoder.feed(shifted.translate(ascii_table)[::-1].encode("utf-8"))
+            if encoded:
+                yield encoded
+        tail = encoder.finish()
+        if tail:
+            yield tail
+
+
+def iter_multi_decrypt(source, caesar_key: int, vig_key: str, ascii_key: int,
+                       chunk_size: int = CHUNK_SIZE):
+    #Yields the multi_decrypt plaintext of `source` as UTF-8 bytes chunks
+
+    tables = _combined_tables(caesar_key, vig_key, -1)
+    ascii_table = _ascii_table(-ascii_key % 95)
+
+    with tempfile.TemporaryFile() as spool:
+        #Pass 1: Base64 decode into the spool
+        decoder = Base64StreamDecoder()
+        for chunk in iter_chunks(source, chunk_size):
+            spool.write(decoder.feed(chunk))
+        spool.write(decoder.finish())
+        end = spool.tell()
+
+        #Pass 2: read backwards (Reverse), unshift and decrypt in forward order
+        phase = 0
+        try:
+            for block in _iter_blocks_backwards(spool, 0, end, chunk_size):
+                unshifted = block.translate(ascii_table)[::-1]
+                plain, phase = _vigenere_apply(unshifted, tables, phase)
+                yield plain.encode("utf-8")
+        except UnicodeDecodeError:
+            raise ValueError(_INVALID_BASE64)
+
+
+def multi_encrypt_stream(source, sink, caesar_key: int, vig_key: str, ascii_key: int,
+                         chunk_size: int = CHUNK_SIZE) -> int:
+    #Encrypts source into sink (path or file object); returns bytes written
+    return _write_all(iter_multi_encrypt(source, caesar_key, vig_key, ascii_key, chunk_size), sink)
+
+
+def multi_decrypt_stream(source, sink, caesar_key: int, vig_key: str, ascii_key: int,
+                         chunk_size: int = CHUNK_SIZE) -> int:
+    #Decrypts source into sink (path or file object); returns bytes written
+    return _write_all(iter_multi_decrypt(source, caesar_key, vig_key, ascii_key, chunk_size), sink)
+
+
+#SINGLE-LAYER STREAMS
+
+def _iter_text(source, chunk_size: int):
+    #Yields the source as decoded text chunks, never splitting a UTF-8 sequence
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in iter_chunks(source, chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    decoder.decode(b"", final=True)
+
+
+def iter_caesar(source, key: int, decrypt: bool = False, chunk_size: int = CHUNK_SIZE):
+    #Yields caesar_encrypt (or caesar_decrypt) of the source as UTF-8 bytes chunks
+    key = -key if decrypt else key
+    for text in _iter_text(source, chunk_size):
+        yield caesar_encrypt(text, key).encode("utf-8")
+
+
+def iter_vigenere(source, keyword: str, decrypt: bool = False, chunk_size: int = CHUNK_SIZE):
+    #Yields vigenere_encrypt (or vigenere_decrypt) of the source as UTF-8 bytes chunks
+    schedule = key_schedule(keyword)
+    tables = schedule.decrypt_tables if decrypt else schedule.encrypt_tables
+    phase = 0
+    for text in _iter_text(source, chunk_size):
+        shifted, phase = _vigenere_apply(text, tables, phase)
+        yield shifted.encode("utf-8")
+
+
+def iter_ascii_shift(source, shift_val: int, unshift: bool = False, chunk_size: int = CHUNK_SIZE):
+    #Yields ascii_shift (or ascii_unshift) of the source as UTF-8 bytes chunks
+    shift_val = -shift_val if unshift else shift_val
+    for text in _iter_text(source, chunk_size):
+        yield ascii_shift(text, shift_val).encode("utf-8")
+
+
+def iter_reverse(source, chunk_size: int = CHUNK_SIZE):
+    #Yields reverse_text of the source as UTF-8 bytes chunks
+    with _seekable(source, chunk_size) as (file, start, end):
+        for block in _iter_blocks_backwards(file, start, end, chunk_size):
+            yield block[::-1].encode("utf-8")
+
+
+#SHA-256 HASHING
+
+def _sha256_file(path, chunk_size: int) -> str:
+    #Hashes a file through one reusable buffer, so memory stays at chunk_size
+    digest = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as file:
+        while True:
+            size = file.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+def sha256_stream(source, chunk_size: int = CHUNK_SIZE) -> str:
+    #SHA-256 of a path, file object or chunk iterator; matches generate_sha256 on the same text
+    if isinstance(source, (str, os.PathLike)):
+        return _sha256_file(source, chunk_size)
+
+    digest = hashlib.sha256()
+    for chunk in iter_chunks(source, chunk_size):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_sha256(source, chunk_size: int = CHUNK_SIZE):
+    #The hex digest as a one-chunk stream, so hashing composes with the other iterators
+    yield sha256_stream(source, chunk_size).encode("ascii")
+
+
+def sha256_files(paths, workers: int = None, chunk_size: int = CHUNK_SIZE) -> dict:
+    #Hashes many files concurrently; returns {path: hexdigest} in input order
+    from concurrent.futures import ThreadPoolExecutor  #Imported on demand to keep startup light
+
+    paths = list(paths)
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        digests = pool.map(lambda path: _sha256_file(path, chunk_size), paths)
+        return dict(zip(paths, digests))
+
+
+#BASE64 STREAMS
+
+def iter_base64_encode(source, chunk_size: int = CHUNK_SIZE):
+    #Yields base64_encode of the source as ASCII bytes chunks
+    encoder = Base64StreamEncoder()
+    for chunk in iter_chunks(source, chunk_size):
+        encoded = encoder.feed(chunk)
+        if encoded:
+            yield encoded
+    tail = encoder.finish()
+    if tail:
+        yield tail
+
+
+def iter_base64_decode(source, chunk_size: int = CHUNK_SIZE):
+    #Yields base64_decode of the source as UTF-8 bytes chunks (validated as text)
+    decoder = Base64StreamDecoder()
+    validator = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for chunk in iter_chunks(source, chunk_size):
+            decoded = decoder.feed(chunk)
+            if decoded:
+                validator.decode(decoded)
+                yield decoded
+        decoded = decoder.finish()
+        validator.decode(decoded, final=True)
+        if decoded:
+            yield decoded
+    except UnicodeDecodeError:
+        raise ValueError(_INVALID_BASE64)
+
+
+def base64_encode_stream(source, sink, chunk_size: int = CHUNK_SIZE) -> int:
+    #Base64-encodes source into sink (path or file object); returns bytes written
+    return _write_all(iter_base64_encode(source, chunk_size), sink)
+
+
+def base64_decode_stream(source, sink, chunk_size: int = CHUNK_SIZE) -> int:
+    #Base64-decodes source into sink (path or file object); returns bytes written
+    return _write_all(iter_base64_decode(source, chunk_size), sink)
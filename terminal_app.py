@@ -1,11 +1,36 @@
-from ciphers import (
-    caesar_encrypt, caesar_decrypt,
-    vigenere_encrypt, vigenere_decrypt,
-    reverse_text,
-    ascii_shift, ascii_unshift,
-    base64_encode, base64_decode
-)
-from multilayer import multi_encrypt, multi_decrypt
+"""
+terminal_app.py - NovaCrypt Command Line
+Run without arguments for the interactive menu. With a subcommand it runs
+non-interactively, streaming through the chunked engine in streaming.py:
+
+    python terminal_app.py multi --caesar-key 3 --vig-key KEY --ascii-key 5 < in.txt > out.txt
+    python terminal_app.py multi -d --caesar-key 3 --vig-key KEY --ascii-key 5 < out.txt
+    python terminal_app.py caesar --key 3 --jobs 4 notes/*.txt        #Writes notes/<name>.txt.enc
+    python terminal_app.py sha256 *.txt                                #sha256sum-style lines
+    python terminal_app.py vigenere --keyword KEY --in-place data.txt  #Rewrites an ASCII file via mmap
+    python terminal_app.py multi --caesar-key 3 --vig-key KEY --ascii-key 5 --cache *.txt
+
+Subcommands and the interactive menu come from registry.py (one per cipher).
+With no files (or "-") input is read from stdin and written to stdout. Files
+are processed on a pool of --jobs worker processes; a single large file with
+--jobs > 1 is split across them instead when the cipher has a parallel backend
+(Caesar, Vigenère, ASCII Shift; see parallel.py). The exit status is 1 if
+any input failed and 2 for usage errors.
+
+--cache reuses results of earlier runs from a persistent store (see
+resultcache.py; --cache-file, else $NOVACRYPT_CACHE or ~/.cache/novacrypt) and reports
+the hit rate and bytes saved on stderr. Only file inputs are cached: stdin is
+read once and streamed, so it has no digest to look up before it is consumed.
+"""
+
+import argparse
+import os
+import sys
+
+import registry
+
+CHUNK_SIZE = 1 << 20  #Matches streaming.CHUNK_SIZE; defined here so startup does not import it
+PREVIEW_CHARS = 200  #Characters shown per intermediate multi-layer step
 
 
 def print_banner():
@@ -27,137 +52,83 @@ def get_encryption_mode():
 
 
 def get_cipher_method():
+    #Menu built from the cipher registry's terminal menu; returns the chosen registry.Cipher
+    ciphers = registry.menu("terminal")
+
     print("\nChoose Encryption Method:")
-    print("  1. Caesar Cipher")
-    print("  2. Vigenère Cipher")
-    print("  3. Reverse Text")
-    print("  4. ASCII Shift")
-    print("  5. Base64 Encoding")
-    print("  6. Multi-Layer Encryption (All Combined)")
+    for number, cipher in enumerate(ciphers, 1):
+        print(f"  {number}. {cipher.menu_label('terminal')}")
 
     while True:
         try:
-            choice = int(input("\nEnter choice (1-6): ").strip())
-            if 1 <= choice <= 6:
-                return choice
-            print("Invalid choice. Please enter a number between 1 and 6.\n")
+            choice = int(input(f"\nEnter choice (1-{len(ciphers)}): ").strip())
+            if 1 <= choice <= len(ciphers):
+                return ciphers[choice - 1]
+            print(f"Invalid choice. Please enter a number between 1 and {len(ciphers)}.\n")
         except ValueError:
             print("Invalid input. Please enter a number.\n")
 
 
-def caesar_cipher_interface(mode: str):
-    #Interface for Caesar Cipher
-    text = input("\nEnter the text: ").strip()
-
+def read_param(param: registry.Param):
+    #Prompts for one cipher parameter until it parses
     while True:
-        try:
-            key = int(input("Enter Caesar key (shift amount): ").strip())
-            break
-        except ValueError:
-            print("Invalid key. Please enter an integer.\n")
-
-    if mode == 'e':
-        result = caesar_encrypt(text, key)
-        print(f"\n Encrypted Text: {result}")
-    else:
-        result = caesar_decrypt(text, key)
-        print(f"\n Decrypted Text: {result}")
-
-
-def vigenere_cipher_interface(mode: str):
-    #Interface for Vigenère Cipher
+        value = input(f"  {param.label}: ").strip()
+        if param.type is int:
+            try:
+                return int(value)
+            except ValueError:
+                print("  Invalid value. Please enter an integer.")
+                continue
+        if not value and param.default:
+            print(f"  {param.label} cannot be empty. Using default '{param.default}'.")
+            return param.default
+        return value
+
+
+def cipher_interface(cipher: registry.Cipher, mode: str):
+    #Interface for any registered cipher
     text = input("\nEnter the text: ").strip()
-    keyword = input("Enter Vigenère keyword: ").strip()
 
-    if not keyword:
-        print("Keyword cannot be empty.")
+    direction = "encrypt" if mode == 'e' else "decrypt"
+    if direction == "decrypt" and not cipher.supports("decrypt"):
+        print(f"\n{cipher.label} is one-way and cannot be decrypted.")
         return
 
-    if mode == 'e':
-        result = vigenere_encrypt(text, keyword)
-        print(f"\nEncrypted Text: {result}")
-    else:
-        result = vigenere_decrypt(text, keyword)
-        print(f"\n Decrypted Text: {result}")
-
-
-def reverse_text_interface():
-    #Interface for Reverse Text
-    text = input("\nEnter the text: ").strip()
-    result = reverse_text(text)
-    print(f"\nReversed Text: {result}")
-
-
-def ascii_shift_interface(mode: str):
-    #Interface for ASCII Shift
-    text = input("\nEnter the text: ").strip()
-
-    while True:
-        try:
-            shift_val = int(input("Enter ASCII shift value: ").strip())
-            break
-        except ValueError:
-            print("Invalid shift value. Please enter an integer.\n")
-
-    if mode == 'e':
-        result = ascii_shift(text, shift_val)
-        print(f"\nASCII Shifted Text: {result}")
-    else:
-        result = ascii_unshift(text, shift_val)
-        print(f"\nASCII Unshifted Text: {result}")
-
-
-def base64_interface(mode: str):
-    #Interface for Base64 Encoding
-    text = input("\nEnter the text: ").strip()
+    if cipher.params:
+        print(f"\nEnter keys for {cipher.label}:")
+    params = [read_param(param) for param in cipher.params]
 
     try:
-        if mode == 'e':
-            result = base64_encode(text)
-            print(f"\nBase64 Encoded Text: {result}")
+        if cipher.supports("steps"):
+            show_steps(cipher, direction, text, params)
         else:
-            result = base64_decode(text)
-            print(f"\nBase64 Decoded Text: {result}")
-    except Exception as e:
+            result = cipher.function(direction)(text, *params)
+            print(f"\n{'Encrypted' if direction == 'encrypt' else 'Decrypted'} Text: {result}")
+    except ValueError as e:
         print(f"Error: {e}")
 
 
-def multi_layer_interface(mode: str):
-    #Interface for Multi-Layer Encryption
-    text = input("\nEnter the text: ").strip()
-
-    print("\nEnter keys for all cipher layers:")
-
-    #Get Caesar key
-    while True:
-        try:
-            caesar_key = int(input("  Caesar key (shift amount): ").strip())
-            break
-        except ValueError:
-            print("  Invalid key. Please enter an integer.")
-
-    #Get Vigenère keyword
-    vig_key = input("  Vigenère keyword: ").strip()
-    if not vig_key:
-        print("Keyword cannot be empty. Using default 'KEY'.")
-        vig_key = "KEY"
-
-    #Get ASCII shift
-    while True:
-        try:
-            ascii_key = int(input("  ASCII shift value: ").strip())
-            break
-        except ValueError:
-            print("Invalid shift value. Please enter an integer.")
+def show_steps(cipher: registry.Cipher, direction: str, text: str, params: list):
+    #Runs a multi-layer cipher step by step, previewing each intermediate
+    if direction == "encrypt":
+        title, label, done = "ENCRYPTION", "Original Text", "ENCRYPTED"
+    else:
+        title, label, done = "DECRYPTION", "Encrypted Text", "DECRYPTED"
 
-    #Perform encryption or decryption
-    try:
-        if mode == 'e':
-            result = multi_encrypt(text, caesar_key, vig_key, ascii_key, verbose=True)
-        else:
-            result = multi_decrypt(text, caesar_key, vig_key, ascii_key, verbose=True)
-    except Exception as e:
-        print(f"Error during operation: {e}")
+    print("\n" + "=" * 60)
+    print(f"MULTI-LAYER {title} PROCESS")
+    print("=" * 60)
+    print(f"{label}: {text[:PREVIEW_CHARS]}{'...' if len(text) > PREVIEW_CHARS else ''}")
+    print("-" * 60)
+
+    result = text
+    for step in cipher.steps(direction)(text, *params):
+        result = step.output.text
+        print(f"Step {step.step} - {step.label}:")
+        print(f"  Result: {step.output.preview(PREVIEW_CHARS)}")
+    print("=" * 60)
+    print(f"FINAL {done} TEXT: {result}")
+    print("=" * 60 + "\n")
 
 
 def main():
@@ -171,20 +142,9 @@ def main():
         #Get cipher method
         method = get_cipher_method()
 
-        #Execute appropriate interface
+        #Execute the chosen cipher
         try:
-            if method == 1:
-                caesar_cipher_interface(mode)
-            elif method == 2:
-                vigenere_cipher_interface(mode)
-            elif method == 3:
-                reverse_text_interface()
-            elif method == 4:
-                ascii_shift_interface(mode)
-            elif method == 5:
-                base64_interface(mode)
-            elif method == 6:
-                multi_layer_interface(mode)
+            cipher_interface(method, mode)
         except KeyboardInterrupt:
             print("\n\nOperation cancelled by user.")
         except Exception as e:
@@ -200,5 +160,228 @@ def main():
         print()
 
 
+#COMMAND MODE
+
+def _option(param: registry.Param) -> str:
+    return "--" + param.name.replace("_", "-")
+
+
+def _run_stream(operation: str, direction: str, source, sink, params: tuple) -> int:
+    from streaming import _write_all
+
+    factory = registry.get(operation).stream(direction)
+    return _write_all(factory(source, *params, chunk_size=CHUNK_SIZE), sink)
+
+
+def _run_cached(operation: str, direction: str, path: str, output_path: str, params: tuple, cache):
+    #Serves a file's result from the cache, or streams it and stores the output
+    from streaming import _sha256_file
+
+    key = cache.key(operation, direction, params, _sha256_file(path, CHUNK_SIZE))
+    value = cache.get(key)
+    if value is not None:
+        with open(output_path, "wb") as output:
+            output.write(value)
+        cache.flush()  #A lookup deferred by a busy store must not be lost when the worker exits
+        return
+    _run_stream(operation, direction, path, output_path, params)
+    if os.path.getsize(output_path) <= cache.max_bytes:
+        with open(output_path, "rb") as output:
+            cache.put(key, output.read())
+    cache.flush()
+
+
+def _process_file(operation: str, direction: str, path: str, output_path, params: tuple,
+                  cache_path=None, cache_bytes=None) -> tuple:
+    #Worker side: returns (path, sha256 digest or None, error message or None)
+    try:
+        if output_path is None:
+            digest = b"".join(registry.get(operation).stream(direction)(path, chunk_size=CHUNK_SIZE))
+            return path, digest.decode("ascii"), None
+        if cache_path is not None:
+            from resultcache import open_cache
+
+            _run_cached(operation, direction, path, output_path, params, open_cache(cache_path, cache_bytes))
+        else:
+            _run_stream(operation, direction, path, output_path, params)
+        return path, None, None
+    except Exception as e:
+        if output_path:
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+        return path, None, str(e) or type(e).__name__
+
+
+def _process_file_parallel(operation: str, direction: str, path: str, output_path, params: tuple,
+                           workers: int) -> tuple:
+    #One file split across worker processes (parallel.py); same result tuple as _process_file
+    from parallel import run_parallel_file
+
+    try:
+        run_parallel_file(operation, direction, path, output_path, *params, workers=workers)
+        return path, None, None
+    except Exception as e:
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+        return path, None, str(e) or type(e).__name__
+
+
+def _process_file_in_place(operation: str, direction: str, path: str, params: tuple) -> tuple:
+    #Rewrites one ASCII file through mmap (mmapfile.py); same result tuple as _process_file
+    try:
+        registry.get(operation).backend("mmap", direction)(path, *params)
+        return path, None, None
+    except Exception as e:
+        return path, None, str(e) or type(e).__name__
+
+
+def _output_path(path: str, args) -> str:
+    if args.output:
+        return args.output
+    name = os.path.basename(path) + args.suffix
+    return os.path.join(args.output_dir, name) if args.output_dir else path + args.suffix
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="terminal_app.py",
+        description="NovaCrypt command mode. Run without arguments for the interactive menu."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, cipher in registry.CIPHERS.items():
+        command = commands.add_parser(name, help=cipher.label)
+        for param in cipher.params:
+            command.add_argument(_option(param), dest=param.name, type=param.type, required=True, help=param.label)
+        if cipher.supports("decrypt"):
+            command.add_argument("-d", "--decrypt", action="store_true", help="decrypt instead of encrypt")
+            command.add_argument("-o", "--output", help="output file (single input only; default stdout for stdin)")
+            command.add_argument("--suffix", help="suffix for per-file outputs (default .enc / .dec)")
+            command.add_argument("--output-dir", help="directory for per-file outputs")
+            command.add_argument("--cache", action="store_true", help="reuse results from a persistent store")
+            command.add_argument("--cache-file", help="cache store to use (implies --cache; default ~/.cache/novacrypt)")
+            command.add_argument("--cache-mb", type=float, help="cache size limit in MB (default 256)")
+        if cipher.supports("mmap"):
+            command.add_argument("--in-place", action="store_true",
+                                 help="rewrite ASCII files where they lie through mmap (no second copy)")
+        command.add_argument("files", nargs="*", help="input files (default or '-': stdin)")
+        command.add_argument("-j", "--jobs", type=int, default=1, help="worker processes for multiple files")
+
+    return parser
+
+
+def run_command(argv) -> int:
+    #Non-interactive entry point; returns the exit status
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    operation = args.command
+    cipher = registry.get(operation)
+    hashing = not cipher.supports("decrypt")
+    direction = "decrypt" if getattr(args, "decrypt", False) else "encrypt"
+    params = tuple(getattr(args, param.name) for param in cipher.params)
+
+    #Bad keys are usage errors, not per-file failures
+    try:
+        cipher.encrypt("", *params)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+    cache = None
+    if getattr(args, "cache", False) or getattr(args, "cache_file", None):
+        if getattr(args, "in_place", False):
+            parser.error("--cache needs an output file; it cannot be combined with --in-place.")
+        from resultcache import open_cache
+
+        cache_bytes = int(args.cache_mb * 1024 * 1024) if args.cache_mb else None
+        try:
+            cache = open_cache(args.cache_file, cache_bytes)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot open cache: {e}")
+        before = cache.stats()
+
+    files = args.files or ["-"]
+    if getattr(args, "in_place", False):
+        if "-" in files:
+            parser.error("--in-place needs file arguments, not stdin.")
+        if args.output or args.output_dir:
+            parser.error("--in-place rewrites the input files; drop --output / --output-dir.")
+        return _report((_process_file_in_place(operation, direction, path, params) for path in files), 0)
+    if not hashing:
+        if args.output and len(files) > 1:
+            parser.error("--output takes a single input; use --suffix or --output-dir for many files.")
+        if args.suffix is None:
+            args.suffix = ".dec" if args.decrypt else ".enc"
+
+    status = 0
+    try:
+        #stdin streams straight to stdout (or --output)
+        if "-" in files:
+            files = [path for path in files if path != "-"]
+            try:
+                if hashing:
+                    digest = b"".join(cipher.stream(direction)(sys.stdin.buffer, chunk_size=CHUNK_SIZE))
+                    print(f"{digest.decode('ascii')}  -")
+                else:
+                    _run_stream(operation, direction, sys.stdin.buffer, args.output or sys.stdout.buffer, params)
+                    sys.stdout.flush()
+            except (ValueError, UnicodeDecodeError) as e:
+                print(f"error: -: {e}", file=sys.stderr)
+                status = 1
+
+        outputs = [None if hashing else _output_path(path, args) for path in files]
+        tasks = [(operation, direction, path, output, params) for path, output in zip(files, outputs)]
+        if cache is not None:
+            tasks = [task + (cache.path, cache.max_bytes) for task in tasks]
+        if args.jobs > 1 and len(tasks) == 1 and cipher.supports("parallel") and cache is None:
+            status = _report([_process_file_parallel(*tasks[0], args.jobs)], status)
+        elif args.jobs > 1 and len(tasks) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(args.jobs, len(tasks))) as pool:
+                results = pool.map(_process_file, *zip(*tasks))
+                status = _report(results, status)
+        else:
+            status = _report((_process_file(*task) for task in tasks), status)
+    except BrokenPipeError:
+        #Downstream closed the pipe (e.g. `| head`); stop quietly
+        sys.stdout = open(os.devnull, "w")
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    if cache is not None:
+        _report_cache(before, cache.stats())
+    return status
+
+
+def _report_cache(before, after):
+    #Hit rate and bytes saved by this run (the store's counters are shared, so diff them)
+    hits = after.hits - before.hits
+    lookups = hits + after.misses - before.misses
+    saved = after.bytes_saved - before.bytes_saved
+    rate = hits / lookups if lookups else 0.0
+    print(f"cache: {hits}/{lookups} hits ({rate:.0%}), {saved / 1024 / 1024:.2f} MB saved; "
+          f"{after.entries} entries, {after.bytes / 1024 / 1024:.2f} of {after.max_bytes / 1024 / 1024:.2f} MB",
+          file=sys.stderr)
+
+
+def _report(results, status: int) -> int:
+    #Prints digests and errors as results arrive, in input order
+    for path, digest, error in results:
+        if error:
+            print(f"error: {path}: {error}", file=sys.stderr)
+            status = 1
+        elif digest:
+            print(f"{digest}  {path}", flush=True)
+    return status
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_command(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+tracing.py - Per-Layer Instrumentation
+multi_encrypt / multi_decrypt accept a `tracer`: any callable that receives one
+LayerEvent per layer with its wall time, CPU time, input/output size and
+parameters. Nothing about the payload itself is reported.
+
+When no tracer is passed the pipeline skips the timing calls entirely, so the
+disabled cost is one `is None` check per layer.
+
+MetricsSink is a ready-made tracer that aggregates events into per-layer
+counters and latency histograms:
+
+    sink = MetricsSink()
+    multi_encrypt(text, 3, "KEY", 5, verbose=False, tracer=sink)
+    print(sink.summary())
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
+
+#One layer of one multi-layer run. operation is "encrypt" or "decrypt", step is 1-5,
+#times are in seconds and sizes in characters.
+LayerEvent = namedtuple("LayerEvent", [
+    "operation", "step", "layer", "params",
+    "wall_time", "cpu_time", "input_size", "output_size",
+])
+
+
+def run_layer(tracer, operation: str, step: int, layer: str, params: dict, function, data, *args):
+    #Runs function(data, *args), reporting a LayerEvent to tracer when one is set
+    if tracer is None:
+        return function(data, *args)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = function(data, *args)
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    tracer(LayerEvent(operation, step, layer, params, wall_time, cpu_time, len(data), len(result)))
+    return result
+
+
+#AGGREGATION
+
+class Histogram:
+    #Fixed exponential buckets (1 µs to ~1 hour, doubling) with count, sum, min and max
+
+    BOUNDS = tuple(1e-6 * 2 ** i for i in range(32))
+
+    def __init__(self):
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, value: float):
+        self.buckets[bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction: float) -> float:
+        #Upper bound of the bucket holding the given fraction of samples (capped at max)
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min(self.BOUNDS[index], self.max) if index < len(self.BOUNDS) else self.max
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+        }
+
+
+class MetricsSink:
+    #Tracer that aggregates LayerEvents per (operation, layer)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, event: LayerEvent):
+        key = f"{event.operation}.{event.layer}"
+        with self._lock:
+            self.counters[f"{key}.calls"] += 1
+            self.counters[f"{key}.input_chars"] += event.input_size
+            self.counters[f"{key}.output_chars"] += event.output_size
+            self.wall_times[key].record(event.wall_time)
+            self.cpu_times[key].record(event.cpu_time)
+
+    def reset(self):
+        #Clears all counters and histograms
+        with self._lock:
+            self.counters = defaultdict(int)
+            self.wall_times = defaultdict(Histogram)
+            self.cpu_times = defaultdict(Histogram)
+
+    def summary(self) -> dict:
+        #Plain-dict snapshot: counters plus wall/CPU histogram summaries per layer
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "wall_time": {key: histogram.summary() for key, histogram in self.wall_times.items()},
+                "cpu_time": {key: histogram.summary() for key, histogram in self.cpu_times.items()},
+            }
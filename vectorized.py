@@ -0,0 +1,164 @@
+"""
+vectorized.py - NumPy Backend for the Classical Ciphers
+Drop-in replacements for the substitution ciphers in ciphers.py that work on
+whole arrays instead of characters:
+1. Caesar Cipher
+2. Vigenère Cipher
+3. ASCII Shift Cipher
+
+ASCII text is viewed as a uint8 array, anything else as uint32 code points.
+Letters are shifted with masked modular arithmetic; for Vigenère the keyword
+phase of every letter comes from a cumulative sum over the alphabetic mask.
+
+Caesar and ASCII Shift on pure-ASCII text stay on str.translate, which is
+already a single C pass; the arrays pay off for Unicode text and Vigenère.
+
+NumPy is optional: when it is not installed (or the text is too short to be
+worth the array setup) every function falls back to the pure-Python version
+in ciphers.py. Results are identical either way.
+"""
+
+import ciphers
+from ciphers import key_schedule
+
+try:
+    import numpy as np
+except ImportError:  #Optional dependency
+    np = None
+
+HAVE_NUMPY = np is not None
+MIN_VECTOR_SIZE = 4096  #Shorter texts are faster on the pure-Python path
+
+
+#ARRAY CONVERSION
+
+def _to_array(text: str):
+    #Returns (array, is_ascii); uint8 for ASCII text, uint32 code points otherwise
+    if text.isascii():
+        return np.frombuffer(text.encode("ascii"), dtype=np.uint8), True
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4"), False
+
+
+def _to_text(array, is_ascii: bool) -> str:
+    if is_ascii:
+        return array.astype(np.uint8, copy=False).tobytes().decode("ascii")
+    return array.astype("<u4", copy=False).tobytes().decode("utf-32-le", "surrogatepass")
+
+
+def _letter_masks(codes, is_ascii: bool):
+    #Returns (alpha mask, base array) using the same rules as str.isalpha / str.isupper
+    upper = (codes >= ord('A')) & (codes <= ord('Z'))
+    lower = (codes >= ord('a')) & (codes <= ord('z'))
+
+    if not is_ascii:
+        #Non-ASCII letters: classify each distinct code point once in Python
+        wide = codes > 127
+        if wide.any():
+            distinct = np.unique(codes[wide])
+            alpha_points = [code for code in distinct.tolist() if chr(code).isalpha()]
+            upper_points = [code for code in alpha_points if chr(code).isupper()]
+            wide_upper = np.isin(codes, upper_points)
+            upper |= wide_upper
+            lower |= np.isin(codes, alpha_points) & ~wide_upper
+
+    alpha = upper | lower
+    base = np.where(upper, ord('A'), ord('a')).astype(np.int64)
+    return alpha, base
+
+
+def _shift_letters(codes, is_ascii: bool, shifts):
+    #Shifts alphabetic code points; `shifts` is a scalar or one shift per code point
+    alpha, base = _letter_masks(codes, is_ascii)
+    if not np.isscalar(shifts):
+        shifts = shifts[alpha]
+    letter_base = base[alpha]
+    result = codes.copy()
+    result[alpha] = (codes[alpha].astype(np.int64) - letter_base + shifts) % 26 + letter_base
+    return result
+
+
+def _byte_table(shift: int):
+    #256-entry lookup table for the uint8 path, built with the same masked arithmetic
+    return _shift_letters(np.arange(256, dtype=np.uint8), True, shift)
+
+
+def _keyword_phases(alpha, period: int):
+    #Keyword phase of every position from a cumulative sum over the alphabetic mask.
+    #Only meaningful where alpha is True.
+    phases = np.cumsum(alpha, dtype=np.int64)
+    phases -= 1
+    phases %= period
+    return phases
+
+
+#CAESAR CIPHER
+
+def caesar_encrypt(text: str, key: int) -> str:
+    #Vectorized Caesar Cipher encryption
+    #ASCII text already runs at memory speed through str.translate
+    if np is None or len(text) < MIN_VECTOR_SIZE or text.isascii():
+        return ciphers.caesar_encrypt(text, key)
+
+    codes, is_ascii = _to_array(text)
+    return _to_text(_shift_letters(codes, is_ascii, key % 26), is_ascii)
+
+
+def caesar_decrypt(text: str, key: int) -> str:
+    #Vectorized Caesar Cipher decryption
+    return caesar_encrypt(text, -key)
+
+
+#VIGENÈRE CIPHER
+
+def _vigenere(text: str, keyword: str, direction: int) -> str:
+    shifts = [direction * shift % 26 for shift in key_schedule(keyword).shifts]
+    codes, is_ascii = _to_array(text)
+
+    if is_ascii:
+        #One lookup table per phase; non-letters map to themselves in every row
+        tables = np.stack([_byte_table(shift) for shift in shifts])
+        alpha, _ = _letter_masks(codes, is_ascii)
+        return _to_text(tables[_keyword_phases(alpha, len(shifts)), codes], is_ascii)
+
+    alpha, _ = _letter_masks(codes, is_ascii)
+    vector = np.asarray(shifts, dtype=np.int64)[_keyword_phases(alpha, len(shifts))]
+    return _to_text(_shift_letters(codes, is_ascii, vector), is_ascii)
+
+
+def vigenere_encrypt(text: str, keyword: str) -> str:
+    #Vectorized Vigenère Cipher encryption
+    if np is None or len(text) < MIN_VECTOR_SIZE:
+        return ciphers.vigenere_encrypt(text, keyword)
+    return _vigenere(text, keyword, 1)
+
+
+def vigenere_decrypt(text: str, keyword: str) -> str:
+    #Vectorized Vigenère Cipher decryption
+    if np is None or len(text) < MIN_VECTOR_SIZE:
+        return ciphers.vigenere_decrypt(text, keyword)
+    return _vigenere(text, keyword, -1)
+
+
+#ASCII SHIFT (Safe Printable Characters)
+
+def _printable_shift(codes, shift_val: int):
+    #Shifts code points in the printable range 32-126, everything else is kept
+    printable = (codes >= 32) & (codes <= 126)
+    result = codes.copy()
+    result[printable] = 32 + (codes[printable].astype(np.int64) - 32 + shift_val % 95) % 95
+    return result
+
+
+def ascii_shift(text: str, shift_val: int) -> str:
+    #Vectorized shift of printable ASCII characters (32-126)
+    #ASCII text already runs at memory speed through str.translate
+    if np is None or len(text) < MIN_VECTOR_SIZE or text.isascii():
+        return ciphers.ascii_shift(text, shift_val)
+
+    codes, is_ascii = _to_array(text)
+    return _to_text(_printable_shift(codes, shift_val), is_ascii)
+
+
+def ascii_unshift(text: str, shift_val: int) -> str:
+    #Reverses the vectorized ASCII shift
+    return ascii_shift(text, -shift_val)